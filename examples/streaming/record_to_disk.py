@@ -0,0 +1,102 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Record a stream to disk with StreamingSession.record — PicoScope 6000E / 3000E / 5000E / 5000D
+
+Description:
+  The library version of streaming_to_disk.py: StreamingSession.record runs
+  the acquisition loop on this thread and a background writer thread appends
+  each chunk to one raw binary file per channel, then writes a JSON sidecar
+  with the actual interval, dtype, channel ranges and probe scale.
+
+  A monitor thread prints the live throughput counters while recording.
+
+Key Concepts:
+  - zero_copy=True: the writer works straight from the driver buffers, with
+    no per-chunk copy. A slow disk holds back buffer rotation (reported as
+    session.lease_stalls) rather than costing memory.
+  - Backpressure: with block=False (the default) a full write queue drops
+    chunks; they are counted and listed as gaps in the sidecar. block=True
+    waits for the disk instead.
+  - request_stop() ends the recording early from any other thread.
+
+Output:
+  capture_A.bin          — raw INT8 samples of channel A (np.fromfile)
+  capture_index.bin      — chunk index (stream position, arrival time, flags)
+  capture_metadata.json  — JSON header; open the set with psdk.CaptureFile
+
+Requirements:
+  - Any streaming-capable PicoScope (6000E, 3000E, 5000E, 5000D)
+  - NVMe SSD recommended above ~300 MS/s
+  - Python packages: (pip install) numpy pypicosdk
+"""
+import threading
+import pypicosdk as psdk
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SAMPLE_INTERVAL_NS = 3.2            # ~300 MS/s on a 6000E
+DATA_TYPE = psdk.DATA_TYPE.INT8_T   # 1 byte per sample
+SAMPLES_PER_BUFFER = 10_000_000
+CAPTURE_DURATION_S = 4
+OUTPUT_FILE = "capture.bin"
+
+
+# ============================================================================
+# HARDWARE SETUP
+# ============================================================================
+
+scope = psdk.ps6000a()
+scope.open_unit()
+scope.set_channel(channel=psdk.CHANNEL.A, range=psdk.RANGE.V2)
+
+stream = psdk.StreamingSession(
+    scope,
+    sample_interval=SAMPLE_INTERVAL_NS,
+    time_units=psdk.TIME_UNIT.NS,
+    datatype=DATA_TYPE,
+    samples_per_buffer=SAMPLES_PER_BUFFER,
+    poll_interval=0.0005,
+    zero_copy=True,
+)
+
+
+# ============================================================================
+# LIVE COUNTERS
+# ============================================================================
+
+def monitor():
+    """Print the recorder's counters once a second while it runs."""
+    while not done.wait(1.0):
+        recording = stream.recording
+        if recording is None:
+            continue
+        stats = recording.stats()
+        print(f"[RATE] {stats['write_mb_per_s']:.1f} MB/s | "
+              f"written: {stats['samples_written']:,}  queue: {stats['queue_depth']}  "
+              f"dropped: {stats['dropped_samples']:,}  stalls: {stream.lease_stalls}")
+
+
+done = threading.Event()
+threading.Thread(target=monitor, daemon=True).start()
+
+try:
+    # Ctrl+C interrupts the loop; record() still stops the scope, drains the
+    # queue and writes the sidecar before the exception propagates.
+    stream.record(OUTPUT_FILE, duration=CAPTURE_DURATION_S)
+except KeyboardInterrupt:
+    print("\nCapture interrupted by user.")
+finally:
+    done.set()
+
+scope.close_unit()
+
+print(stream.recording.stats())
+print(f"Metadata: {stream.recording.metadata_path}")
+
+capture = psdk.CaptureFile(OUTPUT_FILE)
+first_ms = capture.window(0, 1e-3)['A']  # memory-mapped; reads only these pages
+print(f"{len(capture):,} samples on disk; first ms: {first_ms.size:,} samples")
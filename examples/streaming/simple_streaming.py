@@ -22,10 +22,11 @@ Key Concepts:
     the new samples per channel, safe to keep or hand to another thread.
   - Chunks arrive in the capture's native dtype (no upcasting) and carry
     over-range, trigger and auto-stop flags.
-  - Threaded acquisition: a background thread iterates the session and keeps
-    a rolling window of the newest samples; the main thread runs Qt and a
-    QTimer refreshes the plot. Chunk copies make this hand-off safe, and
-    request_stop() ends the loop safely from the GUI thread.
+  - Threaded acquisition: a background thread iterates the session, which
+    keeps a rolling history of the newest samples (history=N); the main
+    thread runs Qt and a QTimer draws stream.latest(), a consistent snapshot
+    taken without locking. request_stop() ends the loop safely from the GUI
+    thread.
   - The session surfaces capability walls instead of hiding them: a
     configuration the connected driver cannot express raises PicoSDKException
     at construction rather than degrading silently.
@@ -82,11 +83,16 @@ scope.set_siggen(frequency=1e3, pk2pk=1.5, wave_type=psdk.WAVEFORM.SINE)
 # STREAMING SESSION
 # ============================================================================
 
+# The rolling history is sized before the driver rounds the interval, so
+# give it headroom over the window at the requested rate.
+requested_window = int(PLOT_WINDOW_SECONDS / (SAMPLE_INTERVAL / TIME_UNITS))
+
 stream = psdk.StreamingSession(
     scope,
     sample_interval=SAMPLE_INTERVAL,
     time_units=TIME_UNITS,
     datatype=DATA_TYPE,
+    history=2 * max(requested_window, 2),
 )
 
 # Start now, on the main thread before the acquisition thread exists, so the
@@ -107,35 +113,28 @@ print(f"Plot window            : {window_samples:,} samples "
 # SHARED STATE (acquisition thread -> plot timer)
 # ============================================================================
 
-# The acquisition thread REPLACES `history` with a new array each chunk
-# (never mutates it in place), so the plot timer can safely take the
-# reference under the lock and use it after release.
-history = np.empty(0, dtype=NUMPY_DTYPE)
-data_lock = threading.Lock()
-
+# The session's rolling history is the only shared sample state: the
+# acquisition thread updates it inside the iterator and the plot timer reads
+# it with stream.latest(), so no lock or hand-off array is needed here.
 total_samples = 0
 start_time = time.perf_counter()
 
 
 def acquisition_thread():
-    """Iterate the session, keeping the newest window_samples for display.
+    """Iterate the session; it keeps the newest samples for display.
 
     The loop ends when the main thread calls stream.request_stop(): the
     iterator notices the flag within one poll and raises StopIteration.
     The `with` block then guarantees the driver stop runs here, so every
     driver call after start() stays on this one thread.
     """
-    global history, total_samples
+    global total_samples
 
     try:
         with stream:
             last_print = start_time
             for chunk in stream:
-                samples = chunk.data[psdk.CHANNEL.A]
-                total_samples += len(samples)
-
-                with data_lock:
-                    history = np.concatenate((history, samples))[-window_samples:]
+                total_samples += len(chunk.data[psdk.CHANNEL.A])
 
                 now = time.perf_counter()
                 if now - last_print >= 1.0:
@@ -181,9 +180,7 @@ x_full = np.arange(window_samples) * actual_interval_s * 1e3
 
 def update_plot():
     """QTimer callback on the main thread: draw the latest rolling window."""
-    with data_lock:
-        y_data = history   # safe: acquisition replaces, never mutates
-
+    y_data = stream.latest(window_samples)[psdk.CHANNEL.A]
     if len(y_data):
         curve.setData(x_full[:len(y_data)], y_data)
 
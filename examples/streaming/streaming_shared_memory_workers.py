@@ -0,0 +1,112 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Processing a stream in worker processes — PicoScope 6000E / 3000E / 5000E / 5000D
+
+Description:
+  Streams Channel A with StreamingSession(shared_memory=...) and analyses
+  it in N_WORKERS separate processes. The session publishes every chunk
+  into a shared memory ring; each worker attaches a SharedStreamReader and
+  computes the RMS of the chunks it owns, reading the samples in place.
+
+  Analysis in the acquisition process competes with the polling loop for
+  the GIL and can starve the driver of buffers (status 407). Here the
+  acquisition process only polls, and the analysis scales across cores.
+
+Key Concepts:
+  - session.shared.spec is a small picklable dict; pass it to the workers.
+  - Nothing is pickled per chunk: workers map the same memory the session
+    writes and get chunk descriptors (sequence, start index, ring offset).
+  - The writer never waits. Size SHARED_SAMPLES so workers stay within one
+    ring of the writer; reader.missed counts chunks a worker lost and
+    chunk.valid() says whether a chunk survived its processing.
+
+Requirements:
+  - Any streaming-capable PicoScope (6000E, 3000E, 5000E, 5000D)
+  - Python packages: (pip install) numpy pypicosdk
+
+Setup:
+  - Connect a signal to Channel A (or use the AWG below)
+"""
+import multiprocessing
+
+import numpy as np
+import pypicosdk as psdk
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SAMPLE_INTERVAL = 20            # requested interval between samples
+TIME_UNITS = psdk.TIME_UNIT.NS  # 20 ns -> 50 MS/s (driver rounds to nearest)
+SAMPLES_PER_BUFFER = 1_000_000
+SHARED_SAMPLES = 20_000_000     # ~0.4 s of data held for the workers
+CAPTURE_SAMPLES = 500_000_000   # ~10 s
+N_WORKERS = 4
+
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+def analyse(spec, worker, results):
+    """Compute the RMS of every N_WORKERS-th chunk, in place."""
+    squares, samples = 0.0, 0
+    with psdk.SharedStreamReader(spec) as reader:
+        for chunk in reader.chunks():
+            if chunk.sequence % N_WORKERS != worker:
+                continue
+            data = chunk.data[psdk.CHANNEL.A].astype(np.float64)
+            if chunk.valid():
+                squares += np.dot(data, data)
+                samples += len(data)
+        results.put((worker, samples, squares, reader.missed))
+
+
+# ============================================================================
+# ACQUISITION
+# ============================================================================
+
+if __name__ == '__main__':
+    scope = psdk.ps6000a()
+    scope.open_unit()
+    print(f"Connected to PicoScope: {scope.get_unit_serial()}")
+    scope.set_channel(channel=psdk.CHANNEL.A, range=psdk.RANGE.V1)
+    scope.set_siggen(frequency=1e3, pk2pk=1.5, wave_type=psdk.WAVEFORM.SINE)
+
+    stream = psdk.StreamingSession(
+        scope,
+        sample_interval=SAMPLE_INTERVAL,
+        time_units=TIME_UNITS,
+        channels=[psdk.CHANNEL.A],
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        post_trigger_samples=CAPTURE_SAMPLES,
+        auto_stop=True,
+        shared_memory=SHARED_SAMPLES,
+    )
+
+    # Spawned workers only import this module, not the scope setup above
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    workers = [context.Process(target=analyse, args=(stream.shared.spec, i, results))
+               for i in range(N_WORKERS)]
+    for worker in workers:
+        worker.start()
+
+    try:
+        with stream:
+            for chunk in stream:
+                pass
+    finally:
+        scope.close_unit()
+
+    for _ in workers:
+        worker_id, samples, squares, missed = results.get()
+        rms = np.sqrt(squares / samples) if samples else float('nan')
+        print(f"Worker {worker_id}: {samples:,} samples, RMS {rms:.1f} ADC counts, "
+              f"{missed} chunks missed")
+    for worker in workers:
+        worker.join()
+    stream.shared.close()
+    print(f"Streamed {stream.total_samples[psdk.CHANNEL.A]:,} samples")
@@ -0,0 +1,98 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Pre-trigger window capture while streaming — PicoScope 6000E / 3000E / 5000E / 5000D
+
+Description:
+  Streams Channel A with a hardware trigger and captures one contiguous
+  window of PRE_TRIGGER_SAMPLES before and POST_TRIGGER_SAMPLES after the
+  trigger using StreamingSession.trigger_windows(). The window is saved to
+  a .npy file.
+
+  Compare with streaming_triggered_to_disk.py, which does the same by hand
+  with a rolling deque of chunks and writes an unbounded post-trigger
+  capture to disk. trigger_windows() keeps the newest samples in a
+  preallocated ring, so the pre-trigger part is exact to the sample, and
+  resolves the driver's trigger report to a stream sample index on every
+  device.
+
+Key Concepts:
+  - The window is held in memory: use it for windows that fit in RAM and
+    streaming_triggered_to_disk.py for very long post-trigger captures.
+  - window.trigger_offset is the trigger's position in window.data; it
+    equals PRE_TRIGGER_SAMPLES unless the trigger fired before that many
+    samples had streamed.
+  - window.trigger_index is the trigger's position in the whole stream.
+  - The driver's trigger index reference frame is not verified on every
+    device: check the trigger lands at trigger_offset before relying on
+    the alignment to the sample.
+
+Requirements:
+  - Any streaming-capable PicoScope (6000E, 3000E, 5000E, 5000D)
+  - Python packages: (pip install) numpy pypicosdk
+
+Setup:
+  - Connect a signal to Channel A (or use the AWG below)
+  - Set TRIGGER_THRESHOLD_MV to a level your signal crosses
+"""
+import numpy as np
+import pypicosdk as psdk
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SAMPLE_INTERVAL = 100           # requested interval between samples
+TIME_UNITS = psdk.TIME_UNIT.NS  # 100 ns -> 10 MS/s (driver rounds to nearest)
+
+TRIGGER_THRESHOLD_MV = 200
+PRE_TRIGGER_SAMPLES = 100_000
+POST_TRIGGER_SAMPLES = 400_000
+
+OUTPUT_FILE = "trigger_window.npy"
+
+
+# ============================================================================
+# HARDWARE SETUP
+# ============================================================================
+
+scope = psdk.ps6000a()
+scope.open_unit()
+print(f"Connected to PicoScope: {scope.get_unit_serial()}")
+
+scope.set_channel(channel=psdk.CHANNEL.A, range=psdk.RANGE.V1)
+scope.set_siggen(frequency=1e3, pk2pk=1.5, wave_type=psdk.WAVEFORM.SINE)
+scope.set_simple_trigger(channel=psdk.CHANNEL.A, threshold=TRIGGER_THRESHOLD_MV)
+
+
+# ============================================================================
+# CAPTURE
+# ============================================================================
+
+# The driver's own pre-trigger count only needs to cover the window; the
+# session holds the pre-trigger samples itself.
+stream = psdk.StreamingSession(
+    scope,
+    sample_interval=SAMPLE_INTERVAL,
+    time_units=TIME_UNITS,
+    channels=[psdk.CHANNEL.A],
+    pre_trigger_samples=PRE_TRIGGER_SAMPLES,
+)
+
+print(f"Waiting for trigger at {TRIGGER_THRESHOLD_MV} mV... (Ctrl+C to abort)")
+try:
+    window = next(stream.trigger_windows(PRE_TRIGGER_SAMPLES, POST_TRIGGER_SAMPLES))
+except KeyboardInterrupt:
+    window = None
+    print("\nCapture aborted by user.")
+finally:
+    stream.stop()
+    scope.close_unit()
+
+if window is not None:
+    data = window.data[psdk.CHANNEL.A]
+    np.save(OUTPUT_FILE, data)
+    print(f"Trigger at stream sample {window.trigger_index:,}")
+    print(f"Window : {window.n_samples:,} samples, trigger at offset "
+          f"{window.trigger_offset:,}  -> {OUTPUT_FILE}")
@@ -13,3 +13,4 @@ class BaseDataClass:
     last_pre_trig: float = 50
     last_datatype: cst.DATA_TYPE = cst.DATA_TYPE.INT16_T
     last_buffer_size: int = None
+    last_memory_segments: int | None = None
@@ -8,7 +8,7 @@ except ImportError:
 from warnings import warn
 from .._exceptions import NoArgumentsNeededWarning, PowerSourceWarning
 
-import queue
+from collections import deque
 
 import numpy as np
 import numpy.ctypeslib as npc
@@ -25,13 +25,29 @@ from .._classes._channel_class import ChannelClass
 from ..shared._ps5000a_ps6000a import Sharedps5000aPs6000a
 
 
+# Columns of the streaming callback records, in StreamingReady argument order
+_N_SAMPLES, _START, _OVERFLOW, _TRIGGER_AT, _TRIGGERED, _AUTO_STOP = range(6)
+# Callback records held between two polls; the driver fires one callback per
+# contiguous block it copies, so a handful per poll is typical.
+_CALLBACK_RECORDS = 64
+
+
 class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
     """PicoScope 5000 (A) API specific functions"""
 
     @override
     def __init__(self, *args, **kwargs):
         self.ac_adaptor = True
-        self._streaming_queue = queue.Queue()
+        # StreamingReady callbacks of the current poll, written in place so
+        # the callback allocates nothing; drained by every poll.
+        self._callback_records = np.zeros((_CALLBACK_RECORDS, 6), dtype=np.int64)
+        self._callback_count = 0
+        self._callback_overruns = 0
+        # Merged results of an earlier poll not yet returned
+        self._pending_streaming = deque()
+        # Overview buffer index where the next streamed sample is expected
+        self._next_start_index = None
+        self._overview_size = None
         super().__init__("ps5000a", *args, **kwargs)
 
     @override
@@ -41,6 +57,7 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         resolution: str | cst.resolution_literal | cst.RESOLUTION = cst.RESOLUTION.BIT_8
     ) -> None:
         resolution = _get_literal(resolution, cst.resolution_map)
+        self._resolve_functions()
         if serial_number is not None:
             serial_number = serial_number.encode()
         status = self._call_attr_function(
@@ -751,8 +768,10 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         to_segment_index: int,
         ratio: int = 0,
         ratio_mode: cst.RATIO_MODE = cst.RATIO_MODE.NONE,
+        wait_for_ready: bool = True,
+        timeout: float | None = None,
         **_,
-    ) -> tuple[int, list[list[str]]]:
+    ) -> tuple[int, np.ndarray]:
         """Retrieve data from multiple memory segments.
 
         Args:
@@ -762,18 +781,23 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
                 less than ``from_segment_index`` the driver wraps around.
             ratio: Downsampling ratio to apply before copying.
             ratio_mode: Downsampling mode from :class:`RATIO_MODE`.
+            wait_for_ready (bool, optional): Whether to wait for the device to be ready.
+            timeout (float | None, optional): Maximum seconds to wait for the device
+                to be ready. Defaults to None (wait indefinitely).
 
         Returns:
-            tuple[int, list[list[str]]]: ``(samples, overflow)list)`` where ``samples`` is the
-            number of samples copied and ``overflow`` is list of captures with where
-            channnels have exceeded their voltage range.
+            tuple[int, np.ndarray]: ``(samples, overflow)`` where ``samples`` is the
+            number of samples copied and ``overflow`` is a bool array of shape
+            ``(segments, 8)``, True where a channel exceeded its voltage range in a
+            segment.
         """
         if ratio_mode == cst.RATIO_MODE.RAW:
             ratio_mode = cst.RATIO_MODE.NONE
 
-        self.is_ready()
+        if wait_for_ready:
+            self.is_ready(timeout)
         no_samples = ctypes.c_uint32(samples)
-        overflow = np.zeros(to_segment_index + 1, dtype=np.int16)
+        overflow = self._bulk_overflow_array(from_segment_index, to_segment_index)
         self._call_attr_function(
             "GetValuesBulk",
             self.handle,
@@ -784,11 +808,7 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
             ratio_mode,
             npc.as_ctypes(overflow),
         )
-        overflow_list = []
-        for i in overflow:
-            self.over_range = i
-            overflow_list.append(self.is_over_range())
-        return no_samples.value, overflow_list
+        return no_samples.value, self._decode_bulk_overflow(overflow)
 
     def get_channel_combinations(
         self,
@@ -954,20 +974,33 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
 
     @override
     def get_streaming_latest_values(self, *args, **kwargs) -> dict:
+        """Poll the driver and return every sample it delivered, merged.
+
+        The driver may fire several StreamingReady callbacks during one
+        call. Callbacks whose start index continues the previous block are
+        merged into a single result; ``'triggered at'`` is rebased onto the
+        merged block and the over-range and auto-stop flags are combined.
+        A block that restarts at index 0 of the overview buffer cannot be
+        merged, so it is returned by the next call without polling the
+        driver again.
+
+        Warns:
+            UserWarning: If a callback's start index shows samples were
+                missed, or more callbacks fired than could be recorded.
+        """
         if len(args) > 0 or len(kwargs) > 0:
             warn("ps5000a get_streaming_latest_values() takes no arguments", 
                 NoArgumentsNeededWarning)
+        if self._pending_streaming:
+            return self._pending_streaming.popleft()
         status = self._call_attr_function(
             "GetStreamingLatestValues",
             self.handle,
             self._streaming_callback_pointer,
             None,
         )
-        try:
-            info = self._streaming_queue.get_nowait()
-            info['status'] = status
-            return info
-        except queue.Empty:
+        results = self._drain_streaming_callbacks(status)
+        if not results:
             # No callback fired this poll. Return the real driver status
             # (e.g. PICO_BUSY) rather than fabricating success.
             return {
@@ -980,6 +1013,52 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
             'triggered?': 0,
             'auto stopped?': 0,
         }
+        self._pending_streaming.extend(results[1:])
+        return results[0]
+
+    def _drain_streaming_callbacks(self, status: int) -> list:
+        """Merge the callback records of one poll into contiguous results."""
+        records = self._callback_records[:self._callback_count].tolist()
+        self._callback_count = 0
+        if self._callback_overruns:
+            warn(f"{self._callback_overruns} ps5000a streaming callbacks could not be "
+                 "recorded in one poll; samples were lost. Poll more often.")
+            self._callback_overruns = 0
+        results = []
+        info = None
+        for n, start, overflow, trigger_at, triggered, auto_stop in records:
+            expected = self._next_start_index
+            if n > 0 and expected is not None and start != expected:
+                # Blocks restart at 0 when the overview buffer wraps
+                wrapped = start == 0 and self._overview_size in (None, expected)
+                if not wrapped:
+                    warn(f"ps5000a streaming callback started at index {start}, expected "
+                         f"{expected}; samples were lost.")
+            if info is None or (n > 0 and info['no of samples'] > 0
+                                and start != info['start index'] + info['no of samples']):
+                info = {
+                    'status': status,
+                    'no of samples': 0,
+                    'Buffer index': 0,
+                    'start index': start,
+                    'overflowed?': 0,
+                    'triggered at': 0,
+                    'triggered?': 0,
+                    'auto stopped?': 0,
+                }
+                results.append(info)
+            elif info['no of samples'] == 0 and n > 0:
+                # Flag-only callbacks do not fix the start of a block
+                info['start index'] = start
+            if triggered and not info['triggered?']:
+                info['triggered?'] = triggered
+                info['triggered at'] = info['no of samples'] + trigger_at
+            info['no of samples'] += n
+            info['overflowed?'] |= overflow
+            info['auto stopped?'] |= auto_stop
+            if n > 0:
+                self._next_start_index = start + n
+        return results
 
     @override
     def get_streaming_latest_values_multi(self, requests) -> dict:
@@ -1009,11 +1088,11 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         # Setup the streaming callback
         self._setup_streaming_callback()
         # Discard poll results left over from a previous run
-        while True:
-            try:
-                self._streaming_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._callback_count = 0
+        self._callback_overruns = 0
+        self._pending_streaming.clear()
+        self._next_start_index = None
+        self._overview_size = overview_buffer_size
         # Run the streaming
         return super().run_streaming(
             sample_interval,
@@ -1044,20 +1123,25 @@ class ps5000a(PicoScopeBase, Sharedps5000aPs6000a):  # pylint: disable=C0103
         auto_stop: ctypes.c_int16, 
         param: ctypes.c_void_p
     ) -> None:
-        # 'Buffer index' is always 0: the ps5000a streams into a single
-        # persistent overview buffer, so there is no driver-side buffer
-        # rotation. A constant int keeps the cross-driver poll-dict contract
-        # (e.g. `info['Buffer index'] % 2`) working without spurious swaps.
-        self._streaming_queue.put({
-            'status': None,
-            'no of samples': no_samples,
-            'Buffer index': 0,
-            'start index': start_index,
-            'overflowed?': overflow,
-            'triggered at': trigger_at,
-            'triggered?': triggered,
-            'auto stopped?': auto_stop,
-        })
+        # Runs inside GetStreamingLatestValues with the GIL held, so it only
+        # fills a preallocated record; the poll merges the records.
+        records = self._callback_records
+        i = self._callback_count
+        if i == _CALLBACK_RECORDS:
+            # Full: fold a continuing block into the last record
+            last = records[i - 1]
+            if no_samples and start_index != last[_START] + last[_N_SAMPLES]:
+                self._callback_overruns += 1
+                return
+            if triggered and not last[_TRIGGERED]:
+                last[_TRIGGERED] = triggered
+                last[_TRIGGER_AT] = last[_N_SAMPLES] + trigger_at
+            last[_N_SAMPLES] += no_samples
+            last[_OVERFLOW] |= overflow
+            last[_AUTO_STOP] |= auto_stop
+            return
+        records[i] = (no_samples, start_index, overflow, trigger_at, triggered, auto_stop)
+        self._callback_count = i + 1
 
     def set_bandwidth_filter(
         self,
@@ -4,9 +4,13 @@ Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
 
 # flake8: noqa
 # pylint: skip-file
+import asyncio
 import ctypes
+import functools
 import os
 import platform
+import threading
+import time
 import warnings
 
 import numpy as np
@@ -37,16 +41,47 @@ from .common import (
 from ._classes import _general
 
 
+# Every PicoSDK API call returns a PICO_STATUS (uint32_t).
+_PICO_STATUS = ctypes.c_uint32
+
+# ps####aBlockReady(int16_t handle, PICO_STATUS status, PICO_POINTER pParameter),
+# identical on every supported driver.
+_BLOCK_READY = ctypes.CFUNCTYPE(None, ctypes.c_int16, _PICO_STATUS, ctypes.c_void_p)
+# ps6000aDataReady / psospaDataReady(int16_t handle, PICO_STATUS status,
+# uint64_t noOfSamples, int16_t overflow, PICO_POINTER pParameter)
+_DATA_READY = ctypes.CFUNCTYPE(
+    None, ctypes.c_int16, _PICO_STATUS, ctypes.c_uint64, ctypes.c_int16, ctypes.c_void_p)
+
+
 class PicoScopeBase:
     """PicoScope base class including common SDK and python modules and functions"""
+    # Driver calls on the acquisition hot path, resolved up front by
+    # `_resolve_functions()` in open_unit(). Any other call is resolved and
+    # cached the first time it is made.
+    _HOT_PATH_FUNCTIONS = (
+        'IsReady',
+        'RunBlock',
+        'GetValues',
+        'GetValuesBulk',
+        'SetDataBuffer',
+        'SetDataBuffers',
+        'RunStreaming',
+        'GetStreamingLatestValues',
+        'NoOfStreamingValues',
+        'Stop',
+    )
+
     # Class Functions
-    def __init__(self, dll_name, *args, **kwargs):
+    def __init__(self, dll_name, *args, dll=None, **kwargs):
         # Pytest override
         self._pytest = "pytest" in args
 
         # Setup DLL location per device
         if self._pytest:
             self.dll = None
+        elif dll is not None:
+            # Substitute driver object, e.g. SimulatedDriver
+            self.dll = dll
         else:
             # Determine file extension and naming convention based on OS
             system = platform.system()
@@ -66,6 +101,8 @@ class PicoScopeBase:
                 lib_path = os.path.join(lib_dir, lib_name.removesuffix('.dylib'), lib_name)
             self.dll = ctypes.CDLL(lib_path)
         self._unit_prefix_n = dll_name
+        # Function suffix -> resolved ctypes function (see _get_attr_function)
+        self._functions: dict[str, ctypes._CFuncPtr] = {}
 
         # Setup class variables
         self.handle = ctypes.c_short()
@@ -80,6 +117,27 @@ class PicoScopeBase:
 
         self.base_dataclass = _general.BaseDataClass()
 
+        # Block readiness: RunBlock's lpReady callback sets the event from the
+        # driver thread; is_ready() waits on it instead of spinning on IsReady.
+        # The ctypes callback object must outlive every RunBlock using it.
+        self._block_ready_event = threading.Event()
+        self._block_ready_status = 0
+        self._block_ready_armed = False
+        self._block_ready_expected = 0.0  # time.monotonic() the capture should end
+        self._block_ready_callback = _BLOCK_READY(self._block_ready)
+        # Wakers for the asyncio API (capture_block / capture_rapid), called
+        # from the driver thread alongside the event.
+        self._block_ready_notify = None
+        self._data_ready_notify = None
+        self._data_ready_callback = _DATA_READY(self._data_ready)
+        # Set for the whole of an asyncio capture; the executor transfer of
+        # a ps5000a capture is kept so a cancel can wait for it.
+        self._async_busy = False
+        self._async_transfer = None
+
+        # Optional DriverExecutor owning every driver call (see executor.py)
+        self._executor = None
+
     def __exit__(self):
         self.close_unit()
 
@@ -93,6 +151,8 @@ class PicoScopeBase:
         Returns ctypes function based on sub-class prefix name.
 
         For example, `_get_attr_function("OpenUnit")` will return `self.dll.ps####aOpenUnit()`.
+        The function is looked up once, given its PICO_STATUS restype and cached in
+        `self._functions` for every later call.
 
         Args:
             function_name (str): PicoSDK function name, e.g., "OpenUnit".
@@ -100,7 +160,28 @@ class PicoScopeBase:
         Returns:
             ctypes.CDLL: CDLL function for the specified name.
         """
-        return getattr(self.dll, self._unit_prefix_n + function_name)
+        function = self._functions.get(function_name)
+        if function is None:
+            function = getattr(self.dll, self._unit_prefix_n + function_name)
+            # argtypes are deliberately not declared: ctypes' per-argument
+            # from_param() conversion roughly doubles the cost of a call,
+            # see tests/benchmarks/bench_call_overhead.py.
+            if isinstance(function, ctypes._CFuncPtr):
+                function.restype = _PICO_STATUS
+            self._functions[function_name] = function
+        return function
+
+    def _resolve_functions(self) -> None:
+        """
+        Resolves every function in `_HOT_PATH_FUNCTIONS` up front, so the first
+        capture does not pay for the lookups. Functions missing from an older
+        driver are skipped and raise when they are first called.
+        """
+        for function_name in self._HOT_PATH_FUNCTIONS:
+            try:
+                self._get_attr_function(function_name)
+            except AttributeError:
+                continue
 
     def _error_handler(self, status: int) -> None:
         """
@@ -157,9 +238,17 @@ class PicoScopeBase:
         Returns:
             int: Returns status integer of PicoSDK dll.
         """
-        attr_function = self._get_attr_function(function_name)
+        executor = self._executor
+        if executor is not None and threading.get_ident() != executor.thread_id:
+            # Another thread: run on the executor's worker and wait for it
+            return executor.call(self._call_attr_function, function_name, *args)
+        try:
+            attr_function = self._functions[function_name]
+        except KeyError:
+            attr_function = self._get_attr_function(function_name)
         status = attr_function(*args)
-        self._error_handler(status)
+        if status:
+            self._error_handler(status)
         return status
 
 
@@ -173,6 +262,7 @@ class PicoScopeBase:
             resolution (RESOLUTION, optional): Resolution of device.
         """
 
+        self._resolve_functions()
         if serial_number is not None:
             serial_number = serial_number.encode()
         status = self._call_attr_function(
@@ -196,6 +286,9 @@ class PicoScopeBase:
         """
         if self._pytest:
             return
+        executor = self._executor
+        if executor is not None and threading.get_ident() != executor.thread_id:
+            executor.call(self.close_unit)
         else:
             self._get_attr_function('CloseUnit')(self.handle)
 
@@ -205,31 +298,107 @@ class PicoScopeBase:
         Returns:
             None
         """
+        # A stopped capture never completes; later waits must not use its
+        # ready callback.
+        self._block_ready_armed = False
         self._call_attr_function(
             'Stop',
             self.handle
         )
 
-    def is_ready(self) -> None:
+    def _block_ready(self, handle, status, parameter) -> None:
+        """RunBlock lpReady callback. Runs on a driver thread, so it must not
+        call back into the driver: it only records the status and wakes
+        :meth:`is_ready`."""
+        self._block_ready_status = status
+        self._block_ready_event.set()
+        notify = self._block_ready_notify
+        if notify is not None:
+            notify()
+
+    def _data_ready(self, handle, status, n_samples, overflow, parameter) -> None:
+        """GetValuesBulkAsync lpDataReady callback, run on a driver thread."""
+        notify = self._data_ready_notify
+        if notify is not None:
+            notify(status, n_samples, overflow)
+
+    def _poll_ready(self) -> bool:
+        """Return True if `IsReady` reports the capture has finished."""
+        ready = ctypes.c_int16()
+        self._call_attr_function("IsReady", self.handle, ctypes.byref(ready))
+        return ready.value != 0
+
+    def is_ready(self, timeout: float | None = None, adaptive_sleep: bool = True) -> None:
         """
         Blocks execution until the PicoScope device is ready.
 
-        Continuously calls the PicoSDK `IsReady` function in a loop, checking if
-        the device is prepared to proceed with data acquisition.
+        After :meth:`run_block_capture` the wait sleeps on the driver's
+        ready callback, using no CPU, and confirms readiness with `IsReady`
+        at least every 100 ms in case the callback is never delivered. For
+        captures started another way, `IsReady` is polled instead: with
+        ``adaptive_sleep`` the first poll is deferred until the end of the
+        busy time `RunBlock` estimated, and later polls back off from 50 us
+        to 5 ms apart; without it the poll spins as fast as possible.
+
+        Args:
+            timeout (float | None, optional): Maximum number of seconds to
+                wait. Defaults to None (wait indefinitely).
+            adaptive_sleep (bool, optional): Sleep between `IsReady` polls
+                when no ready callback is armed. Defaults to True.
+
+        Raises:
+            PicoSDKException: If the device is not ready within ``timeout``,
+                or the ready callback reports an error.
 
         Returns:
                 None
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
 
-        ready = ctypes.c_int16()
-        while True:
-            status = self._call_attr_function(
-                "IsReady",
-                self.handle,
-                ctypes.byref(ready)
-            )
-            if ready.value != 0:
-                break
+        def remaining() -> float | None:
+            if deadline is None:
+                return None
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise PicoSDKException(
+                    f"Timed out after {timeout} s waiting for the device to be ready")
+            return left
+
+        if self._block_ready_armed:
+            while True:
+                left = remaining()
+                if self._block_ready_event.wait(0.1 if left is None else min(left, 0.1)):
+                    self._block_ready_armed = False
+                    if self._block_ready_status:
+                        self._error_handler(self._block_ready_status)
+                    return
+                if self._poll_ready():
+                    self._block_ready_armed = False
+                    return
+
+        # Spin on the resolved function, unless a DriverExecutor must route
+        # each poll through _call_attr_function.
+        if not adaptive_sleep and self._executor is None:
+            ready = ctypes.c_int16()
+            ready_ref = ctypes.byref(ready)
+            is_ready = self._get_attr_function("IsReady")
+            while True:
+                status = is_ready(self.handle, ready_ref)
+                if status:
+                    self._error_handler(status)
+                if ready.value != 0:
+                    return
+                remaining()
+
+        # Seed the first sleep from RunBlock's busy-time estimate
+        delay = self._block_ready_expected - time.monotonic() if adaptive_sleep else 0
+        while not self._poll_ready():
+            left = remaining()
+            if not adaptive_sleep:
+                continue
+            if delay > 0:
+                time.sleep(delay if left is None else min(delay, left))
+            delay = 50e-6 if delay <= 0 else min(delay * 2, 5e-3)
 
     def ping_unit(self) -> bool:
         """Check that the device is still connected.
@@ -302,6 +471,7 @@ class PicoScopeBase:
             int(n_segments),
             ctypes.byref(max_samples),
         )
+        self.base_dataclass.last_memory_segments = int(n_segments)
         return max_samples.value
 
 
@@ -730,7 +900,8 @@ class PicoScopeBase:
         ratio: int = 0,
         ratio_mode: cst.RATIO_MODE = cst.RATIO_MODE.RAW,
         wait_for_ready: bool = True,
-    ) -> tuple[int, list[list[str]]]:
+        timeout: float | None = None,
+    ) -> tuple[int, np.ndarray]:
         """Retrieve data from multiple memory segments.
 
         Args:
@@ -742,19 +913,26 @@ class PicoScopeBase:
             ratio: Downsampling ratio to apply before copying.
             ratio_mode: Downsampling mode from :class:`RATIO_MODE`.
             wait_for_ready (bool, optional): Whether to wait for the device to be ready.
+            timeout (float | None, optional): Maximum seconds to wait for the device
+                to be ready. Defaults to None (wait indefinitely).
 
         Returns:
-            tuple[int, list[list[str]]]: ``(samples, overflow)list)`` where ``samples`` is the
-            number of samples copied and ``overflow`` is list of captures with where
-            channnels have exceeded their voltage range.
+            tuple[int, np.ndarray]: ``(samples, overflow)`` where ``samples`` is the
+            number of samples copied and ``overflow`` is a bool array of shape
+            ``(segments, 8)``, True where a channel exceeded its voltage range in a
+            segment (rows in retrieval order, columns indexed by :class:`CHANNEL`).
+            At most one :class:`OverrangeWarning` is emitted per call.
         """
 
         # If wait_for_ready is True, wait for the device to be ready before getting values
         if wait_for_ready:
-            self.is_ready()
+            self.is_ready(timeout)
+        else:
+            # The caller knows the captures are done; their ready event is stale
+            self._block_ready_armed = False
 
         no_samples = ctypes.c_uint64(samples)
-        overflow = np.zeros(to_segment_index + 1, dtype=np.int16)
+        overflow = self._bulk_overflow_array(from_segment_index, to_segment_index)
         self._call_attr_function(
             "GetValuesBulk",
             self.handle,
@@ -766,11 +944,59 @@ class PicoScopeBase:
             ratio_mode,
             npc.as_ctypes(overflow),
         )
-        overflow_list = []
-        for i in overflow:
-            self.over_range = i
-            overflow_list.append(self.is_over_range())
-        return no_samples.value, overflow_list
+        return no_samples.value, self._decode_bulk_overflow(overflow)
+
+    def _bulk_overflow_array(self, from_segment_index: int, to_segment_index: int) -> np.ndarray:
+        """Allocate the per-segment overflow array for a GetValuesBulk call.
+
+        A ``to_segment_index`` below ``from_segment_index`` wraps around the
+        segments configured by the last :meth:`memory_segments` (or
+        ``memory_segments_by_samples``) call. The driver writes one entry per
+        segment read, so an undersized array would be overrun.
+
+        Raises:
+            PicoSDKException: If the range wraps but the segment count is
+                unknown, or wraps beyond it.
+        """
+        if to_segment_index >= from_segment_index:
+            return np.zeros(to_segment_index - from_segment_index + 1, dtype=np.int16)
+        n_segments = self.base_dataclass.last_memory_segments
+        if n_segments is None:
+            raise PicoSDKException(
+                "A wrapping segment range needs the segment count: configure the "
+                "segments with memory_segments() first")
+        if from_segment_index >= n_segments:
+            raise PicoSDKException(
+                f"Segment {from_segment_index} is beyond the {n_segments} configured")
+        return np.zeros(n_segments - from_segment_index + to_segment_index + 1,
+                        dtype=np.int16)
+
+    def _decode_bulk_overflow(self, overflow: np.ndarray) -> np.ndarray:
+        """Decode per-segment over-range bit masks into a boolean matrix.
+
+        Sets :attr:`over_range` to the union of every segment's mask and emits
+        at most one :class:`OverrangeWarning` for the whole call.
+
+        Args:
+            overflow (np.ndarray): int16 bit mask per segment, as written by
+                the driver (bit n set = channel n over range).
+
+        Returns:
+            np.ndarray: bool array of shape ``(segments, 8)``; ``[i, ch]`` is
+            True if channel ``ch`` went over range in the i-th segment read.
+        """
+        masks = overflow.view(np.uint16)
+        matrix = (masks[:, None] >> np.arange(len(CHANNEL_NAMES), dtype=np.uint16)) & 1 != 0
+        self.over_range = int(np.bitwise_or.reduce(masks)) if masks.size else 0
+        if self.over_range:
+            n_captures = int(np.count_nonzero(masks))
+            channels = [CHANNEL_NAMES[i] for i in np.flatnonzero(matrix.any(axis=0))]
+            warnings.warn(
+                f"Overrange detected in {n_captures} of {masks.size} captures on "
+                f"channels: {', '.join(channels)}.",
+                OverrangeWarning
+            )
+        return matrix
 
     def get_values_overlapped(
         self,
@@ -1789,10 +2015,18 @@ class PicoScopeBase:
             datatype=DATA_TYPE.INT16_T,
             ratio_mode=RATIO_MODE.RAW,
             action=ACTION.CLEAR_ALL | ACTION.ADD,
+            buffer: np.ndarray | None = None,
         ) -> np.ndarray | None:
         """
         Allocates and assigns multiple data buffers for rapid block capture on a specified channel.
 
+        All captures share one contiguous block that is validated once; the
+        per-segment pointers are computed by stride arithmetic and registered
+        directly, so registering tens of thousands of segments costs one
+        driver call each and no per-segment NumPy or ctypes conversion.
+        A CLEAR_ALL in ``action`` applies to the first segment only, so the
+        segments registered after it are kept.
+
         Args:
             channel (int): The channel to associate the buffer with (e.g., CHANNEL.A).
             samples (int): Number of samples to allocate in the buffer.
@@ -1801,39 +2035,90 @@ class PicoScopeBase:
             datatype (DATA_TYPE, optional): C data type for the buffer (e.g., INT16_T).
             ratio_mode (RATIO_MODE, optional): Downsampling mode.
             action (ACTION, optional): Action to apply to the data buffer (e.g., CLEAR_ALL | ADD).
+            buffer (np.ndarray | None, optional): Preallocated block to register, shaped
+                ``(captures, samples)``, or ``(captures, 2, samples)`` (min plane first)
+                for AGGREGATE. If left as None, this function creates its own.
 
         Returns:
             np.array | None: The allocated buffer or ``None`` when clearing existing buffers.
 
         Raises:
-            PicoSDKException: If an unsupported data type is provided.
-        """
+            PicoSDKException: If an unsupported data type is provided, or ``buffer``
+                does not match the registration.
+        """
+        # The loop below bypasses _call_attr_function, so honour an attached
+        # DriverExecutor for the whole registration.
+        executor = self._executor
+        if executor is not None and threading.get_ident() != executor.thread_id:
+            return executor.call(
+                self.set_data_buffer_rapid_capture, channel, samples, captures, segment,
+                datatype, ratio_mode, action, buffer)
+
+        ps5000a = self._unit_prefix_n in ['ps5000a']
+        aggregate = ratio_mode == cst.RATIO_MODE.AGGREGATE
+        if ps5000a:
+            if datatype != cst.DATA_TYPE.INT16_T:
+                warnings.warn(
+                    f'{self._unit_prefix_n} only supports datatype int16. Defaulting to int16.',
+                    ParameterNotSupported)
+                datatype = cst.DATA_TYPE.INT16_T
+            # Convert RAW (unsupported in ps5000a) to NONE.
+            if ratio_mode == cst.RATIO_MODE.RAW:
+                ratio_mode = cst.RATIO_MODE.NONE
+            self.base_dataclass.last_buffer_size = samples
+
         # If no samples, set buffer to None
         if samples == 0:
             buffer = None
-            buf_ptr = None
         else:
             # Map to NumPy dtype and update ADC limits
             self.get_adc_limits(datatype)
             np_dtype = cst.DataTypeNPMap.get(datatype, None)
             if np_dtype is None:
                 raise PicoSDKException("Invalid datatype selected for buffer")
-             
-            # Create buffer based on ratio mode. AGGREGATE holds a min and a
-            # max plane of `samples` each per capture, matching the
-            # (2, samples) layout set_data_buffers registers.
-            if ratio_mode == cst.RATIO_MODE.AGGREGATE:
-                buffer = np.zeros((captures, 2, samples), dtype=np_dtype)
-            else:
-                buffer = np.zeros((captures, samples), dtype=np_dtype)
 
-        # Set data buffers
+            # AGGREGATE holds a min and a max plane of `samples` each per
+            # capture, matching the (2, samples) layout set_data_buffers
+            # registers.
+            shape = (captures, 2, samples) if aggregate else (captures, samples)
+            if buffer is None:
+                buffer = np.zeros(shape, dtype=np_dtype)
+            else:
+                self._validate_buffer(buffer, buffer.size, datatype)
+                if buffer.shape != shape:
+                    raise PicoSDKException(
+                        f"Rapid capture buffer has shape {buffer.shape}, expected {shape}")
+
+        # Register every segment with the resolved driver function directly.
+        # Pointers come from stride arithmetic on the validated block and are
+        # wrapped in c_void_p, as no argtypes are declared to pass raw
+        # addresses at full pointer width.
+        if buffer is None:
+            address = stride = plane = 0
+        else:
+            address = buffer.ctypes.data
+            stride = buffer.strides[0]
+            plane = buffer.strides[1] if aggregate else 0
+        function = self._get_attr_function("SetDataBuffers" if aggregate else "SetDataBuffer")
+        handle = self.handle
+        channel, datatype, ratio_mode = int(channel), int(datatype), int(ratio_mode)
+        # CLEAR_ALL on every segment would drop the ones registered before it
+        first_action, action = int(action), int(action & ~cst.ACTION.CLEAR_ALL)
+        c_void_p = ctypes.c_void_p
         for i in range(captures):
-            # Set data buffers based on ratio mode
-            if ratio_mode == cst.RATIO_MODE.AGGREGATE:
-                self.set_data_buffers(channel, samples, segment + i, datatype, ratio_mode, action, buffers=buffer[i])
+            offset = address + i * stride
+            if aggregate:
+                pointers = (c_void_p(offset + plane), c_void_p(offset)) if address \
+                    else (None, None)
             else:
-                self.set_data_buffer(channel, samples, segment + i, datatype, ratio_mode, action, buffer=buffer[i])
+                pointers = (c_void_p(offset) if address else None,)
+            if ps5000a:
+                status = function(handle, channel, *pointers, samples, segment + i, ratio_mode)
+            else:
+                status = function(handle, channel, *pointers, samples, datatype, segment + i,
+                                  ratio_mode, first_action if i == 0 else action)
+            if status:
+                self._error_handler(status)
 
         return buffer
 
@@ -1953,20 +2238,9 @@ class PicoScopeBase:
         # Get values from PicoScope (returning actual samples for time_axis)
         actual_samples = self.get_values(samples, start_index, segment, ratio, ratio_mode)
 
-        # Reduce channels buffer by actual samples
-        for channel in channel_buffer:
-            channel_buffer[channel] = channel_buffer[channel][:actual_samples]
-
-        # Convert from ADC to mV or V values
-        if output_unit != 'adc':
-            channel_buffer = self._adc_to_(channel_buffer, unit=output_unit)
-
-        # Generate the time axis based on actual samples and timebase
-        time_axis = self.get_time_axis(
-            timebase, actual_samples, pre_trig_percent=pre_trig_percent,
-            ratio=ratio, unit=time_unit)
-
-        return channel_buffer, time_axis
+        return self._finish_capture(
+            channel_buffer, actual_samples, timebase, output_unit, time_unit, ratio,
+            pre_trig_percent)
 
     def run_simple_rapid_block_capture(
         self,
@@ -2023,24 +2297,239 @@ class PicoScopeBase:
             samples, from_segment_index=segment, to_segment_index=captures - 1, ratio=ratio,
             ratio_mode=ratio_mode, start_index=start_index)
 
+        return self._finish_capture(
+            channel_buffer, actual_samples, timebase, output_unit, time_unit, ratio,
+            pre_trig_percent)
+
+    def _finish_capture(
+        self,
+        channel_buffer: dict,
+        actual_samples: int,
+        timebase: int,
+        output_unit: str,
+        time_unit: str,
+        ratio: int,
+        pre_trig_percent: float,
+    ) -> tuple[dict[int, np.ndarray], np.ndarray]:
+        """Trim, convert and time-stamp the buffers of a completed block or rapid capture."""
         # Reduce samples based on actual samples (last axis is always the
-        # sample axis, for both (captures, samples) and AGGREGATE's
+        # sample axis, for (samples,), (captures, samples) and AGGREGATE's
         # (captures, 2, samples) layouts)
         for channel, array in channel_buffer.items():
             channel_buffer[channel] = array[..., :actual_samples]
 
-        # Convert data to mV
+        # Convert from ADC to mV or V values
         if output_unit != 'adc':
             channel_buffer = self._adc_to_(channel_buffer, unit=output_unit)
 
-        # Get time axis
+        # Generate the time axis based on actual samples and timebase
         time_axis = self.get_time_axis(
             timebase, actual_samples, pre_trig_percent=pre_trig_percent,
             ratio=ratio, unit=time_unit)
 
-        # Return data
         return channel_buffer, time_axis
 
+    async def _wait_ready_async(self) -> None:
+        """Await the ready callback armed by :meth:`run_block_capture`.
+
+        `IsReady` is still checked every 100 ms in case the callback is never
+        delivered, as in :meth:`is_ready`.
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def wake():
+            if not ready.done():
+                ready.set_result(None)
+
+        self._block_ready_notify = lambda: loop.call_soon_threadsafe(wake)
+        try:
+            while not self._block_ready_event.is_set():
+                await asyncio.wait((ready,), timeout=0.1)
+                if not ready.done() and self._poll_ready():
+                    break
+        finally:
+            self._block_ready_notify = None
+        self._block_ready_armed = False
+        if self._block_ready_status:
+            self._error_handler(self._block_ready_status)
+
+    async def _get_values_bulk_async(
+        self,
+        samples: int,
+        from_segment_index: int,
+        to_segment_index: int,
+        start_index: int,
+        ratio: int,
+        ratio_mode: cst.RATIO_MODE,
+    ) -> int:
+        """Await a transfer of captured segments into the registered buffers.
+
+        On the 6000a generation this is `GetValuesBulkAsync`, completed by its
+        data-ready callback. The ps5000a driver has no asynchronous bulk
+        transfer, so its `GetValuesBulk` runs in the loop's default executor.
+
+        Returns:
+            int: Number of samples copied per segment.
+        """
+        loop = asyncio.get_running_loop()
+        if self._unit_prefix_n in ['ps5000a']:
+            self._async_transfer = loop.run_in_executor(None, functools.partial(
+                self.get_values_bulk, samples, from_segment_index, to_segment_index,
+                ratio=ratio, ratio_mode=ratio_mode, wait_for_ready=False))
+            # Shielded: cancelling the capture cannot interrupt the driver
+            # call, so the transfer stays pending until it really returns.
+            actual_samples, _ = await asyncio.shield(self._async_transfer)
+            return actual_samples
+
+        done = loop.create_future()
+
+        def complete(result):
+            if not done.done():
+                done.set_result(result)
+
+        self._data_ready_notify = \
+            lambda *result: loop.call_soon_threadsafe(complete, result)
+        try:
+            self.get_values_bulk_async(
+                start_index, samples, from_segment_index, to_segment_index, ratio,
+                ratio_mode, self._data_ready_callback, None)
+            status, actual_samples, overflow = await done
+        finally:
+            self._data_ready_notify = None
+        if status:
+            self._error_handler(status)
+        self.over_range = overflow
+        self.is_over_range()
+        return actual_samples
+
+    async def _run_async(self, capture):
+        """Await ``capture``, stopping the device if the await is cancelled."""
+        if self._async_busy:
+            capture.close()
+            raise PicoSDKException("An asynchronous capture is already running on this device")
+        self._async_busy = True
+        try:
+            return await capture
+        except asyncio.CancelledError:
+            self._block_ready_armed = False
+            transfer = self._async_transfer
+            if transfer is not None:
+                # Never call Stop while the executor's transfer is still in
+                # the driver on the same handle.
+                await asyncio.wait((transfer,))
+            self.stop()
+            raise
+        finally:
+            self._async_transfer = None
+            self._async_busy = False
+
+    async def capture_block(
+        self,
+        timebase: int,
+        samples: int,
+        segment: int = 0,
+        start_index: int = 0,
+        datatype: cst.DATA_TYPE = cst.DATA_TYPE.INT16_T,
+        output_unit: str | cst.output_unit_l = 'mv',
+        time_unit: str | cst.TimeUnit_L = 'ns',
+        ratio: int = 0,
+        ratio_mode: cst.RATIO_MODE = cst.RATIO_MODE.RAW,
+        pre_trig_percent: int = 50,
+    ) -> tuple[dict[int, np.ndarray], np.ndarray]:
+        """Awaitable equivalent of :meth:`run_simple_block_capture`.
+
+        The event loop keeps running while the device captures and while the
+        data transfers, so one loop can keep several devices busy. Cancelling
+        the task (e.g. through ``asyncio.wait_for``) stops the device.
+
+        Args:
+            timebase: PicoScope timebase value.
+            samples: Number of samples to capture.
+            segment: Memory segment index to use.
+            start_index: Starting index in the buffer.
+            datatype: Data type to use for the capture buffer.
+            output_unit (str, optional): Output unit of data, can be ['adc', 'mv', 'v']
+                Default is 'mv'.
+            time_unit (str, optional): Output unit of the time_axis.
+                Default is 'ns'.
+            ratio: Downsampling ratio.
+            ratio_mode: Downsampling mode.
+            pre_trig_percent: Percentage of samples to capture before the trigger.
+
+        Returns:
+            tuple[dict[int,np.ndarray],np.ndarray]: Dictionary of channel buffers and the
+            time axis (numpy array).
+
+        Examples:
+            >>> buffers, time_axis = await asyncio.wait_for(
+            ...     scope.capture_block(timebase=3, samples=1000), timeout=5)
+        """
+        async def capture():
+            self.last_used_volt_unit = output_unit
+            channel_buffer = \
+                self.set_data_buffer_for_enabled_channels(samples, segment, datatype, ratio_mode)
+            self.run_block_capture(timebase, samples, pre_trig_percent, segment)
+            await self._wait_ready_async()
+            actual_samples = await self._get_values_bulk_async(
+                samples, segment, segment, start_index, ratio, ratio_mode)
+            return self._finish_capture(
+                channel_buffer, actual_samples, timebase, output_unit, time_unit, ratio,
+                pre_trig_percent)
+
+        return await self._run_async(capture())
+
+    async def capture_rapid(
+        self,
+        timebase: int,
+        samples: int,
+        captures: int,
+        start_index: int = 0,
+        datatype: cst.DATA_TYPE = cst.DATA_TYPE.INT16_T,
+        output_unit: str | cst.output_unit_l = 'mv',
+        time_unit: str | cst.TimeUnit_L = 'ns',
+        ratio: int = 0,
+        ratio_mode: cst.RATIO_MODE = cst.RATIO_MODE.RAW,
+        pre_trig_percent: int = 50,
+    ) -> tuple[dict[int, np.ndarray], np.ndarray]:
+        """Awaitable equivalent of :meth:`run_simple_rapid_block_capture`.
+
+        Cancelling the task stops the device, as for :meth:`capture_block`.
+
+        Args:
+            timebase: PicoScope timebase value.
+            samples: Number of samples to capture.
+            captures: Number of waveforms to capture.
+            start_index: Starting index in buffer.
+            datatype: Data type to use for the capture buffer.
+            output_unit (str, optional): Output unit of data, can be ['adc', 'mv', 'v']
+                Default is 'mv'.
+            time_unit (str, optional): Output unit of the time_axis.
+                Default is 'ns'.
+            ratio: Downsampling ratio.
+            ratio_mode: Downsampling mode.
+            pre_trig_percent: Percentage of samples to capture before the trigger.
+
+        Returns:
+            tuple[dict,np.ndarray]: Dictionary of channel buffers and the time
+                axis (numpy array).
+        """
+        async def capture():
+            self.last_used_volt_unit = output_unit
+            self.memory_segments(captures)
+            self.set_no_of_captures(captures)
+            channel_buffer = self.set_data_buffer_for_enabled_channels(
+                samples, datatype=datatype, ratio_mode=ratio_mode, captures=captures)
+            self.run_block_capture(timebase, samples, pre_trig_percent)
+            await self._wait_ready_async()
+            actual_samples = await self._get_values_bulk_async(
+                samples, 0, captures - 1, start_index, ratio, ratio_mode)
+            return self._finish_capture(
+                channel_buffer, actual_samples, timebase, output_unit, time_unit, ratio,
+                pre_trig_percent)
+
+        return await self._run_async(capture())
+
     def run_block_capture(
             self,
             timebase: int,
@@ -2052,7 +2541,9 @@ class PicoScopeBase:
         Runs a block capture using the specified timebase and number of samples.
 
         This sets up the PicoScope to begin collecting a block of data, divided into
-        pre-trigger and post-trigger samples. It uses the PicoSDK `RunBlock` function.
+        pre-trigger and post-trigger samples. It uses the PicoSDK `RunBlock` function,
+        arming its ready callback so a following :meth:`is_ready` (or
+        :meth:`get_values`) sleeps until the capture completes instead of polling.
 
         Args:
             timebase (int): Timebase value determining sample interval (refer to PicoSDK guide).
@@ -2065,6 +2556,9 @@ class PicoScopeBase:
         Returns:
             int: Estimated time (in milliseconds) the device will be busy capturing data.
         """
+        # Disarm any earlier capture whose wait was skipped before its ready
+        # event is cleared for this one.
+        self._block_ready_armed = False
         # Check and add pre-trig to base dataclass
         if pre_trig_percent is None:
             pre_trig_percent = self.base_dataclass.last_pre_trig
@@ -2073,17 +2567,26 @@ class PicoScopeBase:
         pre_samples = int((samples * pre_trig_percent) / 100)
         post_samples = int(samples - pre_samples)
         time_indisposed_ms = ctypes.c_int32()
-        self._call_attr_function(
-            'RunBlock',
-            self.handle,
-            pre_samples,
-            post_samples,
-            timebase,
-            ctypes.byref(time_indisposed_ms),
-            segment,
-            None,
-            None
-        )
+        self._block_ready_event.clear()
+        self._block_ready_status = 0
+        self._block_ready_armed = True
+        start = time.monotonic()
+        try:
+            self._call_attr_function(
+                'RunBlock',
+                self.handle,
+                pre_samples,
+                post_samples,
+                timebase,
+                ctypes.byref(time_indisposed_ms),
+                segment,
+                self._block_ready_callback,
+                None
+            )
+        except PicoSDKException:
+            self._block_ready_armed = False
+            raise
+        self._block_ready_expected = start + time_indisposed_ms.value / 1000
         return time_indisposed_ms.value
 
     def run_streaming(
@@ -2246,6 +2749,7 @@ class PicoScopeBase:
         ratio_mode: RATIO_MODE = RATIO_MODE.RAW,
         data_type: DATA_TYPE = DATA_TYPE.INT16_T,
         wait_for_ready: bool = True,
+        timeout: float | None = None,
     ) -> int:
         """
         Retrieves a block of captured samples from the device once it's ready.
@@ -2261,6 +2765,8 @@ class PicoScopeBase:
                 ratio (int, optional): Downsampling ratio.
                 ratio_mode (RATIO_MODE, optional): Ratio mode for downsampling.
                 wait_for_ready (bool, optional): Whether to wait for the device to be ready.
+                timeout (float | None, optional): Maximum seconds to wait for the device
+                    to be ready. Defaults to None (wait indefinitely).
 
         Returns:
                 int: Actual number of samples retrieved.
@@ -2268,7 +2774,10 @@ class PicoScopeBase:
 
         # If wait_for_ready is True, wait for the device to be ready before getting values
         if wait_for_ready:
-            self.is_ready()
+            self.is_ready(timeout)
+        else:
+            # The caller knows the capture is done; its ready event is stale
+            self._block_ready_armed = False
 
         # Create ctypes for total samples and over range
         total_samples = ctypes.c_uint32(samples)
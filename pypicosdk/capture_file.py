@@ -0,0 +1,520 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Indexed, memory-mappable capture files for streamed and block data.
+
+A capture saved as ``capture.bin`` is a small set of files sharing its stem::
+
+    capture_metadata.json   self-describing header (JSON)
+    capture_A.bin           raw samples of channel A, native dtype, no framing
+    capture_B.bin           ...one file per channel
+    capture_index.bin       chunk index, one fixed-size record per chunk
+
+Each channel's samples are contiguous in their own file, so a reader maps
+it with ``np.memmap`` and slicing a time window only touches the pages it
+needs, however large the recording. The header names the channels, dtype,
+sample interval, ADC limits, range and probe scale of each channel and
+describes the index records. The index maps every chunk (a streaming poll,
+or one capture of a rapid block) to its position in the file and in the
+stream, so time lookups stay correct across dropped chunks. Rapid block
+captures are stored as separate segments, each with its own timeline
+starting at sample 0; time lookups on them take a ``segment``.
+
+The header is rewritten on close; a reader takes sample and chunk counts
+from the file sizes, so a capture cut short by a crash still opens.
+
+Usage::
+
+    capture = psdk.CaptureFile('capture.bin')
+    window = capture.window(1.5, 1.6)          # {'A': memmap slice, ...}
+    volts = capture.to_volts('A', window['A'])
+"""
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from .constants import CHANNEL_NAMES, DIGITAL_PORT, RANGE
+from .common import PicoSDKException
+
+FORMAT_NAME = 'pypicosdk-capture'
+FORMAT_VERSION = 1
+
+# Chunk index record. flags: bit 0 triggered, bit 1 auto-stopped,
+# bit 2 over range on any channel.
+INDEX_DTYPE = np.dtype([
+    ('stream_sample', '<i8'),   # position of the chunk's first sample in its segment
+    ('file_sample', '<i8'),     # position of the chunk's first sample in the files
+    ('n_samples', '<i8'),
+    ('monotonic_ns', '<i8'),    # host time the chunk arrived (0 if unknown)
+    ('flags', '<u4'),
+    ('segment', '<u4'),         # timeline the chunk belongs to (0 for streams)
+])
+FLAG_TRIGGERED = 1
+FLAG_AUTO_STOPPED = 2
+FLAG_OVERRANGE = 4
+
+
+def _paths(path) -> tuple[str, str]:
+    """``(stem, suffix)`` of a capture from its data path or header path."""
+    path = os.fspath(path)
+    if path.endswith('_metadata.json'):
+        return path[:-len('_metadata.json')], '.bin'
+    stem, suffix = os.path.splitext(path)
+    return stem, suffix or '.bin'
+
+
+def channel_name(channel) -> str:
+    """Stream name of a CHANNEL or DIGITAL_PORT value, or a string label."""
+    if isinstance(channel, str):
+        return channel
+    if channel >= DIGITAL_PORT.PORT0:
+        return DIGITAL_PORT(channel).name
+    return CHANNEL_NAMES[channel]
+
+
+def channel_header(scope, channels) -> dict:
+    """Header entries for ``channels`` from a scope's channel settings.
+
+    Args:
+        scope: Opened scope whose ``channel_db`` holds the channels.
+        channels (list): Channels to describe. Digital ports are recorded
+            as ``{'digital': True}``.
+
+    Returns:
+        dict: ``{channel: {'range', 'range_mv', 'probe_scale'}}``.
+    """
+    header = {}
+    for ch in channels:
+        if ch in scope.digital_port_db:
+            header[ch] = {'digital': True}
+            continue
+        info = scope.channel_db[ch]
+        header[ch] = {
+            'range': RANGE(info.range).name,
+            'range_mv': info.range_mv,
+            'probe_scale': info.probe_scale,
+        }
+    return header
+
+
+def _count_scale(scope, dtype) -> int:
+    """Divisor taking ``scope``'s ADC counts to the units of ``dtype``.
+
+    8-bit buffers hold the top byte of the 16-bit counts. The 6000a
+    generation already scales its limits once an 8-bit buffer is
+    registered; ps5000a always reports 16-bit limits.
+    """
+    if np.dtype(dtype).itemsize == 1 and scope.max_adc_value > np.iinfo(np.int8).max:
+        return 256
+    return 1
+
+
+def adc_limits(scope, dtype) -> list | None:
+    """ADC limits of ``scope`` in units of the stored ``dtype``."""
+    if scope.max_adc_value is None:
+        return None
+    scale = _count_scale(scope, dtype)
+    return [int(scope.min_adc_value) // scale, int(scope.max_adc_value) // scale]
+
+
+class CaptureWriter:
+    """
+    Appends chunks of per-channel samples to a capture file set.
+
+    Used by :class:`Recording` for streams and by :func:`save_capture` for
+    block data; use it directly for custom pipelines::
+
+        with psdk.CaptureWriter('capture.bin', {psdk.CHANNEL.A: {...}},
+                                np.int16, sample_interval_s=1e-8) as writer:
+            writer.append({psdk.CHANNEL.A: samples})
+    """
+
+    def __init__(
+        self,
+        path,
+        channels: dict,
+        dtype,
+        sample_interval_s: float | None,
+        adc_limits: list | None = None,  # pylint: disable=redefined-outer-name
+        metadata: dict | None = None,
+    ):
+        """
+        Args:
+            path (str): Data path of the capture, e.g. ``'capture.bin'``.
+            channels (dict): ``{channel: header dict}``, e.g. from
+                :func:`channel_header`. Sets the channels and their order.
+                Keys are CHANNEL values or string labels such as
+                ``'A_min'`` for streams that are not a single channel.
+            dtype: Sample dtype of every channel.
+            sample_interval_s (float | None): Seconds between stored samples.
+            adc_limits (list, optional): ``[min, max]`` ADC counts in
+                ``dtype`` units, used for conversion to volts.
+            metadata (dict, optional): Extra header entries.
+        """
+        stem, suffix = _paths(path)
+        self.dtype = np.dtype(dtype)
+        self.header_path = f'{stem}_metadata.json'
+        self.index_path = f'{stem}_index.bin'
+        self.files = {ch: f'{stem}_{channel_name(ch)}{suffix}' for ch in channels}
+        self.n_samples = 0
+        self.n_chunks = 0
+        self.n_segments = 1
+        self.bytes_written = 0
+        self._stream_end: dict = {}     # segment -> stream position after its last chunk
+        self._header = {
+            'format': FORMAT_NAME,
+            'version': FORMAT_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            'channels': {
+                channel_name(ch): {'file': os.path.basename(file), **channels[ch]}
+                for ch, file in self.files.items()
+            },
+            'dtype': self.dtype.str,
+            'bytes_per_sample': self.dtype.itemsize,
+            'sample_interval_s': sample_interval_s,
+            'adc_limits': adc_limits,
+            'index': {
+                'file': os.path.basename(self.index_path),
+                'dtype': INDEX_DTYPE.descr,
+            },
+            **(metadata or {}),
+        }
+        # pylint: disable=consider-using-with
+        self._handles = {ch: open(file, 'wb') for ch, file in self.files.items()}
+        self._index = open(self.index_path, 'wb')
+        self._record = np.zeros(1, dtype=INDEX_DTYPE)
+        self._write_header()
+
+    def _write_header(self) -> None:
+        self._header['n_samples'] = self.n_samples
+        self._header['n_chunks'] = self.n_chunks
+        self._header['n_segments'] = self.n_segments
+        temporary = self.header_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(self._header, file, indent=2)
+        os.replace(temporary, self.header_path)
+
+    def append(
+        self,
+        data: dict,
+        stream_sample: int | None = None,
+        monotonic_ns: int = 0,
+        flags: int = 0,
+        segment: int = 0,
+    ) -> int:
+        """Append one chunk.
+
+        Args:
+            data (dict): ``{channel: np.ndarray}`` with equal lengths, for
+                every channel of the capture.
+            stream_sample (int, optional): Position of the chunk's first
+                sample in its segment's timeline. Defaults to following on
+                from the segment's last chunk (no gap).
+            monotonic_ns (int, optional): Host arrival time of the chunk.
+            flags (int, optional): ``FLAG_*`` bits for the chunk.
+            segment (int, optional): Timeline the chunk belongs to, e.g. the
+                capture of a rapid block. Defaults to 0.
+
+        Returns:
+            int: Bytes written.
+
+        Raises:
+            PicoSDKException: If the channels' sample counts differ.
+        """
+        lengths = {len(data[ch]) for ch in self._handles}
+        if len(lengths) > 1:
+            raise PicoSDKException(f"Channel lengths differ within a chunk: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+        written = 0
+        for ch, handle in self._handles.items():
+            samples = data[ch]
+            handle.write(np.ascontiguousarray(samples, dtype=self.dtype))
+            written += n * self.dtype.itemsize
+        if stream_sample is None:
+            stream_sample = self._stream_end.get(segment, 0)
+        record = self._record
+        record['stream_sample'] = stream_sample
+        record['file_sample'] = self.n_samples
+        record['n_samples'] = n
+        record['monotonic_ns'] = monotonic_ns
+        record['flags'] = flags
+        record['segment'] = segment
+        self._index.write(self._record)
+        self._stream_end[segment] = stream_sample + n
+        self.n_segments = max(self.n_segments, segment + 1)
+        self.n_samples += n
+        self.n_chunks += 1
+        self.bytes_written += written
+        return written
+
+    def close(self, **metadata) -> dict:
+        """Close the files and rewrite the header with the final counts.
+
+        Args:
+            **metadata: Extra header entries, e.g. counters.
+
+        Returns:
+            dict: The header.
+        """
+        if self._handles:
+            for handle in self._handles.values():
+                handle.close()
+            self._index.close()
+            self._handles = {}
+        self._header.update(metadata)
+        self._write_header()
+        return dict(self._header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def save_capture(path, scope, buffers: dict, sample_interval_s: float,
+                 timestamps_ns=None, **metadata) -> dict:
+    """Save block or rapid block capture buffers as a capture file set.
+
+    Args:
+        path (str): Data path, e.g. ``'capture.bin'``.
+        scope: The scope the buffers came from (for ranges and ADC limits).
+        buffers (dict): ``{channel: np.ndarray}`` in ADC counts, as returned
+            by ``run_simple_block_capture(..., output_unit='adc')``. 2D
+            ``(captures, samples)`` buffers from rapid block captures store
+            each capture as its own segment, timed from its first sample.
+        sample_interval_s (float): Seconds between samples.
+        timestamps_ns (list, optional): Time of each capture in ns, stored in
+            the index's ``monotonic_ns``. Defaults to None (0).
+        **metadata: Extra header entries.
+
+    Returns:
+        dict: The header written.
+    """
+    channels = list(buffers)
+    arrays = [np.atleast_2d(buffers[ch]) for ch in channels]
+    dtype = arrays[0].dtype
+    writer = CaptureWriter(path, channel_header(scope, channels), dtype, sample_interval_s,
+                           adc_limits(scope, dtype), metadata)
+    try:
+        for row in range(arrays[0].shape[0]):
+            writer.append({ch: array[row] for ch, array in zip(channels, arrays)}, 0,
+                          0 if timestamps_ns is None else int(timestamps_ns[row]),
+                          segment=row)
+    finally:
+        header = writer.close()
+    return header
+
+
+class CaptureFile:
+    """
+    Reader for capture file sets, exposing each channel as an ``np.memmap``.
+
+    Channels are looked up by name or :class:`CHANNEL`; time arguments are
+    seconds from the first sample of the stream (including any dropped
+    chunks, which the index records as gaps). Captures of several segments
+    (rapid block) restart that timeline in every segment, so their time
+    lookups take a ``segment``.
+
+    Attributes:
+        header (dict): The parsed header.
+        channels (list): Channel names, e.g. ``['A', 'B']``.
+        dtype (np.dtype): Sample dtype.
+        sample_interval_s (float | None): Seconds between stored samples.
+        n_samples (int): Samples per channel available in the files.
+        n_segments (int): Separate timelines in the capture (1 for streams).
+        index (np.ndarray): Chunk index records (``INDEX_DTYPE``).
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Data path (``'capture.bin'``) or header path
+                (``'capture_metadata.json'``) of the capture.
+
+        Raises:
+            PicoSDKException: If the header is missing or not a capture header.
+        """
+        stem, _ = _paths(path)
+        directory = os.path.dirname(stem)
+        header_path = f'{stem}_metadata.json'
+        if not os.path.exists(header_path):
+            raise PicoSDKException(f"No capture header at {header_path}")
+        with open(header_path, encoding='utf-8') as file:
+            self.header = json.load(file)
+        if self.header.get('format') != FORMAT_NAME:
+            raise PicoSDKException(f"{header_path} is not a {FORMAT_NAME} header")
+        if self.header.get('version', 0) > FORMAT_VERSION:
+            raise PicoSDKException(
+                f"Capture format version {self.header['version']} is newer than "
+                f"this reader ({FORMAT_VERSION})")
+        self.dtype = np.dtype(self.header['dtype'])
+        self.sample_interval_s = self.header['sample_interval_s']
+        self.channels = list(self.header['channels'])
+        self._files = {name: os.path.join(directory, info['file'])
+                       for name, info in self.header['channels'].items()}
+        self._maps = {}
+
+        index_info = self.header['index']
+        index_dtype = np.dtype([tuple(field) for field in index_info['dtype']])
+        self.index = self._map(os.path.join(directory, index_info['file']), index_dtype)
+        # Counted from the index, which is complete even if the header is not
+        self.n_segments = int(self.index['segment'].max()) + 1 if self.index.size else 1
+        # Trailing partial records or samples from an interrupted write are ignored
+        sizes = [os.path.getsize(file) // self.dtype.itemsize for file in self._files.values()]
+        self.n_samples = min(sizes, default=0)
+        if self.index.size:
+            self.n_samples = min(self.n_samples, int(self.index['file_sample'][-1]
+                                                     + self.index['n_samples'][-1]))
+
+    @staticmethod
+    def _map(file: str, dtype) -> np.ndarray:
+        count = os.path.getsize(file) // dtype.itemsize if os.path.exists(file) else 0
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(file, dtype=dtype, mode='r', shape=(count,))
+
+    def _name(self, channel) -> str:
+        name = channel_name(channel if isinstance(channel, str) else int(channel))
+        if name not in self._files:
+            raise PicoSDKException(f"Channel {name} is not in this capture")
+        return name
+
+    def __getitem__(self, channel) -> np.ndarray:
+        """Read-only ``np.memmap`` of every stored sample of ``channel``."""
+        name = self._name(channel)
+        data = self._maps.get(name)
+        if data is None:
+            data = self._map(self._files[name], self.dtype)[:self.n_samples]
+            self._maps[name] = data
+        return data
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def _records(self, segment) -> np.ndarray:
+        """Index records of one timeline; ``segment`` is required with several."""
+        if segment is None:
+            if self.n_segments > 1:
+                raise PicoSDKException(
+                    f"This capture holds {self.n_segments} segments: pass segment=")
+            return self.index
+        if not 0 <= segment < self.n_segments:
+            raise PicoSDKException(
+                f"Segment {segment} is not in this capture ({self.n_segments} segments)")
+        if self.n_segments == 1:
+            return self.index
+        return self.index[self.index['segment'] == segment]
+
+    def _bounds(self, records) -> tuple[int, int]:
+        """File samples ``(start, stop)`` spanned by ``records``."""
+        if not records.size:
+            return (0, self.n_samples) if not self.index.size else (0, 0)
+        stop = int(records['file_sample'][-1] + records['n_samples'][-1])
+        return int(records['file_sample'][0]), min(stop, self.n_samples)
+
+    @property
+    def duration_s(self) -> float:
+        """Stream time covered by the capture, gaps included (longest segment)."""
+        if not self.index.size:
+            return self.n_samples * (self.sample_interval_s or 0)
+        end = int(np.max(self.index['stream_sample'] + self.index['n_samples']))
+        return end * (self.sample_interval_s or 0)
+
+    def chunk(self, i: int) -> dict:
+        """Samples of index chunk ``i`` (a streaming poll or a rapid capture).
+
+        Returns:
+            dict: ``{channel name: memmap slice}``.
+        """
+        record = self.index[i]
+        start = int(record['file_sample'])
+        stop = start + int(record['n_samples'])
+        return {name: self[name][start:stop] for name in self.channels}
+
+    def segment(self, segment: int) -> dict:
+        """Every stored sample of one segment (e.g. one rapid block capture).
+
+        Returns:
+            dict: ``{channel name: memmap slice}``.
+        """
+        start, stop = self._bounds(self._records(segment))
+        return {name: self[name][start:stop] for name in self.channels}
+
+    def stream_samples(self, file_samples, segment: int | None = None) -> np.ndarray:
+        """Positions in their segment's timeline of file sample indices, accounting for gaps."""
+        file_samples = np.asarray(file_samples, dtype=np.int64)
+        records = self._records(segment)
+        if not records.size:
+            return file_samples
+        chunk = np.searchsorted(records['file_sample'], file_samples, side='right') - 1
+        chunk = np.clip(chunk, 0, None)
+        return records['stream_sample'][chunk] + file_samples - records['file_sample'][chunk]
+
+    def sample_index(self, time_s: float, segment: int | None = None) -> int:
+        """File sample at or after ``time_s`` in a segment (clipped to the segment)."""
+        if not self.sample_interval_s:
+            raise PicoSDKException("Capture has no sample interval for time lookups")
+        position = int(np.ceil(time_s / self.sample_interval_s - 1e-9))
+        records = self._records(segment)
+        if not records.size:
+            return min(max(position, 0), self.n_samples)
+        first, last = self._bounds(records)
+        stream = records['stream_sample']
+        chunk = int(np.searchsorted(stream, position, side='right')) - 1
+        if chunk < 0:
+            return first
+        offset = position - int(stream[chunk])
+        if offset >= records['n_samples'][chunk]:
+            # In a gap: the next stored sample is the following chunk's first
+            if chunk + 1 < records.size:
+                return int(records['file_sample'][chunk + 1])
+            return last
+        return min(int(records['file_sample'][chunk]) + offset, last)
+
+    def window(self, start_s: float, stop_s: float, segment: int | None = None) -> dict:
+        """Stored samples between two stream times, without reading the rest.
+
+        Args:
+            start_s (float): Start time in seconds.
+            stop_s (float): Stop time in seconds.
+            segment (int, optional): Segment whose timeline the times refer
+                to. Required when the capture holds several segments.
+
+        Returns:
+            dict: ``{channel name: memmap slice}``. Samples lost to dropped
+            chunks inside the window are absent; see :meth:`time_axis`.
+        """
+        start = self.sample_index(start_s, segment)
+        stop = self.sample_index(stop_s, segment)
+        return {name: self[name][start:stop] for name in self.channels}
+
+    def time_axis(self, start: int | None = None, stop: int | None = None,
+                  segment: int | None = None) -> np.ndarray:
+        """Time in seconds of file samples ``start:stop`` within their segment.
+
+        ``start`` and ``stop`` default to the bounds of ``segment`` (or of the
+        whole capture for a single timeline).
+        """
+        first, last = self._bounds(self._records(segment))
+        start = first if start is None else start
+        stop = last if stop is None else min(stop, self.n_samples)
+        positions = self.stream_samples(np.arange(start, stop), segment)
+        return positions * (self.sample_interval_s or 0)
+
+    def to_volts(self, channel, data) -> np.ndarray:
+        """Convert stored ADC counts of ``channel`` to volts (probe scale applied)."""
+        limits = self.header.get('adc_limits')
+        if not limits:
+            raise PicoSDKException("Capture has no ADC limits for conversion")
+        info = self.header['channels'][self._name(channel)]
+        if info.get('digital'):
+            raise PicoSDKException("Digital port samples are logic levels, not volts")
+        scale = info['range_mv'] / 1000 * info['probe_scale'] / limits[1]
+        return np.asarray(data, dtype=np.float64) * scale
+
+
+__all__ = ['CaptureFile', 'CaptureWriter', 'save_capture']
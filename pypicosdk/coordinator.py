@@ -0,0 +1,197 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Streaming from several scopes on one thread.
+
+Each :class:`StreamingSession` paces its own polls, so iterating N sessions
+takes N threads. :class:`StreamingCoordinator` owns the sessions instead and
+polls them from the iterating thread, sleeping only until the next poll is
+due on any device. Driver calls release the GIL while the driver works, so
+one thread keeps several devices streaming and the aggregate rate grows with
+the number of devices.
+"""
+import time
+from collections import deque
+
+from .common import PicoSDKException
+
+
+class DeviceChunk:
+    """One chunk from one device of a :class:`StreamingCoordinator`.
+
+    Attributes:
+        device: Name of the device (session) that produced the chunk.
+        chunk (StreamingChunk): The session's chunk.
+    """
+
+    def __init__(self, device, chunk):
+        self.device = device
+        self.chunk = chunk
+
+    @property
+    def data(self) -> dict:
+        """The chunk's ``{output: np.ndarray}`` data."""
+        return self.chunk.data
+
+    @property
+    def start_index(self) -> dict:
+        """``{output: int}`` - stream sample index of each output's first sample."""
+        return self.chunk.start_index
+
+    @property
+    def timestamp_ns(self) -> int:
+        """``time.monotonic_ns()`` when the poll returned.
+
+        All devices share this clock, so chunks of different devices can be
+        correlated.
+        """
+        return self.chunk.timestamp_ns
+
+    @property
+    def sequence(self) -> int:
+        """Chunks delivered by this device before this one."""
+        return self.chunk.sequence
+
+    def release(self) -> None:
+        """Release the chunk's buffers (see :meth:`StreamingChunk.release`)."""
+        self.chunk.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class StreamingCoordinator:
+    """
+    Polls several streaming sessions from one thread.
+
+    Iterating the coordinator yields a :class:`DeviceChunk` per non-empty
+    poll of any device, tagged with the device name, the stream sample
+    index of each output and a host timestamp. Every driver call, including
+    the start and stop of each session, happens on the iterating thread.
+    Iteration ends once every session has finished (e.g. auto-stop) or
+    :meth:`stop` / :meth:`request_stop` is called.
+
+    Examples:
+        >>> coordinator = psdk.StreamingCoordinator({
+        ...     'rack1': psdk.StreamingSession(scope1, 100, 'ns'),
+        ...     'rack2': psdk.StreamingSession(scope2, 100, 'ns'),
+        ... })
+        >>> with coordinator:
+        ...     for item in coordinator:
+        ...         streams[item.device].append(item.data[psdk.CHANNEL.A])
+    """
+
+    def __init__(self, sessions: dict | list, schedule: str = 'ready'):
+        """
+        Args:
+            sessions (dict | list): ``{name: StreamingSession}``, or a list of
+                sessions named by their position.
+            schedule (str, optional): ``'ready'`` polls whichever session is
+                most overdue, honouring each session's own poll interval;
+                ``'round_robin'`` polls every session in turn once the first
+                is due. Defaults to ``'ready'``.
+
+        Raises:
+            PicoSDKException: If there are no sessions, a session appears
+                twice, or ``schedule`` is unknown.
+        """
+        if not isinstance(sessions, dict):
+            sessions = dict(enumerate(sessions))
+        if not sessions:
+            raise PicoSDKException("StreamingCoordinator needs at least one session")
+        if len({id(session) for session in sessions.values()}) < len(sessions):
+            raise PicoSDKException("Each session may only be added once")
+        if schedule not in ('ready', 'round_robin'):
+            raise PicoSDKException("schedule must be 'ready' or 'round_robin'")
+        self.sessions = sessions
+        self.schedule = schedule
+        self._active = dict(sessions)
+        self._pending = deque()
+        self._stop_requested = False
+        self._start_time = None
+        self._started = False
+
+    def start(self) -> None:
+        """Start every session, back to back. Called on first iteration."""
+        if self._started:
+            return
+        self._started = True
+        self._start_time = time.perf_counter()
+        for session in self.sessions.values():
+            session.start()
+
+    def stop(self) -> None:
+        """Stop every session. Must run on the iterating thread."""
+        self._stop_requested = True
+        for session in self.sessions.values():
+            session.stop()
+        self._active.clear()
+
+    def request_stop(self) -> None:
+        """Ask the iterating thread to stop every session; safe from any thread."""
+        self._stop_requested = True
+
+    def stats(self) -> dict:
+        """Aggregate throughput plus each session's :meth:`StreamingSession.stats`.
+
+        Returns:
+            dict: ``'msps'`` (all outputs of all devices, in MS/s since
+            :meth:`start`), ``'chunks'`` per device and ``'devices'``.
+        """
+        elapsed = time.perf_counter() - self._start_time if self._start_time else 0.0
+        total = sum(n for session in self.sessions.values()
+                    for n in session.total_samples.values())
+        return {
+            'elapsed_s': elapsed,
+            'msps': total / elapsed / 1e6 if elapsed else 0.0,
+            'chunks': {name: session.chunks_delivered
+                       for name, session in self.sessions.items()},
+            'devices': {name: session.stats() for name, session in self.sessions.items()},
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> DeviceChunk:
+        if not self._started and not self._stop_requested:
+            self.start()
+        while True:
+            if self._pending:
+                return self._pending.popleft()
+            if self._stop_requested:
+                self.stop()
+                raise StopIteration
+            if not self._active:
+                raise StopIteration
+            due = min(self._active.items(), key=lambda item: item[1].next_poll_time)
+            wait = due[1].next_poll_time - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            if self.schedule == 'ready':
+                self._poll(*due)
+            else:
+                for name, session in list(self._active.items()):
+                    self._poll(name, session)
+
+    def _poll(self, name, session) -> None:
+        """Poll one session and queue its chunk, if any."""
+        try:
+            chunk = session._poll_chunk()
+        except StopIteration:
+            del self._active[name]
+            return
+        if chunk is not None:
+            self._pending.append(DeviceChunk(name, chunk))
+
+
+__all__ = ['StreamingCoordinator', 'DeviceChunk']
@@ -0,0 +1,202 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Per-device driver executor: one worker thread owns every driver call for a
+PicoScope handle, fed by a command queue.
+
+Usage::
+
+    scope = psdk.ps6000a()
+    scope.open_unit()
+    executor = psdk.DriverExecutor(scope)
+
+    # From any thread: whole methods run on the worker, one at a time
+    future = executor.submit(scope.run_simple_block_capture, 3, 1000)
+    buffers, time_axis = future.result()
+
+    # A configuration sequence that no other command can interleave with
+    with executor.batch() as batch:
+        batch.submit(scope.set_channel, psdk.CHANNEL.A, psdk.RANGE.V1)
+        batch.submit(scope.set_simple_trigger, psdk.CHANNEL.A, threshold_mv=100)
+
+    executor.shutdown()
+
+While an executor is attached, a driver call made directly from any other
+thread (e.g. ``scope.ping_unit()`` from a GUI thread) is also routed onto
+the worker and waited for, so the handle is only ever used by one thread.
+Commands queued while the worker is busy are drained and run back to back
+on its next wake-up.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+from .common import PicoSDKException
+
+
+class _Batch:
+    """Commands collected by :meth:`DriverExecutor.batch`, queued as one unit on exit."""
+
+    def __init__(self, executor: 'DriverExecutor'):
+        self._executor = executor
+        self._commands = []
+
+    def submit(self, function, *args, **kwargs) -> Future:
+        """Add ``function(*args, **kwargs)`` to the batch.
+
+        Returns:
+            Future: Resolves once the batch has run on the worker.
+        """
+        future = Future()
+        self._commands.append((future, function, args, kwargs))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._executor._put(self._commands)
+        else:
+            for future, _, _, _ in self._commands:
+                future.cancel()
+
+
+class DriverExecutor:
+    """
+    Opt-in worker thread that serialises every driver call for one scope.
+
+    PicoScope driver handles are not meant to be driven from several threads
+    at once. Rather than locking the whole scope object, the executor pins
+    all access to a single worker thread: other threads submit commands and
+    receive ``concurrent.futures.Future`` objects, and never block each
+    other except while waiting on a result.
+
+    Commands run in submission order. Each command has its own future: an
+    exception raised by one command is set on its future and does not stop
+    the commands queued after it. A long command such as a block capture
+    occupies the worker until it returns.
+
+    Attributes:
+        commands_run (int): Commands completed by the worker.
+        wakeups (int): Times the worker woke to drain its queue. Fewer
+            wake-ups than commands means consecutive commands were batched.
+    """
+
+    def __init__(self, scope, name: str | None = None):
+        """
+        Args:
+            scope: An opened PicoScope driver instance (ps6000a, psospa or
+                ps5000a).
+            name (str, optional): Worker thread name. Defaults to
+                ``'<driver>-driver'``.
+
+        Raises:
+            PicoSDKException: If the scope already has an executor attached.
+        """
+        if scope._executor is not None:
+            raise PicoSDKException("This scope already has a DriverExecutor attached")
+        self.scope = scope
+        self.commands_run = 0
+        self.wakeups = 0
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=name or f'{scope._unit_prefix_n}-driver', daemon=True)
+        self._thread.start()
+        scope._executor = self
+
+    @property
+    def thread_id(self) -> int:
+        """Identifier of the worker thread (``threading.get_ident()`` on it)."""
+        return self._thread.ident
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def _put(self, commands: list) -> None:
+        if self._closed:
+            raise PicoSDKException("DriverExecutor has been shut down")
+        self._queue.put(commands)
+
+    def _run(self) -> None:
+        while True:
+            pending = [self._queue.get()]
+            # Drain everything queued meanwhile so consecutive commands run
+            # back to back in a single wake-up.
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.wakeups += 1
+            for commands in pending:
+                if commands is None:
+                    return
+                for future, function, args, kwargs in commands:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        result = function(*args, **kwargs)
+                    except BaseException as exc:  # pylint: disable=broad-exception-caught
+                        future.set_exception(exc)
+                    else:
+                        future.set_result(result)
+                    self.commands_run += 1
+
+    def submit(self, function, *args, **kwargs) -> Future:
+        """Queue ``function(*args, **kwargs)`` to run on the worker thread.
+
+        ``function`` is usually a scope method, e.g.
+        ``executor.submit(scope.get_values, 1000)``.
+
+        Returns:
+            Future: Resolves to the return value of ``function``.
+
+        Raises:
+            PicoSDKException: If the executor has been shut down.
+        """
+        future = Future()
+        self._put([(future, function, args, kwargs)])
+        return future
+
+    def call(self, function, *args, **kwargs):
+        """Run ``function(*args, **kwargs)`` on the worker and wait for its result.
+
+        Called from the worker thread itself, ``function`` runs immediately
+        instead of queueing behind the command that is making the call.
+        """
+        if threading.get_ident() == self._thread.ident:
+            return function(*args, **kwargs)
+        return self.submit(function, *args, **kwargs).result()
+
+    def batch(self) -> _Batch:
+        """Collect commands to be queued together and run without interleaving.
+
+        Returns:
+            _Batch: Context manager whose ``submit`` mirrors :meth:`submit`.
+            The batch is queued when the ``with`` block exits, and cancelled
+            if it exits with an exception.
+        """
+        return _Batch(self)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker after the commands already queued, and detach it.
+
+        Args:
+            wait (bool, optional): Block until the worker has finished.
+                Defaults to True.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        if wait and threading.get_ident() != self._thread.ident:
+            self._thread.join()
+        self.scope._executor = None
+
+
+__all__ = ['DriverExecutor']
@@ -49,6 +49,7 @@ class psospa(PicoScopeBase, shared_ps6000a_psospa):
         if resolution in resolution_map:
             resolution = resolution_map[resolution]
 
+        self._resolve_functions()
         if serial_number is not None:
             serial_number = serial_number.encode()
 
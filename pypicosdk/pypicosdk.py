@@ -10,7 +10,14 @@ from .ps6000a import ps6000a
 from .psospa import psospa
 from ._drivers._ps5000a import ps5000a
 from .base import PicoScopeBase
-from .streaming import StreamingSession, StreamingChunk
+from .streaming import StreamingSession, StreamingChunk, PollController, TriggerWindow
+from .software_trigger import SoftwareTrigger, EdgeTrigger, WindowTrigger
+from .coordinator import StreamingCoordinator, DeviceChunk
+from .shared_stream import SharedStreamRing, SharedStreamReader, SharedChunk
+from .simulator import SimulatedDriver
+from .executor import DriverExecutor
+from .recording import Recording
+from .capture_file import CaptureFile, CaptureWriter, save_capture
 from .common import (
     PicoSDKException,
     PicoSDKNotFoundException,
@@ -148,5 +155,21 @@ __all__ = list(_constants.__all__) + [
     'ps5000a',
     'StreamingSession',
     'StreamingChunk',
+    'PollController',
+    'TriggerWindow',
+    'SoftwareTrigger',
+    'EdgeTrigger',
+    'WindowTrigger',
+    'StreamingCoordinator',
+    'DeviceChunk',
+    'SharedStreamRing',
+    'SharedStreamReader',
+    'SharedChunk',
+    'SimulatedDriver',
+    'DriverExecutor',
+    'Recording',
+    'CaptureFile',
+    'CaptureWriter',
+    'save_capture',
     '__version__',
 ]
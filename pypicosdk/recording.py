@@ -0,0 +1,354 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Streaming-to-disk recorder for :class:`StreamingSession`.
+
+The iterating thread hands each chunk to a bounded queue; a background
+writer thread appends it to a capture file set (see :mod:`capture_file`):
+one raw binary file per channel, a chunk index and a JSON header.
+
+Usage::
+
+    with psdk.StreamingSession(scope, sample_interval=3.2, time_units='ns',
+                               datatype=psdk.DATA_TYPE.INT8_T) as stream:
+        recording = stream.record('capture.bin', duration=4)
+    print(recording.stats())
+
+Output for ``capture.bin`` with channels A and B::
+
+    capture_A.bin            raw samples of channel A (load with np.fromfile)
+    capture_B.bin            raw samples of channel B
+    capture_index.bin        chunk index (stream position, arrival time, flags)
+    capture_metadata.json    interval, dtype, ranges, probe scale, counters
+
+AGGREGATE/DISTRIBUTION streams store each envelope as its own stream,
+``capture_A_min.bin`` and ``capture_A_max.bin``. A session with several
+``outputs`` records one ratio mode of them, RAW by default.
+
+Read it back with ``psdk.CaptureFile('capture.bin')``.
+"""
+import os
+import queue
+import threading
+import time
+
+from .constants import RATIO_MODE
+from .common import PicoSDKException
+from .capture_file import (
+    CaptureWriter,
+    adc_limits,
+    channel_header,
+    channel_name,
+    FLAG_AUTO_STOPPED,
+    FLAG_OVERRANGE,
+    FLAG_TRIGGERED,
+)
+
+# RATIO_MODE is a plain class of ints; map values back to names (first wins
+# over the deprecated alias).
+_RATIO_MODE_NAMES = {}
+for _name, _value in vars(RATIO_MODE).items():
+    if _name.isupper():
+        _RATIO_MODE_NAMES.setdefault(_value, _name)
+
+
+class Recording:
+    """
+    Writes :class:`StreamingChunk` objects to disk on a background thread.
+
+    :meth:`StreamingSession.record` drives a recording for you. To keep
+    control of the loop (e.g. to print the live counters), drive one
+    directly::
+
+        recording = psdk.Recording(stream, 'capture.bin')
+        recording.start()
+        for chunk in stream:
+            recording.write(chunk)
+            ...
+        recording.close()
+
+    Backpressure is explicit. When the writer falls ``queue_size`` chunks
+    behind, :meth:`write` either drops the chunk (the default, counted in
+    ``dropped_chunks`` / ``dropped_samples`` and listed as a gap in the
+    sidecar) or, with ``block=True``, waits for the writer, leaving the
+    driver buffers to absorb the delay.
+
+    Chunks from a ``zero_copy`` or pooled session are released once written
+    (or dropped), so the writer works straight from the driver buffers or
+    pooled arrays without an extra copy. With ``zero_copy`` a slow writer
+    also holds back buffer rotation, shown by ``session.lease_stalls``.
+
+    The counters are plain attributes, each updated by a single thread, so
+    another thread may read them (or call :meth:`stats`) at any time.
+
+    Attributes:
+        chunks_received (int): Chunks passed to :meth:`write`.
+        samples_received (int): Samples per channel passed to :meth:`write`.
+        samples_written (int): Samples per channel written to disk.
+        bytes_written (int): Bytes written to disk across all channels.
+        dropped_chunks (int): Chunks dropped because the queue was full.
+        dropped_samples (int): Samples per channel in the dropped chunks.
+        blocked_s (float): Time :meth:`write` spent waiting for queue space.
+    """
+
+    def __init__(
+        self,
+        session,
+        path: str,
+        queue_size: int = 64,
+        block: bool = False,
+        ratio_mode: int | None = None,
+    ):
+        """
+        Args:
+            session (StreamingSession): Session whose chunks are recorded.
+            path (str): Output path, e.g. ``'capture.bin'``. Channel files
+                and the sidecar are named from its stem.
+            queue_size (int, optional): Chunks the writer may fall behind
+                before backpressure applies. Defaults to 64.
+            block (bool, optional): Wait for queue space instead of dropping
+                chunks. Defaults to False.
+            ratio_mode (RATIO_MODE, optional): Output to record from a
+                session with several ``outputs``. Defaults to the session's
+                only mode, or RAW when it streams several.
+
+        Raises:
+            PicoSDKException: If ``queue_size`` is less than 1, or
+                ``ratio_mode`` is not one of the session's outputs.
+        """
+        if queue_size < 1:
+            raise PicoSDKException("queue_size must be >= 1")
+        modes = {mode for _, mode in session.outputs.values()}
+        if ratio_mode is None:
+            ratio_mode = next(iter(modes)) if len(modes) == 1 else RATIO_MODE.RAW
+        if ratio_mode not in modes:
+            raise PicoSDKException(
+                "Pass the ratio_mode to record; the session streams "
+                f"{sorted(_RATIO_MODE_NAMES[mode] for mode in modes)}")
+        self.ratio_mode = ratio_mode
+        # Session outputs of the recorded mode -> their channel
+        self._outputs = {key: ch for key, (ch, mode) in session.outputs.items()
+                         if mode == ratio_mode}
+        self.session = session
+        self.path = os.fspath(path)
+        self.files: dict = {}           # channel -> data file, set by start()
+        self.metadata_path: str | None = None
+        self.queue_size = queue_size
+        self.block = block
+
+        self.chunks_received = 0
+        self.samples_received = 0
+        self.samples_written = 0
+        self.bytes_written = 0
+        self.dropped_chunks = 0
+        self.dropped_samples = 0
+        self.blocked_s = 0.0
+        self.gaps: list = []            # [stream sample index, samples dropped]
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._writer = None
+        self._thread = None
+        self._error = None
+        self._start_time = None
+        self._end_time = None
+        self._sources: dict = {}        # capture stream -> (output, envelope row)
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def start(self) -> None:
+        """Open the capture files and start the writer thread.
+
+        Starts the session first if needed, so the header records the
+        driver's actual sample interval.
+        """
+        if self._thread is not None:
+            return
+        session = self.session
+        session.start()
+        dtype = session._np_dtype  # pylint: disable=protected-access
+        header = channel_header(session.scope, list(self._outputs.values()))
+        channels = {}
+        for key, ch in self._outputs.items():
+            if self.ratio_mode in session._PAIRED_RATIO_MODES:  # pylint: disable=protected-access
+                for row, envelope in enumerate(('min', 'max')):
+                    label = f'{channel_name(ch)}_{envelope}'
+                    self._sources[label] = (key, row)
+                    channels[label] = {**header[ch], 'envelope': envelope}
+            else:
+                self._sources[ch] = (key, None)
+                channels[ch] = header[ch]
+        self._writer = CaptureWriter(
+            self.path, channels, dtype,
+            self._output_interval_s(), adc_limits(session.scope, dtype),
+            self._stream_metadata())
+        self.files = self._writer.files
+        self.metadata_path = self._writer.header_path
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name='pypicosdk-recorder', daemon=True)
+        self._thread.start()
+
+    def close(self) -> dict:
+        """Drain the queue, stop the writer and write the metadata sidecar.
+
+        Returns:
+            dict: The header written to the sidecar.
+
+        Raises:
+            PicoSDKException: If the writer thread failed.
+        """
+        if self._thread is None:
+            raise PicoSDKException("Recording was never started")
+        if self._end_time is None:
+            self._queue.put(None)
+            self._thread.join()
+            self._end_time = time.perf_counter()
+        metadata = self._writer.close(**self._counters())
+        if self._error is not None:
+            raise PicoSDKException(f"Recording writer failed: {self._error}") from self._error
+        return metadata
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    # -- acquisition side ---------------------------------------------------
+
+    def write(self, chunk) -> bool:
+        """Queue a chunk for writing. Call from the thread iterating the session.
+
+        Args:
+            chunk (StreamingChunk): Chunk to record.
+
+        Returns:
+            bool: False if the chunk was dropped because the queue was full.
+
+        Raises:
+            PicoSDKException: If the writer thread has failed.
+        """
+        if self._error is not None:
+            raise PicoSDKException(f"Recording writer failed: {self._error}") from self._error
+        n = self._n_samples(chunk)
+        position = self.samples_received
+        self.chunks_received += 1
+        self.samples_received += n
+        item = (chunk, position, time.monotonic_ns())
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        if self.block:
+            start = time.perf_counter()
+            self._queue.put(item)
+            self.blocked_s += time.perf_counter() - start
+            return True
+        self.dropped_chunks += 1
+        self.dropped_samples += n
+        self.gaps.append([position, n])
+        chunk.release()
+        return False
+
+    # -- writer thread ------------------------------------------------------
+
+    def _run(self) -> None:
+        writer = self._writer
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            chunk, position, monotonic_ns = item
+            if self._error is not None:
+                chunk.release()
+                continue
+            try:
+                flags = ((FLAG_TRIGGERED if chunk.triggered else 0)
+                         | (FLAG_AUTO_STOPPED if chunk.auto_stopped else 0)
+                         | (FLAG_OVERRANGE if chunk.overflowed else 0))
+                data = {name: chunk.data[key] if row is None else chunk.data[key][row]
+                        for name, (key, row) in self._sources.items()}
+                self.bytes_written += writer.append(data, position, monotonic_ns, flags)
+                self.samples_written += self._n_samples(chunk)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Keep draining the queue so producers never block on it
+                self._error = exc
+            finally:
+                chunk.release()
+
+    def _n_samples(self, chunk) -> int:
+        """Samples per channel of the recorded output in ``chunk``."""
+        return max((chunk.data[key].shape[-1] for key in self._outputs), default=0)
+
+    # -- reporting ----------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        """Chunks waiting for the writer."""
+        return self._queue.qsize()
+
+    @property
+    def elapsed_s(self) -> float:
+        """Seconds since :meth:`start` (frozen by :meth:`close`)."""
+        if self._start_time is None:
+            return 0.0
+        end = self._end_time if self._end_time is not None else time.perf_counter()
+        return end - self._start_time
+
+    def stats(self) -> dict:
+        """Snapshot of the live counters, with average throughputs.
+
+        Returns:
+            dict: Counters plus ``'write_mb_per_s'`` (disk bytes) and
+            ``'msamples_per_s'`` (samples per channel received).
+        """
+        elapsed = self.elapsed_s
+        return {
+            'elapsed_s': elapsed,
+            'chunks_received': self.chunks_received,
+            'samples_received': self.samples_received,
+            'samples_written': self.samples_written,
+            'bytes_written': self.bytes_written,
+            'dropped_chunks': self.dropped_chunks,
+            'dropped_samples': self.dropped_samples,
+            'queue_depth': self.queue_depth,
+            'blocked_s': self.blocked_s,
+            'write_mb_per_s': self.bytes_written / elapsed / 1e6 if elapsed else 0.0,
+            'msamples_per_s': self.samples_received / elapsed / 1e6 if elapsed else 0.0,
+        }
+
+    def _output_interval_s(self) -> float | None:
+        """Seconds between stored samples (the driver interval times the ratio)."""
+        session = self.session
+        if session.actual_sample_interval is None:
+            return None
+        return session.actual_sample_interval / session.time_units * self._ratio()
+
+    def _ratio(self) -> int:
+        if self.ratio_mode in (RATIO_MODE.RAW, RATIO_MODE.NONE):
+            return 1
+        return self.session.ratio
+
+    def _stream_metadata(self) -> dict:
+        """Header entries describing the stream configuration."""
+        interval_s = self._output_interval_s()
+        return {
+            'ratio_mode': _RATIO_MODE_NAMES[self.ratio_mode],
+            'ratio': self._ratio(),
+            'sample_rate_hz': 1 / interval_s if interval_s else None,
+        }
+
+    def _counters(self) -> dict:
+        """Header entries recording the outcome, written on close."""
+        return {
+            'dropped_samples': self.dropped_samples,
+            'gaps': self.gaps,
+            'duration_s': round(self.elapsed_s, 6),
+            'total_bytes': self.bytes_written,
+        }
+
+
+__all__ = ['Recording']
@@ -730,6 +730,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
             ctypes.c_uint64(n_samples),
             ctypes.byref(max_segments),
         )
+        self.base_dataclass.last_memory_segments = max_segments.value
         return max_segments.value
 
     def query_max_segments_by_samples(
@@ -814,7 +815,7 @@ class shared_ps6000a_psospa(_ProtocolBase):
             hysteresis: Hysteresis level applied to all pins (ps6000a only;
                 ignored with a warning on psospa).
         """
-        if not logic_threshold_level:
+        if logic_threshold_level is not None and not logic_threshold_level:
             raise PicoSDKException(
                 "logic_threshold_level must contain at least one value")
 
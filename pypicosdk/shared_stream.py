@@ -0,0 +1,402 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Streaming to worker processes through shared memory.
+
+Analysis code on the iterating thread competes with the polling loop for
+the GIL. A :class:`StreamingSession` created with ``shared_memory=N``
+publishes every chunk into a :class:`SharedStreamRing` instead: a
+``multiprocessing.shared_memory`` segment holding an N-sample ring per
+output plus a table of chunk descriptors (sequence, ring position, length,
+stream index). Worker processes attach a :class:`SharedStreamReader` from
+the picklable :attr:`SharedStreamRing.spec` and read samples in place -
+nothing is pickled or copied between processes, so acquisition and
+processing scale across cores.
+
+The writer never waits for readers. A reader that falls more than one ring
+behind loses chunks; it counts them in :attr:`SharedStreamReader.missed`
+and :meth:`SharedChunk.valid` reports whether a chunk's samples were
+overwritten while it was being processed.
+"""
+import sys
+import time
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+from .common import PicoSDKException
+
+_ALIGN = 64                 # byte alignment of every array in a segment
+_HEADER = 4                 # published, finished, capacity, descriptors
+_PUBLISHED, _FINISHED = 0, 1
+
+
+class _Segment(SharedMemory):
+    """SharedMemory whose ``close`` tolerates live NumPy views.
+
+    The mapping is then released when the last view is garbage collected,
+    instead of ``close`` (or ``__del__``) raising BufferError.
+    """
+
+    def close(self):
+        try:
+            super().close()
+        except BufferError:
+            pass
+
+
+def _attach(name: str) -> _Segment:
+    """Attach an existing segment without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return _Segment(name=name, track=False)
+    # Before 3.13 attaching registers the segment with the resource tracker,
+    # which would unlink the writer's segment when this process exits.
+    segment = _Segment(name=name)
+    try:
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+    return segment
+
+
+def _release(segment: SharedMemory) -> None:
+    """Close and unlink a segment this process created."""
+    segment.close()
+    if sys.version_info < (3, 13):
+        # A reader sharing this process's tracker may have unregistered the
+        # segment; register it again so unlink's unregister balances.
+        resource_tracker.register(segment._name, 'shared_memory')
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _ALIGN) * _ALIGN
+
+
+def _layout(spec: dict) -> tuple:
+    """Byte offsets of the header, write positions, descriptors and rings."""
+    outputs = spec['outputs']
+    itemsize = np.dtype(spec['dtype']).itemsize
+    offset = _aligned(_HEADER * 8)
+    positions = offset
+    offset += _aligned(len(outputs) * 8)
+    descriptors = offset
+    offset += _aligned(spec['descriptors'] * (2 + 3 * len(outputs)) * 8)
+    rings = []
+    for planes in spec['planes']:
+        rings.append(offset)
+        offset += _aligned(planes * spec['capacity'] * itemsize)
+    return positions, descriptors, rings, offset
+
+
+class _SegmentArrays:
+    """NumPy views of a ring segment, shared by the writer and readers."""
+
+    def __init__(self, segment: SharedMemory, spec: dict):
+        n_outputs = len(spec['outputs'])
+        positions, descriptors, rings, _ = _layout(spec)
+        buf = segment.buf
+        self.header = np.ndarray((_HEADER,), np.int64, buf)
+        self.positions = np.ndarray((n_outputs,), np.int64, buf, positions)
+        self.descriptors = np.ndarray(
+            (spec['descriptors'], 2 + 3 * n_outputs), np.int64, buf, descriptors)
+        self.rings = [np.ndarray((planes, spec['capacity']), spec['dtype'], buf, offset)
+                      for planes, offset in zip(spec['planes'], rings)]
+
+
+class SharedStreamRing:
+    """
+    Writer side of a shared memory stream: per-output sample rings plus a
+    descriptor table, written by the iterating thread once per chunk.
+
+    Each output's samples are appended at an absolute ring position; the
+    samples of a chunk always sit contiguously at
+    ``position % capacity``, wrapping to the start of the ring early rather
+    than splitting. The write position is advanced before samples are
+    overwritten, so a reader that re-checks it after processing knows
+    whether its samples survived.
+    """
+
+    def __init__(self, planes: dict, capacity: int, dtype, descriptors: int = 1024):
+        """
+        Args:
+            planes (dict): ``{output: 1, or 2 for min/max pairs}``.
+            capacity (int): Samples per output ring. Must hold at least two
+                of the largest chunks for readers to keep up.
+            dtype: Sample dtype.
+            descriptors (int, optional): Chunk descriptors kept for readers
+                that fall behind. Defaults to 1024.
+
+        Raises:
+            PicoSDKException: If ``capacity`` or ``descriptors`` is below 1.
+        """
+        if capacity < 1 or descriptors < 1:
+            raise PicoSDKException("capacity and descriptors must be >= 1")
+        self.outputs = list(planes)
+        self.capacity = capacity
+        self._spec = {
+            'outputs': self.outputs,
+            'planes': [planes[key] for key in self.outputs],
+            'capacity': capacity,
+            'dtype': np.dtype(dtype).str,
+            'descriptors': descriptors,
+        }
+        self._segment = _Segment(create=True, size=_layout(self._spec)[3])
+        self._finalizer = weakref.finalize(self, _release, self._segment)
+        self._spec['name'] = self._segment.name
+        self._arrays = _SegmentArrays(self._segment, self._spec)
+        self._arrays.header[:] = (0, 0, capacity, descriptors)
+        self._arrays.positions[:] = 0
+        self._arrays.descriptors[:, 0] = -1
+
+    @property
+    def spec(self) -> dict:
+        """Picklable description a :class:`SharedStreamReader` attaches with."""
+        return dict(self._spec)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        return self._spec['name']
+
+    @property
+    def published(self) -> int:
+        """Chunks written so far."""
+        return int(self._arrays.header[_PUBLISHED])
+
+    def write(self, data: dict, start_index: dict, timestamp_ns: int) -> int:
+        """Publish one chunk (single writer).
+
+        Args:
+            data (dict): ``{output: np.ndarray}`` as delivered in a chunk.
+            start_index (dict): ``{output: int}`` stream index of each
+                output's first sample.
+            timestamp_ns (int): Host timestamp of the chunk.
+
+        Returns:
+            int: The chunk's sequence number.
+
+        Raises:
+            PicoSDKException: If an output's chunk is longer than the ring.
+        """
+        arrays = self._arrays
+        capacity = self.capacity
+        places = []
+        # Reserve every output's span first: a reader that sees the new
+        # write position knows the old samples there are going.
+        for i, key in enumerate(self.outputs):
+            samples = data.get(key)
+            n = 0 if samples is None else samples.shape[-1]
+            if n > capacity:
+                raise PicoSDKException(
+                    f"A chunk of {n} samples does not fit a shared ring of {capacity}")
+            position = int(arrays.positions[i])
+            if position % capacity + n > capacity:
+                position += capacity - position % capacity
+            arrays.positions[i] = position + n
+            places.append((position, n))
+        for i, key in enumerate(self.outputs):
+            position, n = places[i]
+            if n:
+                offset = position % capacity
+                arrays.rings[i][:, offset:offset + n] = data[key].reshape(-1, n)
+        sequence = int(arrays.header[_PUBLISHED])
+        row = arrays.descriptors[sequence % len(arrays.descriptors)]
+        row[0] = -1
+        row[1] = timestamp_ns
+        for i, key in enumerate(self.outputs):
+            row[2 + 3 * i:5 + 3 * i] = places[i] + (start_index.get(key, 0),)
+        row[0] = sequence
+        arrays.header[_PUBLISHED] = sequence + 1
+        return sequence
+
+    def finish(self) -> None:
+        """Tell readers no more chunks follow; they end once drained."""
+        self._arrays.header[_FINISHED] = 1
+
+    def close(self) -> None:
+        """Finish and unlink the segment. Attached readers keep their mapping."""
+        if self._arrays is None:
+            return
+        self.finish()
+        self._arrays = None
+        self._finalizer()
+
+
+class SharedChunk:
+    """One chunk read from a :class:`SharedStreamReader`.
+
+    Attributes:
+        data (dict): ``{output: np.ndarray}`` read-only views into the shared
+            ring, shaped like :attr:`StreamingChunk.data`. Valid until the
+            writer wraps around to them; see :meth:`valid`.
+        sequence (int): Chunks published before this one.
+        timestamp_ns (int): ``time.monotonic_ns()`` when the writer polled.
+        start_index (dict): ``{output: int}`` stream index of each output's
+            first sample.
+        offset (dict): ``{output: int}`` ring offset of each output's first
+            sample.
+    """
+
+    def __init__(self, reader, data, sequence, timestamp_ns, start_index, offset, positions):
+        self.data = data
+        self.sequence = sequence
+        self.timestamp_ns = timestamp_ns
+        self.start_index = start_index
+        self.offset = offset
+        self._reader = reader
+        self._positions = positions
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples per output in this chunk (max across outputs)."""
+        if not self.data:
+            return 0
+        return max(arr.shape[-1] for arr in self.data.values())
+
+    def valid(self) -> bool:
+        """True while the writer has not started overwriting these samples.
+
+        Check after processing: results computed from a chunk that is no
+        longer valid may mix in newer samples.
+        """
+        return self._reader._intact(self._positions)
+
+
+class SharedStreamReader:
+    """
+    Reader side of a :class:`SharedStreamRing`, for use in any process.
+
+    Examples:
+        >>> def worker(spec):
+        ...     with psdk.SharedStreamReader(spec) as reader:
+        ...         for chunk in reader.chunks():
+        ...             analyse(chunk.data[psdk.CHANNEL.A])
+        >>> session = psdk.StreamingSession(scope, 100, 'ns', shared_memory=2_000_000)
+        >>> multiprocessing.Process(target=worker, args=(session.shared.spec,)).start()
+        >>> for chunk in session: ...
+    """
+
+    def __init__(self, spec: dict, start: str = 'oldest'):
+        """
+        Args:
+            spec (dict): :attr:`SharedStreamRing.spec`.
+            start (str, optional): ``'oldest'`` begins at the first chunk
+                still held by the writer, ``'newest'`` at the next chunk
+                published. Defaults to ``'oldest'``.
+
+        Raises:
+            PicoSDKException: If ``start`` is unknown.
+        """
+        if start not in ('oldest', 'newest'):
+            raise PicoSDKException("start must be 'oldest' or 'newest'")
+        self.outputs = list(spec['outputs'])
+        self.capacity = spec['capacity']
+        self._planes = spec['planes']
+        self._segment = _attach(spec['name'])
+        self._arrays = _SegmentArrays(self._segment, spec)
+        for ring in self._arrays.rings:
+            ring.flags.writeable = False
+        published = self.published
+        self.next_sequence = (max(published - len(self._arrays.descriptors), 0)
+                              if start == 'oldest' else published)
+        self.missed = 0     # chunks overwritten before this reader got to them
+
+    @property
+    def published(self) -> int:
+        """Chunks the writer has published."""
+        return int(self._arrays.header[_PUBLISHED])
+
+    @property
+    def finished(self) -> bool:
+        """True once the writer finished and every chunk has been read."""
+        return bool(self._arrays.header[_FINISHED]) and self.next_sequence >= self.published
+
+    def _intact(self, positions: tuple) -> bool:
+        arrays_positions = self._arrays.positions
+        return all(arrays_positions[i] <= position + self.capacity
+                   for i, position in enumerate(positions))
+
+    def _read(self, sequence: int) -> SharedChunk | None:
+        row = self._arrays.descriptors[sequence % len(self._arrays.descriptors)]
+        values = row.copy()
+        if values[0] != sequence or row[0] != sequence:
+            return None
+        positions = tuple(int(p) for p in values[2::3])
+        if not self._intact(positions):
+            return None
+        data, start_index, offset = {}, {}, {}
+        for i, key in enumerate(self.outputs):
+            position, n, first = (int(v) for v in values[2 + 3 * i:5 + 3 * i])
+            ring = self._arrays.rings[i]
+            start = position % self.capacity
+            data[key] = (ring[:, start:start + n] if self._planes[i] > 1
+                         else ring[0, start:start + n])
+            start_index[key] = first
+            offset[key] = start
+        return SharedChunk(self, data, sequence, int(values[1]), start_index, offset, positions)
+
+    def poll(self) -> list:
+        """Every chunk published since the last call, oldest first.
+
+        Returns:
+            list[SharedChunk]: The new chunks; lost ones are skipped and
+            counted in :attr:`missed`.
+        """
+        published = self.published
+        oldest = published - len(self._arrays.descriptors)
+        if self.next_sequence < oldest:
+            self.missed += oldest - self.next_sequence
+            self.next_sequence = oldest
+        chunks = []
+        for sequence in range(self.next_sequence, published):
+            chunk = self._read(sequence)
+            if chunk is None:
+                self.missed += 1
+            else:
+                chunks.append(chunk)
+        self.next_sequence = published
+        return chunks
+
+    def chunks(self, poll_interval: float = 0.001, timeout: float | None = None):
+        """Yield chunks as they are published until the writer finishes.
+
+        Args:
+            poll_interval (float, optional): Seconds to sleep when no chunk
+                is waiting. Defaults to 0.001.
+            timeout (float, optional): Give up after this many seconds
+                without a new chunk. Defaults to None (wait for the writer).
+
+        Yields:
+            SharedChunk: Each chunk, in order.
+        """
+        last = time.monotonic()
+        while True:
+            chunks = self.poll()
+            if chunks:
+                last = time.monotonic()
+                yield from chunks
+                continue
+            if self.finished:
+                return
+            if timeout is not None and time.monotonic() - last > timeout:
+                return
+            time.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Detach from the segment (never unlinks it)."""
+        self._arrays = None
+        self._segment.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+__all__ = ['SharedStreamRing', 'SharedStreamReader', 'SharedChunk']
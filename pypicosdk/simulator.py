@@ -0,0 +1,928 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Simulated PicoSDK driver for hardware-free testing and benchmarking.
+
+`SimulatedDriver` stands in for the loaded driver library of a ps6000a,
+psospa or ps5000a. Pass it as ``dll=`` when creating the scope and every
+driver call the wrapper makes is served in Python instead of by a PicoScope:
+
+ - ``scope = psdk.ps6000a(dll=psdk.SimulatedDriver(sample_rate=1e9))``
+ - ``scope.open_unit()`` and configure channels as normal
+ - block, rapid block and streaming captures fill the registered numpy
+   buffers with a synthetic, per-channel periodic signal
+
+Captures are paced in wall-clock time at the interval the scope requested
+(or ``sample_rate`` if given), and each data transfer call can be charged a
+fixed latency plus a per-sample cost to model the USB link. Calls the
+simulator does not implement raise AttributeError when the wrapper first
+looks them up, as a missing export in an older driver would.
+"""
+# pylint: disable=invalid-name
+
+import collections
+import ctypes
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from . import constants as cst
+from .common import PicoSDKException
+
+# Status codes the simulator returns
+_PICO_OK = 0
+_PICO_BUSY = 39
+_PICO_WAITING_FOR_DATA_BUFFERS = 407
+
+# Driver families and the variant each one reports
+_VARIANTS = {
+    'ps6000a': '6424E',
+    'psospa': '3417E',
+    'ps5000a': '5444D',
+}
+
+# Modes that reduce `ratio` raw samples to one output value
+_DOWNSAMPLED_MODES = (
+    cst.RATIO_MODE.AGGREGATE,
+    cst.RATIO_MODE.DECIMATE,
+    cst.RATIO_MODE.AVERAGE,
+    cst.RATIO_MODE.DISTRIBUTION,
+    cst.RATIO_MODE.SUM,
+)
+
+
+def _value(arg):
+    """Return the Python value of a by-value argument (int, enum or ctypes scalar)."""
+    return getattr(arg, 'value', arg)
+
+
+def _deref(arg):
+    """Return the ctypes object behind a ``ctypes.byref()`` argument."""
+    return getattr(arg, '_obj', arg)
+
+
+def _address(pointer) -> int | None:
+    """Return the address a buffer argument points to, or None for NULL."""
+    if pointer is None:
+        return None
+    pointer = _deref(pointer)
+    if isinstance(pointer, int):
+        return pointer or None
+    if isinstance(pointer, ctypes.c_void_p):
+        return pointer.value
+    if isinstance(pointer, ctypes._Pointer):  # pylint: disable=protected-access
+        return ctypes.cast(pointer, ctypes.c_void_p).value
+    return ctypes.addressof(pointer)
+
+
+def _array_at(address: int, samples: int, dtype) -> np.ndarray:
+    """Writeable numpy view of ``samples`` elements of ``dtype`` at ``address``."""
+    dtype = np.dtype(dtype)
+    raw = (ctypes.c_char * (samples * dtype.itemsize)).from_address(address)
+    return np.frombuffer(raw, dtype=dtype, count=samples)
+
+
+def _mode_key(mode) -> int:
+    """Normalise a ratio mode to its unsigned 32-bit value (RAW arrives signed)."""
+    return int(_value(mode)) & 0xFFFFFFFF
+
+
+def _ratio_for(mode: int, ratio: int) -> int:
+    """Raw samples per output value for a registered ratio mode."""
+    if mode in _DOWNSAMPLED_MODES:
+        return max(1, int(ratio))
+    return 1
+
+
+@dataclass
+class _Registration:
+    "A buffer (or max/min pair) registered with SetDataBuffer(s)"
+    channel: int
+    segment: int
+    mode: int
+    buffer_max: np.ndarray
+    buffer_min: np.ndarray | None = None
+    index: int = 0
+    filled: int = 0
+
+
+@dataclass
+class _BlockCapture:
+    "State of the last RunBlock call"
+    pre_samples: int
+    post_samples: int
+    interval_s: float
+    first_segment: int
+    n_captures: int
+    ready_at: float
+    timer: threading.Timer | None = None
+    data_timer: threading.Timer | None = None
+
+    @property
+    def samples(self) -> int:
+        """Raw samples per capture."""
+        return self.pre_samples + self.post_samples
+
+
+@dataclass
+class _StreamState:
+    "State of the last RunStreaming call"
+    start_time: float
+    rate: float
+    mode: int
+    ratio: int
+    pre_samples: int
+    post_samples: int
+    auto_stop: bool
+    overview_size: int = 0
+    stop_time: float | None = None
+    queues: dict = field(default_factory=dict)
+    delivered: dict = field(default_factory=dict)
+    triggered: bool = False
+    auto_stopped: bool = False
+
+    def ratio_of(self, key: tuple) -> int:
+        """Raw samples per output value of a ``(channel, mode)`` queue."""
+        return _ratio_for(key[1], self.ratio)
+
+
+class SimulatedDriver:
+    """
+    Python stand-in for a loaded ps6000a, psospa or ps5000a driver library.
+
+    The driver family is taken from the prefix of the first function the
+    scope looks up, so one instance serves exactly one scope.
+
+    Examples:
+        >>> sim = psdk.SimulatedDriver(sample_rate=500e6, transfer_cost=0.5e-9)
+        >>> scope = psdk.ps6000a(dll=sim)
+        >>> scope.open_unit()
+        >>> scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+        >>> buffers, time_axis = scope.run_simple_block_capture(timebase=5, samples=1000)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float | None = None,
+        call_latency: float = 0.0,
+        transfer_cost: float = 0.0,
+        n_channels: int = 4,
+        max_memory: int = 1 << 30,
+        signal_period: int = 1000,
+        callback_samples: int | None = None,
+    ):
+        """
+        Args:
+            sample_rate (float, optional): Rate in samples per second at which
+                captures produce data. Defaults to None, which honours the
+                interval the scope configured (timebase or streaming interval).
+            call_latency (float, optional): Seconds added to every data
+                transfer call (GetValues, GetValuesBulk,
+                GetStreamingLatestValues). Defaults to 0.
+            transfer_cost (float, optional): Seconds added per sample written
+                into host buffers. Defaults to 0.
+            n_channels (int, optional): Number of analog channels. Defaults to 4.
+            max_memory (int, optional): Capture memory in samples, shared
+                between segments. Defaults to 2**30.
+            signal_period (int, optional): Period in samples of the synthetic
+                signal. Defaults to 1000.
+            callback_samples (int, optional): ps5000a only: the most samples
+                one StreamingReady callback reports. Larger deliveries, and
+                deliveries wrapping the overview buffer, arrive as several
+                callbacks during one GetStreamingLatestValues call. Defaults
+                to None (one callback per call, up to the buffer end).
+        """
+        if sample_rate is not None and sample_rate <= 0:
+            raise PicoSDKException("sample_rate must be positive")
+        self.sample_rate = sample_rate
+        self.call_latency = call_latency
+        self.transfer_cost = transfer_cost
+        self.n_channels = n_channels
+        self.max_memory = max_memory
+        self.signal_period = signal_period
+        self.callback_samples = callback_samples
+        self.family: str | None = None
+        self.dropped_samples = 0
+
+        self._resolution = 0
+        self._max_adc = 32512
+        self._signals: dict[int, np.ndarray] = {}
+        self._user_signals: set[int] = set()
+        self._signal_cache: dict = {}
+        self._n_segments = 1
+        self._enabled: set[int] = set()
+        self._registrations: list[_Registration] = []
+        self._next_index: collections.Counter = collections.Counter()
+        self._n_captures = 1
+        self._block: _BlockCapture | None = None
+        self._stream: _StreamState | None = None
+        self._trigger_enabled = False
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not found normally, i.e. prefixed driver
+        # function names such as 'ps6000aRunBlock'.
+        for prefix in _VARIANTS:
+            if name.startswith(prefix):
+                break
+        else:
+            raise AttributeError(name)
+        if self.family is None:
+            self.family = prefix
+        elif self.family != prefix:
+            raise PicoSDKException(
+                f"SimulatedDriver is already serving a {self.family} scope")
+        function_name = name[len(prefix):]
+        if not function_name or function_name[0].islower():
+            raise AttributeError(name)
+        return getattr(self, function_name)
+
+    # -- signal ---------------------------------------------------------------
+
+    def set_signal(self, channel: int, samples: np.ndarray) -> None:
+        """
+        Replace the synthetic signal of a channel with one period of ADC counts.
+
+        The period repeats for the whole capture. Values at or beyond the ADC
+        limits are reported to the scope as an over-range on that channel.
+        For a digital port the samples are line states, one bit per line.
+
+        Args:
+            channel (int): Channel or digital port to set.
+            samples (np.ndarray): One period of the signal in 16-bit ADC counts.
+        """
+        samples = np.asarray(samples, dtype=np.int16)
+        if samples.size == 0:
+            raise PicoSDKException("Signal needs at least one sample")
+        self._signals[int(channel)] = samples
+        self._user_signals.add(int(channel))
+        self._signal_cache.clear()
+
+    def _signal(self, channel: int) -> np.ndarray:
+        """One period of int16 counts for a channel (a phase-shifted sine by default)."""
+        signal = self._signals.get(channel)
+        if signal is None and channel >= cst.DIGITAL_PORT.PORT0:
+            # Digital ports count in binary across their eight lines
+            signal = (np.arange(self.signal_period) & 0xFF).astype(np.int16)
+            self._signals[channel] = signal
+        elif signal is None:
+            phase = 2 * np.pi * np.arange(self.signal_period) / self.signal_period
+            signal = (0.8 * self._max_adc * np.sin(phase + channel * np.pi / 4)).astype(np.int16)
+            self._signals[channel] = signal
+        return signal
+
+    def _signal_as(self, channel: int, dtype) -> np.ndarray:
+        """Signal period scaled to a buffer dtype (8-bit buffers hold counts / 256)."""
+        key = (channel, np.dtype(dtype))
+        table = self._signal_cache.get(key)
+        if table is None:
+            table = self._signal(channel)
+            if key[1] == np.int8 and channel < cst.DIGITAL_PORT.PORT0:
+                table = table // 256
+            table = table.astype(dtype)
+            self._signal_cache[key] = table
+        return table
+
+    def _overflow_mask(self, channels) -> int:
+        """Bit mask of the given enabled channels whose signal reaches the ADC limits."""
+        mask = 0
+        for channel in channels:
+            if channel in self._enabled:
+                signal = self._signal(channel)
+                if signal.max() >= self._max_adc or signal.min() <= -self._max_adc:
+                    mask |= 1 << channel
+        return mask
+
+    def _render(self, registration: _Registration, offset: int, raw_start: int,
+                n_out: int, ratio: int) -> None:
+        """Write ``n_out`` values, starting at raw sample ``raw_start``, at ``offset``."""
+        if n_out <= 0:
+            return
+        out_max = registration.buffer_max[offset:offset + n_out]
+        table = self._signal_as(registration.channel, out_max.dtype)
+        # np.take's wrap mode reduces each index by repeated subtraction, which
+        # crawls once indices run many periods past the table; wrap them here.
+        size = table.size
+        raw_start %= size
+        mode = registration.mode
+        if mode not in _DOWNSAMPLED_MODES or ratio <= 1:
+            np.take(table, np.arange(raw_start, raw_start + n_out) % size, out=out_max)
+            if registration.buffer_min is not None:
+                registration.buffer_min[offset:offset + n_out] = out_max
+            return
+        if mode == cst.RATIO_MODE.DECIMATE:
+            indices = (raw_start + np.arange(n_out) * ratio) % size
+            np.take(table, indices, out=out_max)
+            return
+        raw = np.take(table, np.arange(raw_start, raw_start + n_out * ratio) % size)
+        raw = raw.reshape(n_out, ratio)
+        if mode == cst.RATIO_MODE.AVERAGE:
+            out_max[:] = raw.mean(axis=1)
+        elif mode == cst.RATIO_MODE.SUM:
+            out_max[:] = raw.sum(axis=1, dtype=np.int64)
+        else:
+            # AGGREGATE / DISTRIBUTION: max and min of each ratio block
+            out_max[:] = raw.max(axis=1)
+            if registration.buffer_min is not None:
+                registration.buffer_min[offset:offset + n_out] = raw.min(axis=1)
+
+    def _spend(self, samples: int) -> None:
+        """Charge the configured call latency and per-sample transfer cost."""
+        cost = self.call_latency + samples * self.transfer_cost
+        if cost > 0:
+            time.sleep(cost)
+
+    # -- timing ---------------------------------------------------------------
+
+    def _timebase_to_interval(self, timebase: int) -> float:
+        """Sample interval in seconds of a timebase, per the family's formula."""
+        timebase = int(timebase)
+        if self.family == 'psospa':
+            # The psospa wrapper treats the timebase as an interval in ps
+            return max(timebase, 1) / cst.TIME_UNIT.PS
+        if self.family == 'ps5000a':
+            if timebase < 3:
+                return 2 ** timebase / 1e9
+            return (timebase - 2) / 125e6
+        if timebase < 5:
+            return 2 ** timebase / 5e9
+        return (timebase - 4) / 156.25e6
+
+    def _interval_to_timebase(self, interval_s: float) -> int:
+        """Fastest timebase with an interval no longer than ``interval_s``."""
+        if self.family == 'psospa':
+            return max(1, int(interval_s * cst.TIME_UNIT.PS))
+        if self.family == 'ps5000a':
+            if interval_s < 8e-9:
+                return min(2, max(0, int(math.log2(max(interval_s * 1e9, 1)))))
+            return int(interval_s * 125e6) + 2
+        if interval_s < 6.4e-9:
+            return min(4, max(0, int(math.log2(max(interval_s * 5e9, 1)))))
+        return int(interval_s * 156.25e6) + 4
+
+    def _capture_rate(self, interval_s: float) -> float:
+        """Samples per second a capture produces."""
+        if self.sample_rate is not None:
+            return self.sample_rate
+        return 1 / interval_s
+
+    # -- unit -----------------------------------------------------------------
+
+    def OpenUnit(self, handle, serial, resolution, *_):
+        _deref(handle).value = 1
+        self._set_resolution(_value(resolution))
+        return _PICO_OK
+
+    def CloseUnit(self, handle):
+        self.Stop(handle)
+        return _PICO_OK
+
+    def PingUnit(self, handle):
+        return _PICO_OK
+
+    def EnumerateUnits(self, count, serials, serial_length):
+        _deref(count).value = 1
+        _deref(serials).value = b'SIM00/0001'
+        _deref(serial_length).value = len(b'SIM00/0001')
+        return _PICO_OK
+
+    def GetUnitInfo(self, handle, string, string_length, required_size, info):
+        info = _value(info)
+        text = {
+            cst.UNIT_INFO.PICO_DRIVER_VERSION: 'Simulated',
+            cst.UNIT_INFO.PICO_USB_VERSION: '3.0',
+            cst.UNIT_INFO.PICO_VARIANT_INFO: _VARIANTS[self.family],
+            cst.UNIT_INFO.PICO_BATCH_AND_SERIAL: 'SIM00/0001',
+        }.get(info, '0').encode()
+        _deref(required_size).value = len(text) + 1
+        if string is not None:
+            _deref(string).value = text[:max(_value(string_length) - 1, 0)]
+        return _PICO_OK
+
+    def GetVariantDetails(self, variant_name, variant_length, buffer, buffer_size, style):
+        details = json.dumps({
+            'VariantName': _VARIANTS[self.family],
+            'NumberOfAnalogueChannels': self.n_channels,
+            'NumberOfDigitalPorts': 2,
+        }).encode()
+        _deref(buffer).value = details
+        _deref(buffer_size).value = len(details)
+        return _PICO_OK
+
+    def _set_resolution(self, resolution: int) -> None:
+        self._resolution = resolution
+        self._max_adc = 32512 if resolution == cst.RESOLUTION._8BIT else 32767
+        # Generated signals scale with the ADC limits; user signals are kept
+        self._signals = {ch: signal for ch, signal in self._signals.items()
+                         if ch in self._user_signals}
+        self._signal_cache.clear()
+
+    def SetDeviceResolution(self, handle, resolution):
+        self._set_resolution(_value(resolution))
+        return _PICO_OK
+
+    def GetAdcLimits(self, handle, resolution, min_value, max_value):
+        _deref(min_value).value = -self._max_adc
+        _deref(max_value).value = self._max_adc
+        return _PICO_OK
+
+    def MinimumValue(self, handle, value):
+        _deref(value).value = -self._max_adc
+        return _PICO_OK
+
+    def MaximumValue(self, handle, value):
+        _deref(value).value = self._max_adc
+        return _PICO_OK
+
+    # -- channels / trigger ---------------------------------------------------
+
+    def SetChannelOn(self, handle, channel, *_):
+        self._enabled.add(int(_value(channel)))
+        return _PICO_OK
+
+    def SetChannelOff(self, handle, channel):
+        self._enabled.discard(int(_value(channel)))
+        return _PICO_OK
+
+    def SetChannel(self, handle, channel, enabled, *_):
+        if _value(enabled):
+            return self.SetChannelOn(handle, channel)
+        return self.SetChannelOff(handle, channel)
+
+    def SetBandwidthFilter(self, handle, channel, bandwidth):
+        return _PICO_OK
+
+    def SetDigitalPortOn(self, handle, port, *_):
+        return _PICO_OK
+
+    def SetDigitalPortOff(self, handle, port):
+        return _PICO_OK
+
+    def SetDigitalPort(self, handle, port, enabled, *_):
+        return _PICO_OK
+
+    def ChannelCombinationsStateless(self, handle, combinations, n_combinations, *args):
+        n_channels = self.n_channels
+        if self.family == 'ps5000a' and not _value(args[2]):
+            # ps5000a without its AC adaptor: A and B only
+            n_channels = 2
+        combination = (1 << n_channels) - 1
+        combination |= cst.PICO_CHANNEL_FLAGS.PORT0_FLAGS | cst.PICO_CHANNEL_FLAGS.PORT1_FLAGS
+        _deref(n_combinations).value = 1
+        if combinations is not None:
+            _deref(combinations)[0] = combination
+        return _PICO_OK
+
+    def SetSimpleTrigger(self, handle, enable, *_):
+        self._trigger_enabled = bool(_value(enable))
+        return _PICO_OK
+
+    def SetAutoTriggerMicroSeconds(self, handle, auto_trigger):
+        return _PICO_OK
+
+    # -- timebase / memory ----------------------------------------------------
+
+    def NearestSampleIntervalStateless(self, handle, flags, interval, *args):
+        timebase, time_interval = _deref(args[-2]), _deref(args[-1])
+        timebase.value = self._interval_to_timebase(_value(interval))
+        time_interval.value = self._timebase_to_interval(timebase.value)
+        return _PICO_OK
+
+    def GetTimebase(self, handle, timebase, samples, time_interval_ns, max_samples, segment):
+        _deref(time_interval_ns).value = self._timebase_to_interval(_value(timebase)) * 1e9
+        _deref(max_samples).value = self.max_memory // max(self._n_captures, 1)
+        return _PICO_OK
+
+    GetTimebase2 = GetTimebase
+
+    def MemorySegments(self, handle, n_segments, max_samples):
+        self._n_segments = max(int(_value(n_segments)), 1)
+        _deref(max_samples).value = self.max_memory // self._n_segments
+        return _PICO_OK
+
+    def MemorySegmentsBySamples(self, handle, n_samples, max_segments):
+        self._n_segments = max(self.max_memory // max(int(_value(n_samples)), 1), 1)
+        _deref(max_segments).value = self._n_segments
+        return _PICO_OK
+
+    def SetNoOfCaptures(self, handle, n_captures):
+        self._n_captures = max(int(_value(n_captures)), 1)
+        return _PICO_OK
+
+    def GetNoOfCaptures(self, handle, n_captures):
+        _deref(n_captures).value = self._n_captures
+        return _PICO_OK
+
+    # -- buffers --------------------------------------------------------------
+
+    def _register(self, channel, buffer_max, buffer_min, samples, dtype, segment, mode,
+                  action) -> None:
+        channel, samples = int(_value(channel)), int(_value(samples))
+        segment, mode = int(_value(segment)), _mode_key(mode)
+        if action & cst.ACTION.CLEAR_ALL:
+            self._registrations.clear()
+            self._next_index.clear()
+            if self._stream is not None:
+                self._stream.queues.clear()
+        if action & cst.ACTION.CLEAR_THIS_DATA_BUFFER or (
+                self.family == 'ps5000a'):
+            # ps5000a has no ACTION: each call replaces (or, with a NULL
+            # pointer, clears) the buffer for its channel/segment/mode.
+            self._registrations = [
+                r for r in self._registrations
+                if (r.channel, r.segment, r.mode) != (channel, segment, mode)]
+        address_max = _address(buffer_max)
+        if not action & cst.ACTION.ADD or address_max is None or samples == 0:
+            return
+        address_min = _address(buffer_min)
+        registration = _Registration(
+            channel=channel,
+            segment=segment,
+            mode=mode,
+            buffer_max=_array_at(address_max, samples, dtype),
+            buffer_min=(None if address_min is None
+                        else _array_at(address_min, samples, dtype)),
+            index=self._next_index[(channel, mode)],
+        )
+        self._next_index[(channel, mode)] += 1
+        self._registrations.append(registration)
+        stream = self._stream
+        if stream is not None and stream.stop_time is None:
+            stream.queues.setdefault((channel, mode), collections.deque()).append(registration)
+
+    def SetDataBuffer(self, handle, channel, buffer, samples, *args):
+        if self.family == 'ps5000a':
+            segment, mode = args
+            return self._register_ps5000a(channel, buffer, None, samples, np.int16, segment, mode)
+        datatype, segment, mode, action = args
+        dtype = cst.DataTypeNPMap[_value(datatype)]
+        self._register(channel, buffer, None, samples, dtype, segment, mode, _value(action))
+        return _PICO_OK
+
+    def SetDataBuffers(self, handle, channel, buffer_max, buffer_min, samples, *args):
+        if self.family == 'ps5000a':
+            segment, mode = args
+            return self._register_ps5000a(
+                channel, buffer_max, buffer_min, samples, np.int16, segment, mode)
+        datatype, segment, mode, action = args
+        dtype = cst.DataTypeNPMap[_value(datatype)]
+        self._register(channel, buffer_max, buffer_min, samples, dtype, segment, mode,
+                       _value(action))
+        return _PICO_OK
+
+    def SetUnscaledDataBuffers(self, handle, channel, buffer_max, buffer_min, samples,
+                               segment, mode):
+        return self._register_ps5000a(
+            channel, buffer_max, buffer_min, samples, np.int8, segment, mode)
+
+    def _register_ps5000a(self, channel, buffer_max, buffer_min, samples, dtype, segment,
+                          mode) -> int:
+        self._register(channel, buffer_max, buffer_min, samples, dtype, segment, mode,
+                       cst.ACTION.ADD)
+        return _PICO_OK
+
+    # -- block mode -----------------------------------------------------------
+
+    def RunBlock(self, handle, pre_samples, post_samples, timebase, time_indisposed_ms,
+                 segment, lp_ready, p_parameter):
+        self.Stop(handle)
+        pre_samples, post_samples = int(_value(pre_samples)), int(_value(post_samples))
+        interval_s = self._timebase_to_interval(_value(timebase))
+        duration = self._n_captures * (pre_samples + post_samples) / self._capture_rate(interval_s)
+        block = _BlockCapture(
+            pre_samples=pre_samples,
+            post_samples=post_samples,
+            interval_s=interval_s,
+            first_segment=int(_value(segment)),
+            n_captures=self._n_captures,
+            ready_at=time.perf_counter() + duration,
+        )
+        if lp_ready is not None:
+            block.timer = threading.Timer(
+                duration, lp_ready, (_value(handle), _PICO_OK, p_parameter))
+            block.timer.daemon = True
+            block.timer.start()
+        self._block = block
+        if time_indisposed_ms is not None:
+            _deref(time_indisposed_ms).value = int(math.ceil(duration * 1000))
+        return _PICO_OK
+
+    def _block_ready(self) -> bool:
+        return self._block is None or time.perf_counter() >= self._block.ready_at
+
+    def IsReady(self, handle, ready):
+        _deref(ready).value = int(self._block_ready())
+        return _PICO_OK
+
+    def _read_segment(self, start_index: int, samples: int, segment: int, ratio: int,
+                      mode: int, registrations=None) -> tuple[int, int]:
+        """Fill every buffer registered for a captured segment; returns (n_out, written).
+
+        ``registrations`` narrows the search to a pre-filtered list.
+        """
+        block = self._block
+        n_raw = max(min(samples, block.samples - start_index), 0)
+        raw_base = (segment - block.first_segment) * block.samples + start_index
+        n_returned, written = 0, 0
+        if registrations is None:
+            registrations = self._registrations
+        for registration in registrations:
+            if registration.segment != segment:
+                continue
+            if not (registration.mode == mode or registration.mode & mode):
+                continue
+            reg_ratio = _ratio_for(registration.mode, ratio)
+            n_out = min(n_raw // reg_ratio, registration.buffer_max.size)
+            self._render(registration, 0, raw_base, n_out, reg_ratio)
+            n_returned, written = n_out, written + n_out
+        return n_returned, written
+
+    def GetValues(self, handle, start_index, samples, ratio, mode, segment, overflow):
+        if not self._block_ready():
+            return _PICO_BUSY
+        samples_ref = _deref(samples)
+        segment = int(_value(segment))
+        n_out, written = self._read_segment(
+            int(_value(start_index)), samples_ref.value, segment,
+            int(_value(ratio)), _mode_key(mode))
+        samples_ref.value = n_out
+        if overflow is not None:
+            _deref(overflow).value = self._overflow_mask(range(self.n_channels))
+        self._spend(written)
+        return _PICO_OK
+
+    def _bulk_segments(self, from_segment: int, to_segment: int) -> list:
+        """Segments a bulk read visits; a lower ``to_segment`` wraps around."""
+        if to_segment >= from_segment:
+            return list(range(from_segment, to_segment + 1))
+        return list(range(from_segment, self._n_segments)) + list(range(to_segment + 1))
+
+    def _read_bulk(self, start_index: int, samples: int, from_segment: int, to_segment: int,
+                   ratio: int, mode: int) -> tuple[int, int]:
+        """Fill the buffers of a range of captured segments; returns (n_out, written)."""
+        by_segment = collections.defaultdict(list)
+        for registration in self._registrations:
+            by_segment[registration.segment].append(registration)
+        n_out, written = 0, 0
+        for segment in self._bulk_segments(from_segment, to_segment):
+            n_out, n_written = self._read_segment(
+                start_index, samples, segment, ratio, mode, by_segment.get(segment, ()))
+            written += n_written
+        return n_out, written
+
+    def GetValuesBulk(self, handle, *args):
+        if self.family == 'ps5000a':
+            start_index = 0
+            samples, from_segment, to_segment, ratio, mode, overflow = args
+        else:
+            start_index, samples, from_segment, to_segment, ratio, mode, overflow = args
+        if not self._block_ready():
+            return _PICO_BUSY
+        samples_ref = _deref(samples)
+        from_segment, to_segment = int(_value(from_segment)), int(_value(to_segment))
+        n_out, written = self._read_bulk(
+            int(_value(start_index)), samples_ref.value, from_segment, to_segment,
+            int(_value(ratio)), _mode_key(mode))
+        samples_ref.value = n_out
+        address = _address(overflow)
+        if address is not None:
+            _array_at(address, len(self._bulk_segments(from_segment, to_segment)),
+                      np.int16)[:] = \
+                self._overflow_mask(range(self.n_channels))
+        self._spend(written)
+        return _PICO_OK
+
+    def GetValuesBulkAsync(self, handle, start_index, samples, from_segment, to_segment,
+                           ratio, mode, lp_data_ready, p_parameter):
+        # 6000a generation only; ps5000a has no bulk async transfer
+        if not self._block_ready():
+            return _PICO_BUSY
+        n_out, written = self._read_bulk(
+            int(_value(start_index)), int(_value(samples)), int(_value(from_segment)),
+            int(_value(to_segment)), int(_value(ratio)), _mode_key(mode))
+        # The transfer completes on a driver thread after its simulated cost
+        timer = threading.Timer(
+            self.call_latency + written * self.transfer_cost, lp_data_ready,
+            (_value(handle), _PICO_OK, n_out, self._overflow_mask(range(self.n_channels)),
+             p_parameter))
+        timer.daemon = True
+        self._block.data_timer = timer
+        timer.start()
+        return _PICO_OK
+
+    def _trigger_info(self, first_segment: int, last_segment: int):
+        """Yield (segment, trigger index, time stamp counter) per captured segment."""
+        block = self._block
+        for segment in range(first_segment, last_segment + 1):
+            capture = segment - block.first_segment
+            yield (segment, block.pre_samples,
+                   (capture * block.samples) & cst.TIMESTAMP_COUNTER_MASK)
+
+    def GetTriggerInfo(self, handle, trigger_info, first_segment, last_segment):
+        if self._block is None:
+            return _PICO_OK
+        infos = _deref(trigger_info)
+        for info, (segment, index, counter) in zip(
+                infos, self._trigger_info(int(_value(first_segment)),
+                                          int(_value(last_segment)))):
+            info.status_ = _PICO_OK
+            info.segmentIndex_ = segment
+            info.triggerIndex_ = index
+            info.triggerTime_ = 0.0
+            info.timeUnits_ = cst._PICO_TIME_UNIT.NS  # pylint: disable=protected-access
+            info.missedTriggers_ = 0
+            info.timeStampCounter_ = counter
+        return _PICO_OK
+
+    def GetTriggerInfoBulk(self, handle, trigger_info, first_segment, last_segment):
+        if self._block is None:
+            return _PICO_OK
+        infos = _deref(trigger_info)
+        for info, (segment, index, counter) in zip(
+                infos, self._trigger_info(int(_value(first_segment)),
+                                          int(_value(last_segment)))):
+            info.status = _PICO_OK
+            info.segmentIndex = segment
+            info.triggerIndex = index
+            info.triggerTime = 0
+            info.timeUnits = cst._PICO_TIME_UNIT.NS  # pylint: disable=protected-access
+            info.timeStampCounter = counter
+        return _PICO_OK
+
+    # -- streaming ------------------------------------------------------------
+
+    def RunStreaming(self, handle, sample_interval, time_units, pre_samples, post_samples,
+                     auto_stop, ratio, mode, *overview_size):
+        self.Stop(handle)
+        interval = _deref(sample_interval).value
+        # pylint: disable-next=protected-access
+        interval_s = interval / cst._PicoStandardConv[_value(time_units)]
+        mode = _mode_key(mode)
+        stream = _StreamState(
+            start_time=time.perf_counter(),
+            rate=self._capture_rate(interval_s),
+            mode=mode,
+            ratio=int(_value(ratio)),
+            pre_samples=int(_value(pre_samples)),
+            post_samples=int(_value(post_samples)),
+            auto_stop=bool(_value(auto_stop)),
+            overview_size=int(_value(overview_size[0])) if overview_size else 0,
+        )
+        for registration in self._registrations:
+            if registration.mode == mode or registration.mode & mode:
+                key = (registration.channel, registration.mode)
+                registration.filled = 0
+                stream.queues.setdefault(key, collections.deque()).append(registration)
+                stream.delivered[key] = 0
+        self._stream = stream
+        return _PICO_OK
+
+    def _produced(self, stream: _StreamState) -> int:
+        """Raw samples the simulated device has captured so far.
+
+        Samples the host falls more than `max_memory` behind on are dropped,
+        as the device memory would overrun; they count in `dropped_samples`
+        and the stream resumes from the oldest sample still held.
+        """
+        now = stream.stop_time if stream.stop_time is not None else time.perf_counter()
+        produced = int((now - stream.start_time) * stream.rate)
+        if stream.auto_stop:
+            produced = min(produced, stream.pre_samples + stream.post_samples)
+        if stream.delivered:
+            backlog = produced - min(delivered * stream.ratio_of(key)
+                                     for key, delivered in stream.delivered.items())
+            if backlog > self.max_memory:
+                lost = backlog - self.max_memory
+                self.dropped_samples += lost
+                for key in stream.delivered:
+                    stream.delivered[key] += lost // stream.ratio_of(key)
+        return produced
+
+    def _stream_trigger(self, stream: _StreamState, delivered_raw: int) -> tuple[int, int]:
+        """(triggered, trigger_at) for this poll; trigger_at is the cumulative raw index.
+
+        Mirrors the reference frames StreamingSession assumes, which are not
+        verified against hardware, so simulated tests cannot confirm them.
+        """
+        if (self._trigger_enabled and not stream.triggered
+                and delivered_raw > stream.pre_samples):
+            stream.triggered = True
+            return 1, stream.pre_samples
+        return 0, 0
+
+    def GetStreamingLatestValues(self, handle, *args):
+        stream = self._stream
+        if stream is None:
+            return _PICO_OK
+        if self.family == 'ps5000a':
+            return self._poll_ps5000a(handle, stream, *args)
+
+        streaming_data_info, n_infos, trigger_info = args
+        infos = _deref(streaming_data_info)
+        if isinstance(infos, ctypes.Structure):
+            infos = [infos]
+        produced = self._produced(stream)
+        status, written = _PICO_OK, 0
+        delivered_raw = 0
+        for info in list(infos)[:int(_value(n_infos))]:
+            key = (info.channel_, _mode_key(info.mode_))
+            info.noOfSamples_ = 0
+            info.startIndex_ = 0
+            info.overflow_ = 0
+            queue = stream.queues.get(key)
+            if not queue:
+                status = _PICO_WAITING_FOR_DATA_BUFFERS
+                continue
+            registration = queue[0]
+            delivered = stream.delivered.get(key, 0)
+            ratio = stream.ratio_of(key)
+            n_out = min(produced // ratio - delivered,
+                        registration.buffer_max.size - registration.filled)
+            self._render(registration, registration.filled, delivered * ratio, n_out, ratio)
+            info.noOfSamples_ = n_out
+            info.bufferIndex_ = registration.index
+            info.startIndex_ = registration.filled
+            info.overflow_ = int(bool(self._overflow_mask([info.channel_])))
+            registration.filled += n_out
+            if registration.filled >= registration.buffer_max.size:
+                # Full: hand the buffer back, the next poll moves on
+                queue.popleft()
+            stream.delivered[key] = delivered + n_out
+            delivered_raw = max(delivered_raw, stream.delivered[key] * ratio)
+            written += n_out
+
+        trigger = _deref(trigger_info)
+        trigger.triggered_, trigger.triggerAt_ = self._stream_trigger(stream, delivered_raw)
+        trigger.autoStop_ = int(self._stream_auto_stopped(stream, produced))
+        self._spend(written)
+        return status
+
+    def _stream_auto_stopped(self, stream: _StreamState, produced: int) -> bool:
+        """True once an auto-stop capture has produced and delivered every sample."""
+        if not stream.auto_stop or produced < stream.pre_samples + stream.post_samples:
+            return False
+        stream.auto_stopped = all(delivered >= produced // stream.ratio_of(key)
+                                  for key, delivered in stream.delivered.items())
+        return stream.auto_stopped
+
+    def _poll_ps5000a(self, handle, stream: _StreamState, lp_ready, p_parameter) -> int:
+        produced = self._produced(stream)
+        registrations = [queue[0] for queue in stream.queues.values() if queue]
+        if not registrations:
+            return _PICO_OK
+        ratio = _ratio_for(stream.mode, stream.ratio)
+        size = stream.overview_size or registrations[0].buffer_max.size
+        # One call never writes more than the overview buffer holds, so no
+        # data is overwritten before the host has read it.
+        budget = size
+        written = 0
+        while True:
+            delivered = min(stream.delivered.values())
+            available = min(produced // ratio - delivered, budget)
+            start = delivered % size
+            n_out = min(available, size - start, self.callback_samples or size)
+            for registration in registrations:
+                self._render(registration, start, delivered * ratio,
+                             min(n_out, registration.buffer_max.size - start), ratio)
+            for key in stream.delivered:
+                stream.delivered[key] = delivered + n_out
+            budget -= n_out
+            written += n_out
+            triggered, trigger_at = self._stream_trigger(stream, (delivered + n_out) * ratio)
+            if triggered:
+                # Assumed (unverified): StreamingReady reports the trigger
+                # relative to this callback's data
+                trigger_at = trigger_at // ratio - delivered
+            was_stopped = stream.auto_stopped
+            auto_stopped = self._stream_auto_stopped(stream, produced)
+            if n_out > 0 or triggered or (auto_stopped and not was_stopped):
+                overflow = self._overflow_mask([r.channel for r in registrations])
+                lp_ready(_value(handle), n_out, start, overflow, trigger_at, triggered,
+                         int(auto_stopped), p_parameter)
+            if n_out <= 0 or self.callback_samples is None:
+                break
+        self._spend(written * len(registrations))
+        return _PICO_OK
+
+    def NoOfStreamingValues(self, handle, n_values):
+        stream = self._stream
+        delivered = max(stream.delivered.values(), default=0) if stream else 0
+        _deref(n_values).value = delivered
+        return _PICO_OK
+
+    def Stop(self, handle):
+        block = self._block
+        if block is not None:
+            for timer in (block.timer, block.data_timer):
+                if timer is not None:
+                    timer.cancel()
+        stream = self._stream
+        if stream is not None and stream.stop_time is None:
+            stream.stop_time = time.perf_counter()
+        return _PICO_OK
+
+
+__all__ = ['SimulatedDriver']
@@ -0,0 +1,192 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Software triggers for streamed data.
+
+A hardware streaming trigger fires once per run. These triggers run on the
+chunks of a :class:`StreamingSession` instead and fire on every event for as
+long as the stream runs. Levels are in the ADC units of the chunk data; use
+:meth:`StreamingSession.mv_to_adc` to convert from millivolts.
+
+Each trigger is a hysteresis state machine: it must see the signal on the
+arming side of the level (beyond the hysteresis band) before it can fire
+again, so noise around the level gives one event, not many. Only the state
+after the last sample is carried between chunks, so events straddling a
+chunk boundary are found exactly once. Detection is a handful of vectorized
+NumPy comparisons per chunk.
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .constants import TRIGGER_DIR, trigger_dir_m
+from .common import PicoSDKException, _get_literal
+
+_ARMED = -1
+_FIRED = 1
+
+
+class SoftwareTrigger(ABC):
+    """
+    Base class of the software triggers.
+
+    Subclasses implement :meth:`_masks`, returning one ``(arm, fire)`` pair
+    of boolean arrays per state machine.
+
+    Attributes:
+        output: Chunk data key the trigger watches (a channel, or a
+            ``(channel, ratio_mode)`` pair in multi-output sessions).
+        position (int): Stream samples seen so far.
+        events (int): Events detected so far.
+    """
+
+    def __init__(self, output, hysteresis: int = 0, machines: int = 1):
+        if hysteresis < 0:
+            raise PicoSDKException("hysteresis must be >= 0")
+        self.output = output
+        self.hysteresis = hysteresis
+        self._machines = machines
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the trigger state and restart counting from sample 0."""
+        self._states = [0] * self._machines
+        self.position = 0
+        self.events = 0
+
+    @abstractmethod
+    def _masks(self, low: np.ndarray, high: np.ndarray) -> list:
+        """``(arm, fire)`` boolean arrays per state machine for the given bounds."""
+
+    def detect(self, data: np.ndarray) -> np.ndarray:
+        """Return the stream sample indices of the events in the next samples.
+
+        Args:
+            data (np.ndarray): The next samples of the watched output. For
+                AGGREGATE/DISTRIBUTION outputs, the ``(2, n)`` min/max pair:
+                each bound is tested against the envelope side that reaches
+                it, and a block whose envelope spans a crossing fires.
+
+        Returns:
+            np.ndarray: Sorted int64 indices, counted from the first sample
+            passed since the last :meth:`reset`.
+        """
+        low, high = (data[0], data[1]) if data.ndim == 2 else (data, data)
+        hits = []
+        for i, (arm, fire) in enumerate(self._masks(low, high)):
+            decisive = np.flatnonzero(arm | fire)
+            if not decisive.size:
+                continue
+            fired = fire[decisive]
+            states = np.where(fired, _FIRED, _ARMED).astype(np.int8)
+            previous = np.empty_like(states)
+            previous[0] = self._states[i]
+            previous[1:] = states[:-1]
+            # An envelope sample can both arm and fire: the crossing lies
+            # inside that block
+            hits.append(decisive[fired & ((previous == _ARMED) | arm[decisive])])
+            self._states[i] = int(states[-1])
+        events = (np.sort(np.concatenate(hits)) if hits
+                  else np.empty(0, dtype=np.int64)).astype(np.int64) + self.position
+        self.position += data.shape[-1]
+        self.events += len(events)
+        return events
+
+    def process(self, chunk) -> np.ndarray:
+        """:meth:`detect` on a :class:`StreamingChunk`'s watched output."""
+        return self.detect(chunk.data[self.output])
+
+
+class EdgeTrigger(SoftwareTrigger):
+    """
+    Fires each time the signal crosses a level in the given direction.
+
+    A rising trigger re-arms once the signal drops below
+    ``level - hysteresis``; a falling trigger once it rises above
+    ``level + hysteresis``.
+
+    Examples:
+        >>> level = session.mv_to_adc(100, psdk.CHANNEL.A)
+        >>> trigger = psdk.EdgeTrigger(psdk.CHANNEL.A, level, hysteresis=level // 10)
+        >>> for chunk in session:
+        ...     events = trigger.process(chunk)
+    """
+
+    def __init__(
+        self,
+        output,
+        level: int,
+        hysteresis: int = 0,
+        direction: TRIGGER_DIR | str = TRIGGER_DIR.RISING,
+    ):
+        """
+        Args:
+            output: Chunk data key to watch, e.g. ``CHANNEL.A``.
+            level (int): Trigger level in ADC units of the chunk data.
+            hysteresis (int, optional): Re-arm band in ADC units. Defaults to 0.
+            direction (TRIGGER_DIR | str, optional): RISING, FALLING or
+                RISING_OR_FALLING. Defaults to RISING.
+
+        Raises:
+            PicoSDKException: For other directions or a negative hysteresis.
+        """
+        direction = _get_literal(direction, trigger_dir_m)
+        if direction not in (TRIGGER_DIR.RISING, TRIGGER_DIR.FALLING,
+                             TRIGGER_DIR.RISING_OR_FALLING):
+            raise PicoSDKException(
+                "EdgeTrigger supports RISING, FALLING or RISING_OR_FALLING")
+        self.level = level
+        self.direction = direction
+        super().__init__(output, hysteresis,
+                         machines=2 if direction == TRIGGER_DIR.RISING_OR_FALLING else 1)
+
+    def _masks(self, low, high):
+        masks = []
+        if self.direction != TRIGGER_DIR.FALLING:
+            masks.append((low < self.level - self.hysteresis, high >= self.level))
+        if self.direction != TRIGGER_DIR.RISING:
+            masks.append((high > self.level + self.hysteresis, low <= self.level))
+        return masks
+
+
+class WindowTrigger(SoftwareTrigger):
+    """
+    Fires each time the signal leaves (or enters) the band ``[low, high]``.
+
+    An exit trigger re-arms once the signal is back inside the band by at
+    least ``hysteresis``; an enter trigger once it is outside by as much.
+    """
+
+    def __init__(self, output, low: int, high: int, hysteresis: int = 0, on: str = 'exit'):
+        """
+        Args:
+            output: Chunk data key to watch, e.g. ``CHANNEL.A``.
+            low (int): Lower band edge in ADC units of the chunk data.
+            high (int): Upper band edge in ADC units of the chunk data.
+            hysteresis (int, optional): Re-arm margin in ADC units. Defaults to 0.
+            on (str, optional): ``'exit'`` or ``'enter'``. Defaults to ``'exit'``.
+
+        Raises:
+            PicoSDKException: If ``low > high``, ``on`` is unknown or the
+                hysteresis is negative.
+        """
+        if low > high:
+            raise PicoSDKException("WindowTrigger needs low <= high")
+        if on not in ('exit', 'enter'):
+            raise PicoSDKException("on must be 'exit' or 'enter'")
+        self.low = low
+        self.high = high
+        self.on = on
+        super().__init__(output, hysteresis)
+
+    def _masks(self, low, high):
+        h = self.hysteresis
+        outside = (low < self.low) | (high > self.high)
+        if self.on == 'exit':
+            inside = (low >= self.low + h) & (high <= self.high - h)
+            return [(inside, outside)]
+        inside = (low >= self.low) & (high <= self.high)
+        return [((low < self.low - h) | (high > self.high + h), inside)]
+
+
+__all__ = ['SoftwareTrigger', 'EdgeTrigger', 'WindowTrigger']
@@ -10,11 +10,15 @@ code streams on a 6000E (ps6000a), 3000E/5000E (psospa) or 5000D (ps5000a):
  - Configure the scope (open_unit, set_channel) as normal
  - `with StreamingSession(scope, sample_interval=..., time_units=...) as stream:`
  - `for chunk in stream:` - each chunk carries per-channel numpy copies
+   (or, with ``zero_copy=True``, leased read-only views of the driver buffers)
 
 `StreamingScope` is the older 6000a-generation-only helper, kept for
 reference; prefer `StreamingSession`.
 """
+import threading
 import time
+from collections import deque
+from functools import partial
 from warnings import warn
 import numpy as np
 from .constants import (
@@ -37,6 +41,74 @@ from .common import (
 )
 from .ps6000a import ps6000a
 from .psospa import psospa
+from .recording import Recording, _RATIO_MODE_NAMES
+from .capture_file import _count_scale, channel_name
+from .telemetry import StreamingStats
+from .shared_stream import SharedStreamRing
+
+
+class _RollingBuffer:
+    """
+    Newest samples of a stream, readable as one contiguous array.
+
+    With a ``size`` the samples live in a mirrored ring: each is written at
+    ``i`` and ``i + size``, so ``[pos:pos + size]`` always holds the newest
+    ``size`` samples oldest first. Appending costs O(chunk) and reading is a
+    view. Without a ``size`` the buffer keeps everything, doubling its
+    storage as it fills. Either way the stream is preceded by ``minimum``
+    zeros, the initial contents of a :class:`StreamingScope` buffer.
+    """
+
+    def __init__(self, size: int | None, minimum: int, rows: int | None = None):
+        self.size = size
+        self.minimum = minimum
+        self.count = 0
+        self._shape = () if rows is None else (rows,)
+        if size is None:
+            # Data starts after the `minimum` leading zeros
+            self._store = np.zeros(self._shape + (2 * max(minimum, 1),))
+            self._end = minimum
+        else:
+            self._store = np.zeros(self._shape + (2 * size,))
+            self._pos = 0
+
+    def append(self, data: np.ndarray) -> None:
+        """Add samples to the newest end."""
+        n = data.shape[-1]
+        self.count += n
+        if self.size is None:
+            end = self._end
+            if end + n > self._store.shape[-1]:
+                grown = np.zeros(self._shape + (2 * (end + n),))
+                grown[..., :end] = self._store[..., :end]
+                self._store = grown
+            self._store[..., end:end + n] = data
+            self._end = end + n
+            return
+        size = self.size
+        if n > size:
+            data = data[..., -size:]
+            n = size
+        pos = self._pos
+        first = min(n, size - pos)
+        for base in (0, size):
+            self._store[..., base + pos:base + pos + first] = data[..., :first]
+            self._store[..., base:base + n - first] = data[..., first:]
+        self._pos = (pos + n) % size
+
+    def view(self) -> np.ndarray:
+        """The newest samples, oldest first; valid until the next append."""
+        length = self.count + self.minimum
+        if self.size is None:
+            return self._store[..., self._end - length:self._end]
+        length = min(length, self.size)
+        return self._store[..., self._pos + self.size - length:self._pos + self.size]
+
+    def resized(self, size: int | None) -> '_RollingBuffer':
+        """A buffer of another ``size`` holding the same newest samples."""
+        buffer = _RollingBuffer(size, 0, self._shape[0] if self._shape else None)
+        buffer.append(self.view())
+        return buffer
 
 
 class StreamingScope:
@@ -61,7 +133,7 @@ class StreamingScope:
         # Buffers
         self.np_buffer = np.empty(0)
         self.buffer_index = 0
-        self.buffer = np.empty(0)
+        self._rolling = None
         self.samples: int
         self.np_samples: int
         self.max_buffer_size: int
@@ -134,14 +206,37 @@ class StreamingScope:
         self.samples = samples
         self.np_samples = int(samples/2)
         if self.ratio_mode == RATIO_MODE.AGGREGATE:
-            self.buffer = np.zeros((2, samples))
             self.np_buffer = np.zeros((2, 2, self.np_samples), dtype=np.int16)
         else:
-            self.buffer = np.zeros(samples)
             self.np_buffer = np.zeros((2, self.np_samples), dtype=np.int16)
         # max_buffer_size (int | None): Maximum number of samples the python
         # buffer can hold. If None, the buffer will not constrain.
         self.max_buffer_size = samples
+        self._rolling = _RollingBuffer(
+            samples, samples, rows=2 if self.ratio_mode == RATIO_MODE.AGGREGATE else None)
+
+    @property
+    def buffer(self) -> np.ndarray:
+        """The newest streamed samples, oldest first, zero-padded at the front.
+
+        Unlike the plain array this used to be, the value is a view into the
+        rolling buffer (``(2, n)`` min/max rows for AGGREGATE): the next
+        :meth:`get_streaming_values` overwrites it in place, so a kept
+        reference sees its data change. Copy it to keep it. Assigning an
+        array replaces the buffer contents, zero-padded at the front to
+        ``samples``; later samples are appended to it.
+        """
+        if self._rolling is None:
+            return np.empty(0)
+        return self._rolling.view()
+
+    @buffer.setter
+    def buffer(self, value: np.ndarray) -> None:
+        value = np.asarray(value)
+        rows = value.shape[0] if value.ndim == 2 else None
+        padding = max(getattr(self, 'samples', 0) - value.shape[-1], 0)
+        self._rolling = _RollingBuffer(getattr(self, 'max_buffer_size', None), padding, rows)
+        self._rolling.append(value)
 
     def _add_channel(
         self,
@@ -268,19 +363,12 @@ class StreamingScope:
                          f'not miss data.',
                          BufferTooSmall)
 
-            # Add the new buffer to the buffer array and take end chunk
-            if self.ratio_mode == RATIO_MODE.AGGREGATE:
-                new_data = self.np_buffer[buffer_index][:, start_index:start_index + n_samples]
-                pad_len = max(self.samples - (self.buffer.shape[1] + new_data.shape[1]), 0)
-                temp_pad_array = np.zeros((2, pad_len))
-                self.buffer = (np.concatenate([temp_pad_array, self.buffer, new_data], axis=1)
-                               [:, -self.max_buffer_size:])
-            else:
-                new_data = (self.np_buffer[buffer_index][start_index:start_index + n_samples])
-                pad_len = max(self.samples - (len(self.buffer) + len(new_data)), 0)
-                temp_pad_array = np.zeros(pad_len)
-                self.buffer = (np.concatenate([temp_pad_array, self.buffer, new_data])
-                               [-self.max_buffer_size:])
+            # Add the new samples to the rolling buffer: O(n_samples) however
+            # large max_buffer_size is
+            if self._rolling.size != self.max_buffer_size:
+                self._rolling = self._rolling.resized(self.max_buffer_size)
+            self._rolling.append(
+                self.np_buffer[buffer_index][..., start_index:start_index + n_samples])
 
     def start_streaming_while(self) -> None:
         """
@@ -319,13 +407,13 @@ class StreamingScope:
                 The total number of samples to acquire before stopping.
 
         Returns:
-            numpy.ndarray: The buffer array containing the collected samples.
+            numpy.ndarray: A copy of the buffer containing the collected samples.
         """
         self.run_streaming()
         while not self.stop_bool:
             self.get_streaming_values()
             if len(self.buffer) >= no_of_samples:
-                return self.buffer
+                return self.buffer.copy()
 
     def stop(self):
         """Signals the streaming loop to stop."""
@@ -338,7 +426,16 @@ class StreamingChunk:
     Attributes:
         data (dict): ``{channel: np.ndarray}`` — a private copy per channel,
             safe to keep, process or hand to another thread. Arrays keep the
-            native capture dtype (no upcasting).
+            native capture dtype (no upcasting). In a ``zero_copy`` session
+            these are read-only views into the driver buffers, valid until
+            :meth:`release` is called. With a ``pool_size`` they are views of
+            pooled arrays that are reused once :meth:`release` is called.
+            For AGGREGATE/DISTRIBUTION sessions each array has shape
+            ``(2, n)``: the min envelope first, then the max (see
+            :attr:`data_min` / :attr:`data_max`).
+            Digital ports are keyed by their DIGITAL_PORT value. Sessions
+            created with ``outputs`` key the arrays by
+            ``(channel, ratio_mode)``.
         overflowed (list): Channels whose input went over range during this
             chunk (ADC over-range, not a buffer overflow).
         triggered (bool): True if the driver reported the trigger fired in
@@ -348,23 +445,303 @@ class StreamingChunk:
             of this value (cumulative stream index vs buffer-relative) is
             driver-dependent and not fully verified — treat as approximate
             unless confirmed for your device.
+            :meth:`StreamingSession.trigger_windows` assumes a cumulative
+            raw index on the 6000a generation and an index relative to the
+            chunk's first sample on ps5000a.
         auto_stopped (bool): True when the driver reported auto-stop; this is
             the final chunk of the session.
+        start_index (dict): ``{output: int}`` - stream sample index of each
+            output's first sample in this chunk, counted from the start of the
+            stream in that output's samples. Consecutive chunks continue each
+            other exactly.
+        timestamp_ns (int | None): ``time.monotonic_ns()`` when the poll
+            returned.
+        status (int): Driver status of the poll.
+        sequence (int): Chunks the session delivered before this one.
+        sample_interval (dict): ``{output: float}`` - seconds between
+            consecutive samples of each output (ratio included).
     """
 
-    def __init__(self, data, overflowed, triggered, trigger_at, auto_stopped):
+    def __init__(self, data, overflowed, triggered, trigger_at, auto_stopped, lease=None,
+                 start_index=None, timestamp_ns=None, status=0, sequence=0,
+                 sample_interval=None):
         self.data = data
         self.overflowed = overflowed
         self.triggered = triggered
         self.trigger_at = trigger_at
         self.auto_stopped = auto_stopped
+        self._lease = lease
+        self.start_index = start_index if start_index is not None else {}
+        self.timestamp_ns = timestamp_ns
+        self.status = status
+        self.sequence = sequence
+        self.sample_interval = sample_interval if sample_interval is not None else {}
+
+    @property
+    def leased(self) -> bool:
+        """True while this chunk holds driver buffers or pooled arrays."""
+        return self._lease is not None
+
+    def release(self) -> None:
+        """Hand the arrays behind a ``zero_copy`` or pooled chunk back to the session.
+
+        The arrays in :attr:`data` must not be used afterwards: the session
+        re-registers a driver buffer with the driver, or refills a pooled
+        array with a later chunk. ``data`` is emptied to drop the chunk's own
+        references. Safe to call more than once, from any thread, and a no-op
+        for chunks holding private copies.
+        """
+        lease, self._lease = self._lease, None
+        if lease is not None:
+            self.data = {}
+            lease()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
 
     @property
     def n_samples(self) -> int:
-        """Number of samples per channel in this chunk (max across channels)."""
+        """Number of samples per channel in this chunk (max across outputs)."""
         if not self.data:
             return 0
-        return max(len(arr) for arr in self.data.values())
+        return max(arr.shape[-1] for arr in self.data.values())
+
+    def start_time(self, output) -> float:
+        """Seconds from the start of the stream to ``output``'s first sample here."""
+        return self.start_index[output] * self.sample_interval[output]
+
+    def time_axis(self, output) -> np.ndarray:
+        """Stream time in seconds of each of ``output``'s samples in this chunk.
+
+        Built on demand from :attr:`start_index` and :attr:`sample_interval`,
+        so no running totals are needed.
+        """
+        n = self.data[output].shape[-1]
+        return self.start_time(output) + np.arange(n) * self.sample_interval[output]
+
+    @property
+    def data_min(self) -> dict:
+        """``{channel: min envelope}`` of an AGGREGATE/DISTRIBUTION chunk."""
+        return {ch: arr[0] for ch, arr in self.data.items() if arr.ndim == 2}
+
+    @property
+    def data_max(self) -> dict:
+        """``{channel: max envelope}`` of an AGGREGATE/DISTRIBUTION chunk."""
+        return {ch: arr[1] for ch, arr in self.data.items() if arr.ndim == 2}
+
+
+class _HistoryRing:
+    """Per-channel ring of the newest samples: one writer, lock-free readers.
+
+    Sample ``k`` of a channel's stream lives at ``ring[..., k % capacity]``
+    (min/max pairs keep their leading axis of 2). The
+    writer bumps ``_seq`` to odd before touching the rings and back to even
+    after (a seqlock), so a reader on another thread copies without taking
+    a lock and retries if a write overlapped its copy.
+    """
+
+    def __init__(self, planes: dict, capacity: int, dtype):
+        # planes: {output: 1, or 2 for min/max pairs}
+        self.capacity = capacity
+        self.rings = {
+            key: np.zeros((2, capacity) if count > 1 else capacity, dtype=dtype)
+            for key, count in planes.items()}
+        self.written = {key: 0 for key in planes}
+        self._seq = 0
+
+    def write(self, data: dict) -> None:
+        """Append each channel's new samples (iterating thread only)."""
+        self._seq += 1
+        capacity = self.capacity
+        for ch, samples in data.items():
+            n = samples.shape[-1]
+            if not n:
+                continue
+            ring = self.rings[ch]
+            position = self.written[ch]
+            if n > capacity:
+                position += n - capacity
+                samples = samples[..., n - capacity:]
+                n = capacity
+            start = position % capacity
+            first = min(n, capacity - start)
+            ring[..., start:start + first] = samples[..., :first]
+            ring[..., :n - first] = samples[..., first:]
+            self.written[ch] = position + n
+        self._seq += 1
+
+    def copy(self, ch, start: int, stop: int, out: np.ndarray) -> np.ndarray:
+        """Copy stream samples ``start:stop`` of a channel, still held, into ``out``."""
+        n = stop - start
+        offset = start % self.capacity
+        first = min(n, self.capacity - offset)
+        ring = self.rings[ch]
+        out[..., :first] = ring[..., offset:offset + first]
+        out[..., first:n] = ring[..., :n - first]
+        return out[..., :n]
+
+    def _read(self, ch, n: int, out: np.ndarray) -> np.ndarray:
+        end = self.written[ch]
+        n = min(n, end, self.capacity)
+        return self.copy(ch, end - n, end, out)
+
+    def latest(self, n: int, out: dict | None = None) -> dict:
+        """Consistent copy of up to ``n`` newest samples per channel (any thread)."""
+        while True:
+            seq = self._seq
+            if seq & 1:
+                # Writer mid-update; let it finish
+                time.sleep(0)
+                continue
+            snapshot = {
+                ch: self._read(ch, n, out[ch] if out is not None else np.empty(
+                    ring.shape[:-1] + (min(n, self.capacity),), dtype=ring.dtype))
+                for ch, ring in self.rings.items()
+            }
+            if self._seq == seq:
+                return snapshot
+
+
+class TriggerWindow:
+    """One pre+post trigger window from :meth:`StreamingSession.trigger_windows`.
+
+    Attributes:
+        data (dict): ``{output: np.ndarray}`` holding the contiguous window,
+            keyed like chunk data. Arrays own their memory.
+        trigger_index (int): Stream sample index of the trigger (counted
+            from the first sample of the stream, in output samples).
+        start_index (int): Stream sample index of ``data[...][0]``.
+        trigger_offset (int): Position of the trigger within the window;
+            equals the requested pre-trigger length unless the trigger came
+            before that many samples had streamed.
+        sequence (int): 0 for the first window of the stream, then 1, 2...
+        complete (bool): False if the stream ended before the post-trigger
+            part was filled; ``data`` is then truncated.
+    """
+
+    def __init__(self, data, trigger_index, start_index, sequence, complete=True):
+        self.data = data
+        self.trigger_index = trigger_index
+        self.start_index = start_index
+        self.trigger_offset = trigger_index - start_index
+        self.sequence = sequence
+        self.complete = complete
+
+    @property
+    def n_samples(self) -> int:
+        """Samples per output in the window."""
+        if not self.data:
+            return 0
+        return max(arr.shape[-1] for arr in self.data.values())
+
+
+class PollController:
+    """Adapts the streaming poll interval to the observed buffer fill.
+
+    Each poll collects ``fill`` of a driver buffer. The controller tracks a
+    smoothed fill and scales the interval by ``target_fill / fill`` so polls
+    settle at the target: fewer, larger transfers when polls come back
+    nearly empty, earlier polls as buffers approach full. A
+    WAITING_FOR_DATA_BUFFERS status (407) means the driver ran out of
+    buffers, so the interval is halved straight away. Polls that return no
+    data stretch the interval gradually.
+
+    The counters record every decision and may be read from any thread.
+
+    Attributes:
+        interval (float): Current poll interval in seconds.
+        fill (float | None): Smoothed fill fraction of recent polls.
+        polls (int): Polls observed.
+        increases (int): Polls after which the interval grew.
+        decreases (int): Polls after which the interval shrank.
+        starvation_backoffs (int): Halvings forced by status 407.
+    """
+
+    # Weight of the newest poll in the smoothed fill
+    _SMOOTHING = 0.3
+    # Largest change applied after a single poll
+    _MAX_STEP = 2.0
+    # Growth after a poll that returned no data
+    _EMPTY_STEP = 1.25
+
+    def __init__(
+        self,
+        target_fill: float,
+        interval: float,
+        min_interval: float,
+        max_interval: float,
+    ):
+        """
+        Args:
+            target_fill (float): Fraction of a driver buffer each poll should
+                collect, in (0, 1).
+            interval (float): Initial poll interval in seconds.
+            min_interval (float): Shortest interval in seconds.
+            max_interval (float): Longest interval in seconds.
+
+        Raises:
+            PicoSDKException: If ``target_fill`` is outside (0, 1) or the
+                interval bounds are inconsistent.
+        """
+        if not 0 < target_fill < 1:
+            raise PicoSDKException(f"target_fill must be in (0, 1) (got {target_fill})")
+        if not 0 <= min_interval <= max_interval:
+            raise PicoSDKException("Poll interval bounds must satisfy 0 <= min <= max")
+        self.target_fill = target_fill
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.fill = None
+        self.polls = 0
+        self.increases = 0
+        self.decreases = 0
+        self.starvation_backoffs = 0
+
+    def update(self, fill: float, status: int) -> float:
+        """Record one poll and return the next poll interval.
+
+        Args:
+            fill (float): Fraction of a driver buffer the poll collected
+                (the fullest output).
+            status (int): Driver status of the poll.
+
+        Returns:
+            float: Seconds until the next poll.
+        """
+        self.polls += 1
+        previous = self.interval
+        if status == 407:
+            self.starvation_backoffs += 1
+            interval = previous / 2
+        elif fill <= 0:
+            interval = previous * self._EMPTY_STEP
+        else:
+            self.fill = (fill if self.fill is None
+                         else self.fill + self._SMOOTHING * (fill - self.fill))
+            step = min(max(self.target_fill / self.fill, 1 / self._MAX_STEP), self._MAX_STEP)
+            interval = previous * step
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+        if self.interval > previous:
+            self.increases += 1
+        elif self.interval < previous:
+            self.decreases += 1
+        return self.interval
+
+    def stats(self) -> dict:
+        """Snapshot of the controller state and decision counters."""
+        return {
+            'interval_s': self.interval,
+            'fill': self.fill,
+            'target_fill': self.target_fill,
+            'polls': self.polls,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'starvation_backoffs': self.starvation_backoffs,
+        }
 
 
 class StreamingSession:
@@ -396,7 +773,32 @@ class StreamingSession:
        requests are routed to the native unscaled 8-bit transfer path
        (``set_unscaled_data_buffer``).
 
-    Analog channels only for now; digital/MSO ports are not yet supported.
+    AGGREGATE (and, on the 6000a generation, DISTRIBUTION) register a
+    min/max buffer pair per channel and deliver ``(2, n)`` arrays - min
+    envelope first - so glitches survive downsampling at a fraction of the
+    RAW bandwidth. ``chunk.data_min`` / ``chunk.data_max`` split them.
+
+    ``outputs`` streams several ratio modes from one acquisition on the
+    6000a generation, e.g. RAW for archival plus a decimated view for
+    display. Every output is drained in the same driver call, so a chunk
+    holds aligned data for all of them, keyed by ``(channel, ratio_mode)``::
+
+        outputs = {psdk.CHANNEL.A: [(psdk.RATIO_MODE.RAW, 1),
+                                    (psdk.RATIO_MODE.DECIMATE, 100)]}
+        for chunk in psdk.StreamingSession(scope, 10, 'ns', outputs=outputs):
+            archive(chunk.data[psdk.CHANNEL.A, psdk.RATIO_MODE.RAW])
+            display(chunk.data[psdk.CHANNEL.A, psdk.RATIO_MODE.DECIMATE])
+
+    The driver applies one downsampling ratio to the whole stream, so every
+    downsampled output must use the same ratio.
+
+    Digital/MSO ports enabled with ``set_digital_port_on`` (or
+    ``set_digital_port`` on ps5000a) and listed in ``channels`` (or
+    ``outputs``) stream like channels: each port is
+    registered, rotated and drained in the same driver call as the analog
+    channels, so mixed-signal chunks stay sample-aligned. Chunk data for a
+    port is keyed by its DIGITAL_PORT value and holds one bit per digital
+    line in the session's datatype. Ports stream RAW or DECIMATE only.
 
     Capability walls are surfaced, not hidden: configurations a driver cannot
     express (e.g. SUM downsampling or >2^32 sample targets on ps5000a) raise
@@ -406,20 +808,83 @@ class StreamingSession:
     chunk copies to consumers. The one thread-safe entry point is
     :meth:`request_stop`, which only sets a flag - another thread (e.g. a
     GUI thread) may call it to end the loop while every driver call stays
-    on the iterating thread. ``last_info`` always holds the most recent raw
+    on the iterating thread. Applications that must share the scope between
+    threads can attach a :class:`DriverExecutor`, which runs every driver call
+    on one worker thread. ``last_info`` always holds the most recent raw
     poll result for debugging.
+
+    With ``zero_copy=True`` (6000a generation only) chunks carry read-only
+    views into the registered driver buffers instead of copies, so no data
+    is copied per poll. Each chunk leases the buffers it points into until
+    :meth:`StreamingChunk.release` is called (or its ``with`` block exits).
+    A vacated buffer is only handed back to the driver once every view into
+    it has been released; until then the driver has a single buffer left
+    and stalls when it fills. :attr:`lease_stalls` counts the polls held up
+    this way. A consumer that keeps a chunk must release it from another
+    thread, since iteration blocks until the driver has a buffer again.
+    Chunks may be released from any thread::
+
+        with psdk.StreamingSession(scope, 100, 'ns', zero_copy=True) as stream:
+            for chunk in stream:
+                with chunk:
+                    process(chunk.data[psdk.CHANNEL.A])
+
+    When copies are wanted, ``pool_size=N`` preallocates N sets of
+    per-channel output arrays that chunks borrow instead of allocating, and
+    get back on :meth:`StreamingChunk.release`. Chunks that are never
+    released are simply not recycled. If every set is borrowed, the chunk
+    falls back to fresh arrays and :attr:`pool_misses` is incremented; a
+    steady-state loop that releases each chunk allocates no sample memory.
+
+    ``history=N`` keeps the newest N samples of every channel in a
+    preallocated ring that the iterating thread updates once per poll.
+    :meth:`latest` returns a consistent snapshot of it from any thread
+    without locking, which is what a live display needs::
+
+        stream = psdk.StreamingSession(scope, 100, 'ns', history=50_000)
+        # acquisition thread: for chunk in stream: ...
+        # GUI thread, on a timer:
+        curve.setData(stream.latest()[psdk.CHANNEL.A])
+
+    ``shared_memory=N`` moves the processing out of this process instead.
+    Every chunk is also written to :attr:`shared`, a :class:`SharedStreamRing`
+    of N samples per output whose chunk descriptors carry the chunk's
+    ``sequence`` and ``start_index``. Worker processes attach a
+    :class:`SharedStreamReader` to ``stream.shared.spec`` and read the
+    samples in place, so analysis no longer competes with polling for the
+    GIL. The driver buffers stay in this process: the driver recycles them
+    with no way for another process to hold one. Readers end once the
+    session stops; ``stream.shared.close()`` frees the segment::
+
+        stream = psdk.StreamingSession(scope, 100, 'ns', shared_memory=4_000_000)
+        workers = [ctx.Process(target=analyse, args=(stream.shared.spec,))
+                   for _ in range(4)]
+
+    The poll cadence is fixed at ``poll_interval`` unless ``target_fill``
+    is given, in which case :attr:`poll_controller` adapts it after every
+    poll so each collects about that fraction of a driver buffer, backing
+    off sharply on WAITING_FOR_DATA_BUFFERS. ``poll_controller.stats()``
+    reports its decisions.
+
+    :meth:`stats` reports always-on telemetry: achieved MS/s per output,
+    driver-call and chunk-build times, buffer fill, poll jitter, starvation
+    and over-range counts. Driver time near the poll period points at USB,
+    long chunk builds at the host and large jitter at the consumer.
     """
 
-    # Downsampling modes the session supports. AGGREGATE/DISTRIBUTION need
-    # paired min/max buffers and are not yet supported here; the TRIGGER
-    # family is block-mode-only and illegal in streaming.
+    # Downsampling modes the session supports; the TRIGGER family is
+    # block-mode-only and illegal in streaming.
     _SUPPORTED_RATIO_MODES = (
         RATIO_MODE.RAW,
         RATIO_MODE.NONE,
+        RATIO_MODE.AGGREGATE,
         RATIO_MODE.DECIMATE,
         RATIO_MODE.AVERAGE,
+        RATIO_MODE.DISTRIBUTION,
         RATIO_MODE.SUM,
     )
+    # Modes delivered as min/max buffer pairs
+    _PAIRED_RATIO_MODES = (RATIO_MODE.AGGREGATE, RATIO_MODE.DISTRIBUTION)
 
     def __init__(
         self,
@@ -435,6 +900,12 @@ class StreamingSession:
         pre_trigger_samples: int = 0,
         post_trigger_samples: int | None = None,
         auto_stop: bool = False,
+        zero_copy: bool = False,
+        pool_size: int = 0,
+        history: int = 0,
+        outputs: dict | None = None,
+        target_fill: float | None = None,
+        shared_memory: int = 0,
     ):
         """
         Args:
@@ -442,18 +913,22 @@ class StreamingSession:
                 ps5000a) with channels already enabled via ``set_channel``.
             sample_interval: Requested interval between samples.
             time_units (TIME_UNIT | str): Unit for ``sample_interval``.
-            channels (list, optional): Channels to stream. Defaults to every
-                channel currently enabled on the scope.
+            channels (list, optional): Channels and digital ports to stream.
+                Defaults to every analog channel currently enabled on the
+                scope; digital ports stream only when listed here.
             datatype (DATA_TYPE, optional): Capture data type. Defaults to
                 INT16_T (supported natively on all drivers). INT8_T maps to
                 the native 8-bit path on every driver.
             ratio (int, optional): Downsampling ratio. Required >= 1 for
-                DECIMATE/AVERAGE/SUM.
+                every mode except RAW/NONE.
             ratio_mode (RATIO_MODE, optional): Downsampling mode. Defaults to
                 RAW (no downsampling).
             samples_per_buffer (int, optional): Driver transfer buffer length
-                per channel. Defaults to ~200 ms of data at the requested
-                rate, clamped to [10_000, 10_000_000].
+                per channel (per RAW output when ``outputs`` mixes RAW and
+                downsampled modes; downsampled buffers then hold the same
+                span, ``samples_per_buffer / ratio`` values). Defaults to
+                ~200 ms of data at the requested rate, clamped to
+                [10_000, 10_000_000].
             poll_interval (float, optional): Minimum seconds between driver
                 polls. Defaults to a tenth of the buffer duration, clamped
                 to [0.005, 0.05].
@@ -467,6 +942,29 @@ class StreamingSession:
                 auto_stop the driver validates the targets against device
                 memory, so the same targets may be rejected on a smaller
                 scope. Defaults to False (stream until ``stop()``).
+            zero_copy (bool, optional): Deliver leased read-only views of the
+                driver buffers instead of copies. Not available on ps5000a,
+                whose single overview buffer is recycled by the driver.
+                Defaults to False.
+            pool_size (int, optional): Number of preallocated sets of
+                per-channel output arrays (``samples_per_buffer`` long) for
+                chunks to borrow. Defaults to 0 (a new copy per chunk).
+            history (int, optional): Samples per channel to keep in a rolling
+                history ring for :meth:`latest`. Defaults to 0 (no history).
+            outputs (dict, optional): ``{channel: [(ratio_mode, ratio), ...]}``
+                to stream several ratio modes at once; replaces ``channels``,
+                ``ratio`` and ``ratio_mode``, and keys chunk data by
+                ``(channel, ratio_mode)``. Downsampled outputs must share one
+                ratio. Defaults to None (one ``ratio_mode`` for every channel,
+                chunk data keyed by channel).
+            target_fill (float, optional): Enables a :class:`PollController`
+                that adapts the poll interval so each poll collects this
+                fraction of a driver buffer, e.g. 0.5. ``poll_interval`` is
+                then the starting point. Defaults to None (fixed interval).
+            shared_memory (int, optional): Samples per output in a
+                :class:`SharedStreamRing` that every chunk is published to
+                for worker processes. Must be at least twice the driver buffer
+                length. Defaults to 0 (no shared memory).
 
         Raises:
             PicoSDKException: If the configuration is invalid or not
@@ -476,40 +974,67 @@ class StreamingSession:
         self._is_ps5000a = scope._unit_prefix_n == 'ps5000a'
 
         # --- channels ---
+        if outputs is not None:
+            if channels is not None or ratio_mode != RATIO_MODE.RAW or ratio:
+                raise PicoSDKException(
+                    "Pass either outputs or channels/ratio/ratio_mode, not both")
+            channels = list(outputs)
         if channels is None:
-            channels = sorted(scope.channel_db.keys())
+            channels = sorted(scope.channel_db)
         if not channels:
             raise PicoSDKException(
                 "No channels to stream: enable channels with set_channel() "
                 "or pass channels=[...]")
-        unknown = [ch for ch in channels if ch not in scope.channel_db]
+        unknown = [ch for ch in channels
+                   if ch not in scope.channel_db and ch not in scope.digital_port_db]
         if unknown:
             raise PicoSDKException(
-                f"Channels {unknown} are not enabled analog channels - "
-                "enable them with set_channel() first. Digital/MSO ports are "
-                "not yet supported by StreamingSession.")
+                f"Channels {unknown} are not enabled - enable analog channels "
+                "with set_channel() and digital ports with "
+                "set_digital_port_on() first.")
         self.channels = list(channels)
-
-        # --- ratio mode validation (surface capability walls early) ---
-        if ratio_mode not in self._SUPPORTED_RATIO_MODES:
-            raise PicoSDKException(
-                "StreamingSession supports RAW/NONE, DECIMATE, AVERAGE and "
-                "SUM ratio modes; AGGREGATE/DISTRIBUTION (paired min/max "
-                "buffers) are not yet supported and the TRIGGER family is "
-                "block-mode only")
-        if self._is_ps5000a and ratio_mode == RATIO_MODE.SUM:
-            raise PicoSDKException(
-                "The ps5000a driver has no SUM downsampling mode")
-        if ratio_mode not in (RATIO_MODE.RAW, RATIO_MODE.NONE) and ratio < 1:
-            raise PicoSDKException(
-                f"ratio must be >= 1 for downsampled streaming (got {ratio})")
-        # The 6000a generation spells no-downsampling RAW (0x80000000); NONE
-        # (0) exists only in the ps5000a enum. Mirror of the ps5000a driver's
-        # RAW->NONE conversion, in the opposite direction.
-        if not self._is_ps5000a and ratio_mode == RATIO_MODE.NONE:
-            ratio_mode = RATIO_MODE.RAW
+        self.digital_ports = [ch for ch in self.channels if ch in scope.digital_port_db]
+
+        # --- outputs: one registered buffer set per (channel, ratio mode) ---
+        if outputs is None:
+            for port in self.digital_ports:
+                self._check_ratio_mode(ratio_mode, ratio, port)
+            ratio_mode = self._check_ratio_mode(ratio_mode, ratio)
+            # Single-mode sessions key everything by channel alone.
+            self.outputs = {ch: (ch, ratio_mode) for ch in self.channels}
+        else:
+            self.outputs = {}
+            ratios = set()
+            for ch in self.channels:
+                for mode, mode_ratio in outputs[ch]:
+                    mode = self._check_ratio_mode(mode, mode_ratio, ch)
+                    if (ch, mode) in self.outputs:
+                        raise PicoSDKException(
+                            f"Duplicate {_RATIO_MODE_NAMES[mode]} output on "
+                            f"channel {channel_name(ch)}")
+                    self.outputs[ch, mode] = (ch, mode)
+                    if mode not in (RATIO_MODE.RAW, RATIO_MODE.NONE):
+                        ratios.add(mode_ratio)
+            if not self.outputs:
+                raise PicoSDKException("outputs lists no (ratio_mode, ratio) pairs")
+            if len(ratios) > 1:
+                raise PicoSDKException(
+                    "The driver applies one downsampling ratio to the whole "
+                    f"stream; downsampled outputs use ratios {sorted(ratios)}")
+            modes = {mode for _, mode in self.outputs.values()}
+            if self._is_ps5000a and len(modes) > 1:
+                raise PicoSDKException(
+                    "The ps5000a driver streams a single ratio mode; use the "
+                    "same (ratio_mode, ratio) output on every channel")
+            ratio = ratios.pop() if ratios else 0
+            ratio_mode = 0
+            for mode in modes:
+                ratio_mode |= mode
         self.ratio = ratio
+        # The mode passed to run_streaming: several modes are OR-ed together.
         self.ratio_mode = ratio_mode
+        self._paired = {key: mode in self._PAIRED_RATIO_MODES
+                        for key, (_, mode) in self.outputs.items()}
 
         # --- datatype validation / per-driver routing ---
         np_dtype = DataTypeNPMap.get(datatype, None)
@@ -546,14 +1071,51 @@ class StreamingSession:
         elif samples_per_buffer < 1:
             raise PicoSDKException("samples_per_buffer must be >= 1")
         self.samples_per_buffer = samples_per_buffer
+        # Alongside a RAW output, downsampled buffers cover the same span of
+        # the stream, so every output fills and rotates in step.
+        streams_raw = any(mode in (RATIO_MODE.RAW, RATIO_MODE.NONE)
+                          for _, mode in self.outputs.values())
+        self._buffer_samples = {
+            key: (samples_per_buffer
+                  if not streams_raw or mode in (RATIO_MODE.RAW, RATIO_MODE.NONE)
+                  else -(-samples_per_buffer // self.ratio))
+            for key, (_, mode) in self.outputs.items()}
 
         if poll_interval is None:
             buffer_seconds = samples_per_buffer * interval_s
             poll_interval = min(max(buffer_seconds / 10, 0.005), 0.05)
         elif poll_interval < 0:
             raise PicoSDKException("poll_interval must be >= 0")
+        # Adaptive pacing never waits longer than one buffer's worth of
+        # data, which would guarantee a stall.
+        self.poll_controller = (
+            PollController(target_fill, poll_interval, min_interval=0.0005,
+                           max_interval=samples_per_buffer * interval_s)
+            if target_fill is not None else None)
+        if self.poll_controller is not None:
+            poll_interval = self.poll_controller.interval
         self.poll_interval = poll_interval
 
+        if zero_copy and self._is_ps5000a:
+            raise PicoSDKException(
+                "zero_copy streaming needs buffer rotation, which the "
+                "ps5000a driver does not provide")
+        self.zero_copy = zero_copy
+        if pool_size < 0:
+            raise PicoSDKException("pool_size must be >= 0")
+        if pool_size and zero_copy:
+            raise PicoSDKException(
+                "pool_size has no effect with zero_copy, which does not copy")
+        self.pool_size = pool_size
+        if history < 0:
+            raise PicoSDKException("history must be >= 0")
+        if shared_memory < 0:
+            raise PicoSDKException("shared_memory must be >= 0")
+        if shared_memory and shared_memory < 2 * max(self._buffer_samples.values()):
+            raise PicoSDKException(
+                "shared_memory must hold at least two driver buffers "
+                f"({2 * max(self._buffer_samples.values())} samples)")
+
         # --- stop targets ---
         if auto_stop and post_trigger_samples is None:
             raise PicoSDKException(
@@ -577,7 +1139,41 @@ class StreamingSession:
         self._next_poll_time = 0.0
         self.actual_sample_interval: float | None = None
         self.last_info = None           # most recent raw poll result (debugging)
-        self.total_samples: dict = {ch: 0 for ch in self.channels}
+        self.total_samples: dict = {key: 0 for key in self.outputs}
+        self.chunks_delivered = 0
+        self.skipped_triggers = 0       # events trigger_windows could not capture
+        self._output_intervals: dict = {}
+
+        # --- zero-copy leases ---
+        self._lease_lock = threading.Lock()
+        self._leases: dict = {key: [0, 0] for key in self.outputs}  # views per buffer
+        self._deferred: dict = {}       # output -> vacated buffer index awaiting release
+        self.lease_stalls = 0           # polls with a rotation held back by live views
+        self.deferred_rotations = 0     # rotations that had to wait for a release
+
+        # --- output array pool ---
+        # Sets of {output: array}; deque append/pop are atomic, so chunks
+        # may be released from any thread.
+        self._pool = deque(
+            {key: np.empty(self._buffer_shape(key), dtype=self._np_dtype)
+             for key in self.outputs}
+            for _ in range(pool_size))
+        self.pool_misses = 0            # pooled chunks that had to allocate
+
+        self.telemetry = StreamingStats()  # always-on per-poll telemetry
+
+        self.recording: Recording | None = None  # active/last record() call
+
+        # --- rolling history ---
+        self._history = (_HistoryRing(
+            {key: 2 if paired else 1 for key, paired in self._paired.items()},
+            history, self._np_dtype) if history else None)
+
+        # --- shared memory for worker processes ---
+        # Created here so the spec can be handed to workers before start().
+        self.shared = (SharedStreamRing(
+            {key: 2 if paired else 1 for key, paired in self._paired.items()},
+            shared_memory, self._np_dtype) if shared_memory else None)
 
     # -- lifecycle ----------------------------------------------------------
 
@@ -595,27 +1191,33 @@ class StreamingSession:
         if self._is_ps5000a:
             # Single persistent overview buffer per channel; the driver
             # recycles it, there is no rotation.
-            for ch in self.channels:
-                if self._use_unscaled:
-                    buf = self.scope.set_unscaled_data_buffer(
-                        ch, n, ratio_mode=self.ratio_mode)
+            for key, (ch, mode) in self.outputs.items():
+                if self._paired[key]:
+                    # Min row first, as set_data_buffers lays out its pairs
+                    buf = np.zeros((2, n), dtype=self._np_dtype)
+                    register = (self.scope.set_unscaled_data_buffers if self._use_unscaled
+                                else self.scope.set_data_buffers)
+                    register(ch, n, ratio_mode=mode, buffers=buf)
+                elif self._use_unscaled:
+                    buf = self.scope.set_unscaled_data_buffer(ch, n, ratio_mode=mode)
                 else:
-                    buf = self.scope.set_data_buffer(
-                        ch, n, ratio_mode=self.ratio_mode)
-                self._buffers[ch] = [buf]
+                    buf = self.scope.set_data_buffer(ch, n, ratio_mode=mode)
+                self._buffers[key] = [buf]
         else:
             # 6000a generation: clear any stale registrations, then register
-            # a rotating pair per channel with ACTION.ADD.
+            # a rotating pair per output with ACTION.ADD.
             self.scope.set_data_buffer(
                 self.channels[0], 0, action=ACTION.CLEAR_ALL)
-            for ch in self.channels:
+            for key, (ch, mode) in self.outputs.items():
+                register = (self.scope.set_data_buffers if self._paired[key]
+                            else self.scope.set_data_buffer)
                 pair = []
                 for _ in range(2):
-                    pair.append(self.scope.set_data_buffer(
-                        ch, n, datatype=self.datatype,
-                        ratio_mode=self.ratio_mode, action=ACTION.ADD))
-                self._buffers[ch] = pair
-                self._current_index[ch] = 0
+                    pair.append(register(
+                        ch, self._buffer_samples[key], datatype=self.datatype,
+                        ratio_mode=mode, action=ACTION.ADD))
+                self._buffers[key] = pair
+                self._current_index[key] = 0
 
         self.actual_sample_interval = self.scope.run_streaming(
             sample_interval=self.sample_interval,
@@ -627,6 +1229,10 @@ class StreamingSession:
             ratio_mode=self.ratio_mode,
             overview_buffer_size=(n if self._is_ps5000a else None),
         )
+        interval_s = self.actual_sample_interval / self.time_units
+        self._output_intervals = {
+            key: interval_s * (1 if mode in (RATIO_MODE.RAW, RATIO_MODE.NONE) else self.ratio)
+            for key, (_, mode) in self.outputs.items()}
         self._started = True
 
     def stop(self) -> None:
@@ -639,6 +1245,8 @@ class StreamingSession:
         if self._started:
             self.scope.stop()
             self._started = False
+        if self.shared is not None:
+            self.shared.finish()
 
     def request_stop(self) -> None:
         """Ask the streaming loop to finish, without touching the driver.
@@ -650,6 +1258,233 @@ class StreamingSession:
         """
         self._stop_requested = True
 
+    def stats(self) -> dict:
+        """Snapshot of the streaming telemetry, safe to call from any thread.
+
+        Returns:
+            dict: The :class:`StreamingStats` snapshot - poll, chunk and
+            starvation counts, over-range chunks per channel, achieved MS/s
+            per output (``'msps'``) and histograms of driver-call time
+            (``'driver_s'``), chunk build time (``'copy_s'``), buffer fill
+            (``'fill'``) and poll-to-poll jitter (``'jitter_s'``) - plus
+            the buffer counters ``lease_stalls``, ``deferred_rotations``,
+            ``pool_misses`` and, with ``target_fill``, ``'poll_controller'``.
+        """
+        snapshot = self.telemetry.snapshot(dict(self.total_samples))
+        snapshot['lease_stalls'] = self.lease_stalls
+        snapshot['deferred_rotations'] = self.deferred_rotations
+        snapshot['pool_misses'] = self.pool_misses
+        if self.poll_controller is not None:
+            snapshot['poll_controller'] = self.poll_controller.stats()
+        return snapshot
+
+    def trigger_windows(self, pre_samples: int, post_samples: int, rearm: bool = False,
+                        trigger=None):
+        """Stream and yield one contiguous pre+post window per trigger.
+
+        Every chunk is copied into a preallocated ring holding the newest
+        ``pre_samples`` plus one driver buffer, so when a chunk reports a
+        trigger the exact ``pre_samples`` before it are still available,
+        however the trigger falls within the chunk. The post-trigger samples
+        are then copied straight from the following chunks.
+
+        Without ``trigger`` the windows follow the hardware trigger. The
+        driver's report is resolved to a stream sample index assuming the
+        6000a generation reports a cumulative raw index (divided by the
+        ratio for downsampled streams) and ps5000a an index relative to the
+        callback's data. These reference frames are not verified against
+        hardware, so check the window alignment on your device before
+        relying on it to the sample. The hardware streaming trigger fires
+        once per run, so ``rearm`` needs a :class:`SoftwareTrigger` to
+        capture every event of a long stream.
+
+        Triggers arriving while a window is still filling are skipped and
+        counted in :attr:`skipped_triggers`.
+
+        Args:
+            pre_samples (int): Samples before the trigger in each window.
+            post_samples (int): Samples from the trigger onwards.
+            rearm (bool, optional): Keep streaming for further triggers after
+                the first window. Requires ``trigger``. Defaults to False
+                (stop after one).
+            trigger (SoftwareTrigger, optional): Software trigger run on every
+                chunk instead of the hardware trigger. It is reset first.
+                Defaults to None.
+
+        Yields:
+            TriggerWindow: Each completed window; an incomplete final window
+            if the stream ends mid-window.
+
+        Raises:
+            PicoSDKException: If the lengths are invalid, the outputs run at
+                different rates, or ``rearm`` is set without ``trigger``.
+        """
+        if pre_samples < 0 or post_samples < 1:
+            raise PicoSDKException("pre_samples must be >= 0 and post_samples >= 1")
+        if rearm and trigger is None:
+            raise PicoSDKException(
+                "The hardware streaming trigger fires once per run; rearm=True "
+                "needs a SoftwareTrigger")
+        if len(set(self._buffer_samples.values())) > 1:
+            raise PicoSDKException(
+                "trigger_windows needs every output at one rate; stream RAW "
+                "and downsampled outputs in separate sessions")
+        if trigger is not None and trigger.output not in self.outputs:
+            raise PicoSDKException(f"The session has no output {trigger.output!r}")
+        planes = {key: 2 if paired else 1 for key, paired in self._paired.items()}
+        ring = _HistoryRing(planes, pre_samples + self.samples_per_buffer, self._np_dtype)
+        reference = next(iter(self.outputs))
+        if trigger is not None:
+            trigger.reset()
+        self.skipped_triggers = 0
+        sequence = 0
+        window = None       # [trigger, start, copied, arrays] of the window being filled
+        try:
+            for chunk in self:
+                with chunk:
+                    first = ring.written[reference]
+                    ring.write(chunk.data)
+                    last = ring.written[reference]
+                    if trigger is not None:
+                        pending = deque(trigger.process(chunk).tolist())
+                    elif chunk.triggered:
+                        pending = deque([self._trigger_index(first, chunk.trigger_at)])
+                    else:
+                        pending = deque()
+                    # One chunk may complete a window and open further ones
+                    while window is not None or pending:
+                        if window is None:
+                            index = pending.popleft()
+                            start = max(index - pre_samples, 0, last - ring.capacity)
+                            window = [index, start, start, {
+                                key: np.empty(ring.rings[key].shape[:-1]
+                                              + (index - start + post_samples,),
+                                              dtype=self._np_dtype)
+                                for key in ring.rings}]
+                        index, start, copied, arrays = window
+                        # Copy everything the ring now holds up to the window end
+                        end = index + post_samples
+                        stop = min(last, end)
+                        if stop > copied:
+                            for key, out in arrays.items():
+                                ring.copy(key, copied, stop, out[..., copied - start:])
+                            window[2] = stop
+                        if stop < end:
+                            break
+                        yield TriggerWindow(arrays, index, start, sequence)
+                        sequence += 1
+                        window = None
+                        if not rearm:
+                            return
+                        while pending and pending[0] < end:
+                            pending.popleft()
+                            self.skipped_triggers += 1
+                    self.skipped_triggers += len(pending)
+            if window is not None:
+                index, start, copied, arrays = window
+                yield TriggerWindow({key: out[..., :copied - start]
+                                     for key, out in arrays.items()},
+                                    index, start, sequence, complete=False)
+        finally:
+            self.stop()
+
+    def mv_to_adc(self, mv: float, channel) -> int:
+        """Convert millivolts on ``channel`` to the ADC units of the chunk data.
+
+        Like :meth:`PicoScopeBase.mv_to_adc`, but levels on 8-bit sessions
+        are scaled to match the chunk data when the scope's limits are still
+        16-bit (ps5000a, or before the 6000a generation registers its 8-bit
+        buffers). Use it for :class:`SoftwareTrigger` levels.
+        """
+        return self.scope.mv_to_adc(mv, channel) // _count_scale(self.scope, self._np_dtype)
+
+    def _trigger_index(self, chunk_start: int, trigger_at: int) -> int:
+        """Stream sample index of a hardware trigger reported with a chunk.
+
+        The driver reference frames below are assumptions, not verified on
+        hardware (see :attr:`StreamingChunk.trigger_at`).
+        """
+        if self._is_ps5000a:
+            # Assumed: StreamingReady reports triggerAt relative to the
+            # callback's data
+            return chunk_start + trigger_at
+        # Assumed: the 6000a generation reports a cumulative raw sample index
+        modes = {mode for _, mode in self.outputs.values()}
+        if modes & {RATIO_MODE.RAW, RATIO_MODE.NONE}:
+            return trigger_at
+        return trigger_at // self.ratio
+
+    def latest(self, n: int | None = None, out: dict | None = None) -> dict:
+        """Snapshot of the newest samples of every channel, from any thread.
+
+        Never blocks acquisition: the copy is retried if the iterating thread
+        updated the history meanwhile, so every channel reflects the same
+        poll.
+
+        Args:
+            n (int, optional): Samples per channel. Defaults to the whole
+                ``history``; fewer are returned until that many have arrived.
+            out (dict, optional): ``{channel: np.ndarray}`` of at least ``n``
+                samples to copy into instead of allocating.
+
+        Returns:
+            dict: ``{channel: np.ndarray}``, oldest sample first.
+
+        Raises:
+            PicoSDKException: If the session was created without ``history``.
+        """
+        if self._history is None:
+            raise PicoSDKException(
+                "latest() needs a rolling history: create the session with history=N")
+        return self._history.latest(self._history.capacity if n is None else n, out)
+
+    def record(
+        self,
+        path: str,
+        duration: float | None = None,
+        queue_size: int = 64,
+        block: bool = False,
+        ratio_mode: int | None = None,
+    ) -> Recording:
+        """Stream to disk until ``duration`` elapses, auto-stop or a stop request.
+
+        Runs the streaming loop on the calling thread and writes the chunks
+        from a background thread; see :class:`Recording` for the output
+        files, backpressure and counters. While it runs, :attr:`recording`
+        holds the live :class:`Recording`, so another thread can watch
+        ``session.recording.stats()`` and end the capture early with
+        :meth:`request_stop`. The session is stopped when this returns.
+
+        Args:
+            path (str): Output path, e.g. ``'capture.bin'``.
+            duration (float, optional): Seconds to record. Defaults to None
+                (until auto-stop or :meth:`request_stop`).
+            queue_size (int, optional): Chunks the writer may fall behind
+                before backpressure applies. Defaults to 64.
+            block (bool, optional): Wait for the writer instead of dropping
+                chunks when the queue is full. Defaults to False.
+            ratio_mode (RATIO_MODE, optional): Output to record when the
+                session streams several. Defaults to RAW.
+
+        Returns:
+            Recording: The closed recording, with its final counters.
+        """
+        recording = Recording(self, path, queue_size=queue_size, block=block,
+                              ratio_mode=ratio_mode)
+        self.recording = recording
+        recording.start()
+        try:
+            self.start()
+            deadline = None if duration is None else time.monotonic() + duration
+            for chunk in self:
+                recording.write(chunk)
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        finally:
+            self.stop()
+            recording.close()
+        return recording
+
     def __enter__(self):
         self.start()
         return self
@@ -665,17 +1500,18 @@ class StreamingSession:
         if self._is_ps5000a:
             info = self.scope.get_streaming_latest_values()
             self.last_info = info
-            # The single callback covers every registered channel with one
-            # sample count / start index; overflow is a channel bitmask.
+            # The poll's merged callbacks cover every registered channel with
+            # one sample count / start index; overflow is a channel bitmask.
             per_channel = [
                 {
+                    'key': key,
                     'channel': ch,
                     'no of samples': info['no of samples'],
                     'start index': info['start index'],
                     'Buffer index': 0,
                     'overflowed?': (int(info['overflowed?']) >> ch) & 1,
                 }
-                for ch in self.channels
+                for key, (ch, _) in self.outputs.items()
             ]
             trigger = {
                 'triggered?': info['triggered?'],
@@ -685,8 +1521,11 @@ class StreamingSession:
             return per_channel, trigger, info['status']
 
         result = self.scope.get_streaming_latest_values_multi(
-            [(ch, self.ratio_mode, self.datatype) for ch in self.channels])
+            [(ch, mode, self.datatype) for ch, mode in self.outputs.values()])
         self.last_info = result
+        # Entries come back in request order.
+        for key, entry in zip(self.outputs, result['channels']):
+            entry['key'] = key
         trigger = {
             'triggered?': result['triggered?'],
             'triggered at': result['triggered at'],
@@ -696,14 +1535,85 @@ class StreamingSession:
 
     def _handle_rotation(self, entry) -> None:
         """Hot-swap the vacated buffer when the driver moves on (6000a-gen)."""
-        ch = entry['channel']
+        key = entry['key']
         index = entry['Buffer index'] % 2
-        if index != self._current_index[ch]:
-            self._current_index[ch] = index
+        if index != self._current_index[key]:
+            self._current_index[key] = index
+            vacated = 1 - index
+            if self._leases[key][vacated]:
+                # A zero_copy chunk still views the vacated buffer; hand it
+                # back in _release_deferred() once the views are released.
+                self._deferred[key] = vacated
+                self.deferred_rotations += 1
+            else:
+                self._register(key, vacated)
+
+    def _check_ratio_mode(self, ratio_mode, ratio: int, channel=None):
+        """Validate a ratio mode for this driver and return its streaming spelling."""
+        if ratio_mode not in self._SUPPORTED_RATIO_MODES:
+            raise PicoSDKException(
+                "StreamingSession supports RAW/NONE, AGGREGATE, DECIMATE, "
+                "AVERAGE, DISTRIBUTION and SUM ratio modes; the TRIGGER "
+                "family is block-mode only")
+        if channel in self.digital_ports and ratio_mode not in (
+                RATIO_MODE.RAW, RATIO_MODE.NONE, RATIO_MODE.DECIMATE):
+            raise PicoSDKException(
+                f"Digital port {channel_name(channel)} streams RAW or DECIMATE "
+                "only; arithmetic downsampling of logic levels is meaningless")
+        if self._is_ps5000a and ratio_mode in (RATIO_MODE.SUM, RATIO_MODE.DISTRIBUTION):
+            raise PicoSDKException(
+                "The ps5000a driver has no SUM or DISTRIBUTION downsampling mode")
+        if ratio_mode not in (RATIO_MODE.RAW, RATIO_MODE.NONE) and ratio < 1:
+            raise PicoSDKException(
+                f"ratio must be >= 1 for downsampled streaming (got {ratio})")
+        # The 6000a generation spells no-downsampling RAW (0x80000000); NONE
+        # (0) exists only in the ps5000a enum. Mirror of the ps5000a driver's
+        # RAW->NONE conversion, in the opposite direction.
+        if not self._is_ps5000a and ratio_mode == RATIO_MODE.NONE:
+            return RATIO_MODE.RAW
+        return ratio_mode
+
+    def _buffer_shape(self, key) -> tuple:
+        """Shape of one output's driver buffer: ``(2, n)`` for min/max pairs."""
+        n = self._buffer_samples[key]
+        return (2, n) if self._paired[key] else (n,)
+
+    def _register(self, key, index: int) -> None:
+        """Give ``self._buffers[key][index]`` back to the driver (6000a-gen)."""
+        ch, mode = self.outputs[key]
+        if self._paired[key]:
+            self.scope.set_data_buffers(
+                ch, self._buffer_samples[key], datatype=self.datatype,
+                ratio_mode=mode, action=ACTION.ADD,
+                buffers=self._buffers[key][index])
+        else:
             self.scope.set_data_buffer(
-                ch, self.samples_per_buffer, datatype=self.datatype,
-                ratio_mode=self.ratio_mode, action=ACTION.ADD,
-                buffer=self._buffers[ch][1 - index])
+                ch, self._buffer_samples[key], datatype=self.datatype,
+                ratio_mode=mode, action=ACTION.ADD,
+                buffer=self._buffers[key][index])
+
+    def _release_deferred(self) -> None:
+        """Re-register deferred buffers whose views have all been released."""
+        stalled = False
+        for key, index in list(self._deferred.items()):
+            if self._leases[key][index]:
+                stalled = True
+            else:
+                del self._deferred[key]
+                self._register(key, index)
+        if stalled:
+            self.lease_stalls += 1
+
+    def _lease(self, keys: list) -> None:
+        with self._lease_lock:
+            for key, index in keys:
+                self._leases[key][index] += 1
+
+    def _unlease(self, keys: list) -> None:
+        """Release callback of a zero_copy chunk; may run on any thread."""
+        with self._lease_lock:
+            for key, index in keys:
+                self._leases[key][index] -= 1
 
     def _check_starvation(self, status: int) -> None:
         """Track persistent buffer starvation (status 407 with no data).
@@ -722,10 +1632,22 @@ class StreamingSession:
         starved_seconds = self._starved_polls * max(self.poll_interval, 1e-3)
         if not self._starve_warned and starved_seconds > 2.0:
             self._starve_warned = True
-            warn("Streaming driver has reported WAITING_FOR_DATA_BUFFERS "
-                 "with no data for over 2 seconds; the stream may be "
-                 "stalled. Consider a larger samples_per_buffer.",
-                 BufferTooSmall)
+            if self._deferred:
+                warn("Streaming has been stalled for over 2 seconds waiting "
+                     "for zero_copy chunks to be released; call "
+                     "chunk.release() once each chunk has been processed.",
+                     BufferTooSmall)
+            else:
+                warn("Streaming driver has reported WAITING_FOR_DATA_BUFFERS "
+                     "with no data for over 2 seconds; the stream may be "
+                     "stalled. Consider a larger samples_per_buffer.",
+                     BufferTooSmall)
+
+    def _adapt_poll_interval(self, fill: float, status: int) -> None:
+        """Feed the poll's fill to the controller and reschedule the next poll."""
+        previous = self.poll_interval
+        self.poll_interval = self.poll_controller.update(fill, status)
+        self._next_poll_time += self.poll_interval - previous
 
     # -- iteration ----------------------------------------------------------
 
@@ -737,67 +1659,138 @@ class StreamingSession:
             self.start()
 
         while True:
-            if self._stop_requested or self._finished:
-                self.stop()
-                raise StopIteration
-
-            # Pace driver polls to poll_interval regardless of data flow so
-            # chunk size tracks the configured cadence, not user-loop speed.
-            now = time.monotonic()
-            if now < self._next_poll_time:
-                time.sleep(self._next_poll_time - now)
-            self._next_poll_time = time.monotonic() + self.poll_interval
-
-            per_channel, trigger, status = self._poll()
-            got_samples = any(e['no of samples'] > 0 for e in per_channel)
-
-            if got_samples:
-                self._starved_polls = 0
-                data = {}
-                overflowed = []
-                for entry in per_channel:
-                    ch = entry['channel']
-                    n = entry['no of samples']
-                    if n <= 0:
-                        # An entry the driver did not fill carries zeroed
-                        # index fields - never rotate or copy from it.
-                        data[ch] = np.empty(0, dtype=self._np_dtype)
-                        continue
-                    start = entry['start index']
-                    buffers = self._buffers[ch]
-                    buf = buffers[entry['Buffer index'] % len(buffers)]
-                    data[ch] = buf[start:start + n].copy()
-                    self.total_samples[ch] += n
-                    # Per-entry over-range flag on the 6000a generation; the
-                    # ps5000a path decodes its channel bitmask in _poll().
-                    if entry['overflowed?']:
-                        overflowed.append(ch)
-                    if not self._is_ps5000a:
-                        self._handle_rotation(entry)
-
-                if overflowed:
-                    warn("One or more channels exceeded their input range "
-                         "during streaming (ADC over-range); affected "
-                         "channels are listed in chunk.overflowed.",
-                         OverrangeWarning)
-
-                # Auto-stop starts a drain: keep delivering buffered chunks
-                # until a poll returns no data, so the tail the driver
-                # reports alongside/after the flag is never lost.
-                if trigger['auto stopped?']:
-                    self._draining = True
-
-                return StreamingChunk(
-                    data=data,
-                    overflowed=overflowed,
-                    triggered=bool(trigger['triggered?']),
-                    trigger_at=int(trigger['triggered at']),
-                    auto_stopped=bool(trigger['auto stopped?']),
-                )
+            if not (self._stop_requested or self._finished):
+                # Pace driver polls to poll_interval regardless of data flow
+                # so chunk size tracks the configured cadence, not user-loop
+                # speed.
+                now = time.monotonic()
+                if now < self._next_poll_time:
+                    time.sleep(self._next_poll_time - now)
+            chunk = self._poll_chunk()
+            if chunk is not None:
+                return chunk
 
-            # No data in this poll.
-            if self._draining or trigger['auto stopped?']:
-                self._finished = True
-                continue
+    @property
+    def next_poll_time(self) -> float:
+        """``time.monotonic()`` at which the next poll is due."""
+        return self._next_poll_time
+
+    def _poll_chunk(self) -> StreamingChunk | None:
+        """Make one driver poll now, without pacing.
 
+        Returns:
+            StreamingChunk | None: The new data, or None if the poll returned
+            none.
+
+        Raises:
+            StopIteration: Once the session is stopped or finished; the
+                driver stop has then been made.
+        """
+        if self._stop_requested or self._finished:
+            self.stop()
+            raise StopIteration
+        self._next_poll_time = time.monotonic() + self.poll_interval
+
+        if self._deferred:
+            self._release_deferred()
+        interval = self.poll_interval
+        poll_start = time.perf_counter()
+        per_channel, trigger, status = self._poll()
+        chunk_start = time.perf_counter()
+        timestamp_ns = time.monotonic_ns()
+        fill = max(e['no of samples'] / self._buffer_samples[e['key']]
+                   for e in per_channel)
+        self.telemetry.poll(poll_start, chunk_start - poll_start, fill, status, interval)
+        if self.poll_controller is not None:
+            self._adapt_poll_interval(fill, status)
+
+        if fill > 0:
+            self._starved_polls = 0
+            start_index = dict(self.total_samples)
+            data = {}
+            overflowed = []
+            leased = []
+            outputs = None
+            if self.pool_size:
+                try:
+                    outputs = self._pool.pop()
+                except IndexError:
+                    self.pool_misses += 1
+            for entry in per_channel:
+                key = entry['key']
+                n = entry['no of samples']
+                if n <= 0:
+                    # An entry the driver did not fill carries zeroed
+                    # index fields - never rotate or copy from it.
+                    data[key] = (outputs[key][..., :0] if outputs is not None
+                                 else np.empty(self._buffer_shape(key)[:-1] + (0,),
+                                               dtype=self._np_dtype))
+                    continue
+                start = entry['start index']
+                buffers = self._buffers[key]
+                index = entry['Buffer index'] % len(buffers)
+                if self.zero_copy:
+                    view = buffers[index][..., start:start + n]
+                    view.flags.writeable = False
+                    data[key] = view
+                    leased.append((key, index))
+                elif outputs is not None:
+                    out = outputs[key][..., :n]
+                    np.copyto(out, buffers[index][..., start:start + n])
+                    data[key] = out
+                else:
+                    data[key] = buffers[index][..., start:start + n].copy()
+                self.total_samples[key] += n
+                # Per-entry over-range flag on the 6000a generation; the
+                # ps5000a path decodes its channel bitmask in _poll().
+                if entry['overflowed?'] and entry['channel'] not in overflowed:
+                    overflowed.append(entry['channel'])
+                if not self._is_ps5000a:
+                    self._handle_rotation(entry)
+
+            if overflowed:
+                warn("One or more channels exceeded their input range "
+                     "during streaming (ADC over-range); affected "
+                     "channels are listed in chunk.overflowed.",
+                     OverrangeWarning)
+
+            # Auto-stop starts a drain: keep delivering buffered chunks
+            # until a poll returns no data, so the tail the driver
+            # reports alongside/after the flag is never lost.
+            if trigger['auto stopped?']:
+                self._draining = True
+
+            if self._history is not None:
+                self._history.write(data)
+            if self.shared is not None:
+                self.shared.write(data, start_index, timestamp_ns)
+            self.telemetry.chunk(time.perf_counter() - chunk_start, overflowed)
+
+            sequence = self.chunks_delivered
+            self.chunks_delivered += 1
+            lease = None
+            if leased:
+                self._lease(leased)
+                lease = partial(self._unlease, leased)
+            elif outputs is not None:
+                lease = partial(self._pool.append, outputs)
+            return StreamingChunk(
+                data=data,
+                overflowed=overflowed,
+                triggered=bool(trigger['triggered?']),
+                trigger_at=int(trigger['triggered at']),
+                auto_stopped=bool(trigger['auto stopped?']),
+                lease=lease,
+                start_index=start_index,
+                timestamp_ns=timestamp_ns,
+                status=status,
+                sequence=sequence,
+                sample_interval=self._output_intervals,
+            )
+
+        # No data in this poll.
+        if self._draining or trigger['auto stopped?']:
+            self._finished = True
+        else:
             self._check_starvation(status)
+        return None
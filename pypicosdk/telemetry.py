@@ -0,0 +1,187 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Always-on streaming telemetry for :class:`StreamingSession`.
+
+Each poll costs a handful of counter updates and three bucket lookups, so
+the telemetry can stay enabled in production. Histograms use fixed buckets
+(powers of two for durations, 5 % steps for buffer fill): memory is
+constant however long the stream runs, and percentiles are read back to
+bucket resolution.
+"""
+import time
+from bisect import bisect_right
+from collections import Counter
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with exact count, total, min and max.
+
+    Bucket ``i`` holds values in ``[edges[i - 1], edges[i])``; the first
+    bucket everything below ``edges[0]`` and the last everything from
+    ``edges[-1]`` up.
+    """
+
+    def __init__(self, edges: list):
+        """
+        Args:
+            edges (list): Increasing bucket edges.
+        """
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def durations(cls, smallest: float = 1e-6, buckets: int = 25) -> 'Histogram':
+        """Histogram of seconds with power-of-two buckets from ``smallest`` up."""
+        return cls([smallest * 2 ** i for i in range(buckets)])
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_right(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the recorded values."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q: float) -> float | None:
+        """Upper edge of the bucket holding the ``q``-th percentile (0-100).
+
+        Clamped to the exact min and max, so the outermost buckets stay
+        meaningful.
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                upper = self.edges[i] if i < len(self.edges) else self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """Summary statistics plus the raw bucket counts."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'edges': list(self.edges),
+            'counts': list(self.counts),
+        }
+
+
+class StreamingStats:
+    """
+    Per-poll telemetry of a :class:`StreamingSession`.
+
+    Updated by the iterating thread only; :meth:`snapshot` may be called
+    from any thread.
+
+    Attributes:
+        polls (int): Driver polls made.
+        empty_polls (int): Polls that returned no data.
+        chunks (int): Chunks delivered.
+        starved_polls (int): Polls answered WAITING_FOR_DATA_BUFFERS (407).
+        overrange (Counter): Chunks with an ADC over-range, per channel.
+        driver_s (Histogram): Duration of each poll's driver call.
+        copy_s (Histogram): Time spent building each chunk from the driver
+            buffers (copying, or creating views with ``zero_copy``).
+        fill (Histogram): Fraction of a driver buffer each poll collected.
+        jitter_s (Histogram): Deviation of each poll-to-poll period from
+            the poll interval in force.
+    """
+
+    def __init__(self):
+        self.start_time = None
+        self.polls = 0
+        self.empty_polls = 0
+        self.chunks = 0
+        self.starved_polls = 0
+        self.overrange = Counter()
+        self.driver_s = Histogram.durations()
+        self.copy_s = Histogram.durations()
+        self.fill = Histogram([i / 20 for i in range(1, 21)])
+        self.jitter_s = Histogram.durations()
+        self._last_poll = None
+
+    def poll(self, started: float, duration: float, fill: float, status: int,
+             interval: float) -> None:
+        """Record one driver poll.
+
+        Args:
+            started (float): ``time.perf_counter()`` at the driver call.
+            duration (float): Seconds the driver call took.
+            fill (float): Fraction of a driver buffer collected.
+            status (int): Driver status.
+            interval (float): Poll interval in force before this poll.
+        """
+        if self.start_time is None:
+            self.start_time = started
+        if self._last_poll is not None:
+            self.jitter_s.add(abs(started - self._last_poll - interval))
+        self._last_poll = started
+        self.polls += 1
+        self.driver_s.add(duration)
+        self.fill.add(fill)
+        if fill <= 0:
+            self.empty_polls += 1
+        if status == 407:
+            self.starved_polls += 1
+
+    def chunk(self, duration: float, overflowed: list) -> None:
+        """Record one delivered chunk and the time taken to build it."""
+        self.chunks += 1
+        self.copy_s.add(duration)
+        self.overrange.update(overflowed)
+
+    @property
+    def elapsed_s(self) -> float:
+        """Seconds since the first poll."""
+        if self.start_time is None:
+            return 0.0
+        return time.perf_counter() - self.start_time
+
+    def snapshot(self, total_samples: dict) -> dict:
+        """Counters, per-output throughput and histogram summaries.
+
+        Args:
+            total_samples (dict): ``{output: samples delivered}``.
+
+        Returns:
+            dict: The snapshot; ``'msps'`` maps each output to its achieved
+            rate in MS/s.
+        """
+        elapsed = self.elapsed_s
+        return {
+            'elapsed_s': elapsed,
+            'polls': self.polls,
+            'empty_polls': self.empty_polls,
+            'chunks': self.chunks,
+            'starved_polls': self.starved_polls,
+            'overrange': dict(self.overrange),
+            'msps': {key: n / elapsed / 1e6 if elapsed else 0.0
+                     for key, n in total_samples.items()},
+            'driver_s': self.driver_s.snapshot(),
+            'copy_s': self.copy_s.snapshot(),
+            'fill': self.fill.snapshot(),
+            'jitter_s': self.jitter_s.snapshot(),
+        }
+
+
+__all__ = ['Histogram', 'StreamingStats']
@@ -0,0 +1,73 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for AGGREGATE/DISTRIBUTION streaming (paired min/max buffers)
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 4_000
+RATIO = 8
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+
+
+def _session(scope_class=psdk.ps6000a, ratio_mode=psdk.RATIO_MODE.AGGREGATE, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, SIGNAL)
+    return psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        ratio_mode=ratio_mode, ratio=RATIO, post_trigger_samples=20_000 * RATIO,
+        auto_stop=True, **kwargs)
+
+
+@pytest.mark.parametrize('scope_class', [psdk.ps6000a, psdk.psospa, psdk.ps5000a])
+def test_aggregate_envelopes_are_contiguous(scope_class):
+    """Chunks carry (2, n) min/max envelopes of consecutive ratio blocks"""
+    chunks = [(chunk.data[psdk.CHANNEL.A], chunk.data_min[psdk.CHANNEL.A],
+               chunk.data_max[psdk.CHANNEL.A]) for chunk in _session(scope_class)]
+    data = np.concatenate([pair for pair, _, _ in chunks], axis=-1)
+    assert data.shape[0] == 2 and data.shape[1] >= 20_000
+    assert all(np.array_equal(pair[0], low) and np.array_equal(pair[1], high)
+               for pair, low, high in chunks)
+    starts = np.arange(data.shape[1]) * RATIO
+    assert np.array_equal(data[0], SIGNAL[starts % PERIOD])
+    assert np.array_equal(data[1], SIGNAL[(starts + RATIO - 1) % PERIOD])
+
+
+@pytest.mark.parametrize('session_kwargs', [{'zero_copy': True}, {'pool_size': 4},
+                                            {'history': 5_000}])
+def test_distribution_buffer_modes(session_kwargs):
+    """Zero-copy, pooled and history sessions keep the paired layout"""
+    session = _session(ratio_mode=psdk.RATIO_MODE.DISTRIBUTION, **session_kwargs)
+    total = 0
+    for chunk in session:
+        with chunk:
+            pair = chunk.data[psdk.CHANNEL.A]
+            assert pair.shape == (2, chunk.n_samples)
+            assert np.all(pair[0] <= pair[1])
+            total += chunk.n_samples
+    assert total >= 20_000
+    if 'history' in session_kwargs:
+        assert session.latest()[psdk.CHANNEL.A].shape == (2, 5_000)
+
+
+def test_ps5000a_rejects_distribution():
+    """The ps5000a driver has no DISTRIBUTION mode"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session(psdk.ps5000a, ratio_mode=psdk.RATIO_MODE.DISTRIBUTION)
+
+
+def test_record_stores_each_envelope(tmp_path):
+    """Recordings of paired streams hold one min and one max stream per channel"""
+    session = _session()
+    recording = session.record(tmp_path / 'capture.bin', block=True)
+    capture = psdk.CaptureFile(tmp_path / 'capture.bin')
+    assert capture.channels == ['A_min', 'A_max']
+    assert len(capture) == recording.samples_written
+    assert np.all(capture['A_min'] <= capture['A_max'])
+    assert capture.header['channels']['A_max']['envelope'] == 'max'
@@ -0,0 +1,112 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the asyncio block and rapid block capture API
+"""
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+SCOPES = [psdk.ps6000a, psdk.psospa, psdk.ps5000a]
+
+
+def _open(scope_class, **kwargs):
+    sim = psdk.SimulatedDriver(**kwargs)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    return scope, sim
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_capture_block(scope_class):
+    """capture_block returns the same data as run_simple_block_capture"""
+    scope, sim = _open(scope_class, sample_rate=1e9)
+    timebase = scope.interval_to_timebase(8e-9)
+    buffers, time_axis = asyncio.run(scope.capture_block(timebase, 1000, output_unit='adc'))
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(buffers[psdk.CHANNEL.A], np.resize(expected, 1000))
+    assert len(time_axis) == 1000
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_capture_rapid(scope_class):
+    """capture_rapid returns one row per capture"""
+    scope, _ = _open(scope_class, sample_rate=1e9)
+    buffers, _ = asyncio.run(scope.capture_rapid(scope.interval_to_timebase(8e-9), 200, 5))
+    assert buffers[psdk.CHANNEL.A].shape == (5, 200)
+
+
+def test_captures_overlap():
+    """Three 200 ms captures on one event loop run concurrently"""
+    scopes = [_open(scope_class, sample_rate=5e3)[0] for scope_class in SCOPES]
+
+    async def capture_all():
+        return await asyncio.gather(*[
+            scope.capture_block(scope.interval_to_timebase(8e-9), 1000) for scope in scopes])
+
+    start = time.perf_counter()
+    asyncio.run(capture_all())
+    assert time.perf_counter() - start < 0.45
+
+
+def test_cancel_stops_device():
+    """Cancelling a capture stops the device and leaves it usable"""
+    scope, sim = _open(psdk.ps6000a, sample_rate=1e3)
+    timebase = scope.interval_to_timebase(8e-9)
+
+    async def cancel_then_capture():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scope.capture_block(timebase, 10_000), 0.05)
+        assert sim._block.timer.finished.is_set()  # pylint: disable=protected-access
+        return await scope.capture_block(timebase, 10)
+
+    buffers, _ = asyncio.run(cancel_then_capture())
+    assert buffers[psdk.CHANNEL.A].shape == (10,)
+
+
+class _SlowBulkDriver(psdk.SimulatedDriver):
+    """SimulatedDriver whose GetValuesBulk takes 100 ms and flags overlapping calls"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_bulk = False
+        self.overlapped = False
+
+    def GetValuesBulk(self, *args):  # pylint: disable=invalid-name
+        self.in_bulk = True
+        time.sleep(0.1)
+        self.in_bulk = False
+        return super().GetValuesBulk(*args)
+
+    def Stop(self, *args):  # pylint: disable=invalid-name
+        self.overlapped |= self.in_bulk
+        return super().Stop(*args)
+
+
+def test_ps5000a_transfer_guards_the_device():
+    """A second capture is refused, and a cancel waits for the transfer"""
+    sim = _SlowBulkDriver(sample_rate=1e9)
+    scope = psdk.ps5000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    timebase = scope.interval_to_timebase(8e-9)
+
+    async def overlap_then_cancel():
+        first = asyncio.ensure_future(scope.capture_block(timebase, 1000))
+        await asyncio.sleep(0.05)
+        assert sim.in_bulk
+        with pytest.raises(psdk.PicoSDKException):
+            await scope.capture_block(timebase, 1000)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await scope.capture_block(timebase, 10)
+
+    buffers, _ = asyncio.run(overlap_then_cancel())
+    assert not sim.overlapped
+    assert buffers[psdk.CHANNEL.A].shape == (10,)
@@ -0,0 +1,76 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Shared helpers for the benchmark scripts: timing and simulated scopes.
+"""
+import statistics
+import time
+
+import pypicosdk as psdk
+
+
+def measure(function, repeat: int = 5) -> dict:
+    """Call ``function`` ``repeat`` times and summarise the wall time.
+
+    Returns:
+        dict: ``{'best_s': ..., 'median_s': ..., 'repeat': ...}``.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {
+        'best_s': min(times),
+        'median_s': statistics.median(times),
+        'repeat': repeat,
+    }
+
+
+class TimedSimulatedDriver(psdk.SimulatedDriver):
+    """SimulatedDriver that accumulates the time spent inside data transfer calls.
+
+    Subtracting ``driver_s`` from a measurement leaves the cost of the wrapper
+    layer alone.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.driver_s = 0.0
+
+    def _timed(self, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.driver_s += time.perf_counter() - start
+
+    def GetValuesBulk(self, *args):  # pylint: disable=invalid-name
+        return self._timed(super().GetValuesBulk, *args)
+
+    def GetStreamingLatestValues(self, *args):  # pylint: disable=invalid-name
+        return self._timed(super().GetStreamingLatestValues, *args)
+
+    def SetDataBuffer(self, *args):  # pylint: disable=invalid-name
+        return self._timed(super().SetDataBuffer, *args)
+
+    def SetDataBuffers(self, *args):  # pylint: disable=invalid-name
+        return self._timed(super().SetDataBuffers, *args)
+
+
+def open_simulated(
+    channels=(psdk.CHANNEL.A,),
+    scope_class=psdk.ps6000a,
+    **driver_kwargs,
+):
+    """Open a scope on a TimedSimulatedDriver with ``channels`` enabled at 1 V.
+
+    Returns:
+        tuple: ``(scope, driver)``.
+    """
+    driver = TimedSimulatedDriver(**driver_kwargs)
+    scope = scope_class(dll=driver)
+    scope.open_unit()
+    for channel in channels:
+        scope.set_channel(channel, psdk.RANGE.V1)
+    return scope, driver
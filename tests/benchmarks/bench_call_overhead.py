@@ -0,0 +1,113 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Microbenchmark of the per-call overhead of the driver call path.
+
+Compares the original path (string concatenation + `getattr` on the DLL on
+every call) with the resolved function table used by
+`PicoScopeBase._call_attr_function`, and with a table whose functions also
+declare `argtypes` to show what full prototyping would cost. No PicoScope or
+PicoSDK install is needed: every driver function is bound to a native C
+function (`labs`) that ignores its extra arguments and returns 0 (PICO_OK),
+so only the Python and ctypes overhead is measured.
+
+Run alone with `python tests/benchmarks/bench_call_overhead.py`, or as part of
+`python tests/benchmarks/run_benchmarks.py`.
+"""
+import ctypes
+import sys
+import time
+
+import pypicosdk as psdk
+
+
+def _native_stub() -> ctypes._CFuncPtr:
+    """Return a fresh, unprototyped foreign function that returns 0."""
+    if sys.platform == 'win32':
+        lib = ctypes.cdll.msvcrt
+    else:
+        lib = ctypes.CDLL(None)
+    # Indexing (rather than attribute access) returns a new function object
+    # each time, so prototyping one stub never leaks into another.
+    return lib['labs']
+
+
+class _StubDriver:
+    """Stand-in for a loaded PicoSDK CDLL whose every function is a stub."""
+
+    def __getattr__(self, name):
+        function = _native_stub()
+        setattr(self, name, function)
+        return function
+
+
+def _per_call_ns(function, n_calls: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(n_calls):
+        function()
+    return (time.perf_counter_ns() - start) / n_calls
+
+
+def run(quick: bool = False) -> dict:
+    """Time one `IsReady` and one `GetValues` call through each call path.
+
+    Args:
+        quick (bool, optional): Make 10x fewer calls per path.
+
+    Returns:
+        dict: ``{function: {path: ns_per_call}}``.
+    """
+    n_calls = 20_000 if quick else 200_000
+    scope = psdk.ps6000a('pytest')
+    scope.dll = _StubDriver()
+    legacy_dll = _StubDriver()
+    ready = ctypes.c_int16()
+    n_samples = ctypes.c_uint64(1000)
+    overflow = ctypes.c_int16()
+    # name -> (arguments, ps6000a argtypes)
+    calls = {
+        'IsReady': (
+            (scope.handle, ctypes.byref(ready)),
+            (ctypes.c_int16, ctypes.c_void_p),
+        ),
+        'GetValues': (
+            (scope.handle, 0, ctypes.byref(n_samples), 0,
+             psdk.RATIO_MODE.RAW, 0, ctypes.byref(overflow)),
+            (ctypes.c_int16, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_uint64,
+             ctypes.c_uint32, ctypes.c_uint64, ctypes.c_void_p),
+        ),
+    }
+
+    def legacy_get_attr_function(function_name):
+        return getattr(legacy_dll, scope._unit_prefix_n + function_name)
+
+    def legacy_call_attr_function(function_name, *args):
+        # Original implementation of PicoScopeBase._call_attr_function
+        attr_function = legacy_get_attr_function(function_name)
+        status = attr_function(*args)
+        scope._error_handler(status)
+        return status
+
+    results = {}
+    for name, (args, argtypes) in calls.items():
+        resolved = scope._get_attr_function(name)
+        prototyped = _native_stub()
+        prototyped.restype = ctypes.c_uint32
+        prototyped.argtypes = argtypes
+
+        results[name] = {
+            'getattr per call (before)': _per_call_ns(
+                lambda: legacy_call_attr_function(name, *args), n_calls),
+            '_call_attr_function (after)': _per_call_ns(
+                lambda: scope._call_attr_function(name, *args), n_calls),
+            'resolved function': _per_call_ns(lambda: resolved(*args), n_calls),
+            'resolved + argtypes': _per_call_ns(lambda: prototyped(*args), n_calls),
+        }
+    return results
+
+
+if __name__ == '__main__':
+    for function_name, paths in run().items():
+        print(function_name)
+        for path, ns in paths.items():
+            print(f'  {path:<30} {ns:8.0f} ns/call')
@@ -0,0 +1,54 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Throughput of the post-capture conversions: `adc_to_mv` for 8-bit and 16-bit
+buffers, and `get_time_axis` for long captures.
+"""
+import numpy as np
+
+import pypicosdk as psdk
+from pypicosdk.constants import DataTypeNPMap
+
+from _common import measure, open_simulated
+
+
+def _adc_to_mv(scope, datatype, n_samples: int, repeat: int) -> dict:
+    scope.get_adc_limits(datatype)
+    dtype = DataTypeNPMap[datatype]
+    info = np.iinfo(dtype)
+    buffer = np.random.default_rng(0).integers(
+        info.min, info.max, n_samples, dtype=dtype, endpoint=True)
+    timing = measure(lambda: scope.adc_to_mv(buffer, psdk.CHANNEL.A), repeat=repeat)
+    return {**timing, 'msamples_per_s': n_samples / timing['best_s'] / 1e6}
+
+
+def run(quick: bool = False) -> dict:
+    """Time `adc_to_mv` on int8 and int16 buffers and `get_time_axis`.
+
+    Args:
+        quick (bool, optional): Use 10x shorter arrays and fewer repeats.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    scope, _ = open_simulated(sample_rate=1e9)
+    repeat = 3 if quick else 5
+    n_samples = 1_000_000 if quick else 10_000_000
+    results = {}
+    for name, datatype in (('int8', psdk.DATA_TYPE.INT8_T),
+                           ('int16', psdk.DATA_TYPE.INT16_T)):
+        results[f'adc_to_mv {name} x {n_samples}'] = _adc_to_mv(
+            scope, datatype, n_samples, repeat)
+
+    n_samples = 10_000_000 if quick else 100_000_000
+    timebase = scope.interval_to_timebase(8e-9)
+    timing = measure(lambda: scope.get_time_axis(timebase, n_samples, 0), repeat=repeat)
+    results[f'get_time_axis x {n_samples}'] = {
+        **timing, 'msamples_per_s': n_samples / timing['best_s'] / 1e6}
+    return results
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<30} {metrics["best_s"] * 1e3:8.1f} ms '
+              f'({metrics["msamples_per_s"]:.0f} MS/s)')
@@ -0,0 +1,40 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Row throughput of `export_to_csv` for a rapid block result.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+import pypicosdk as psdk
+
+from _common import measure
+
+
+def run(quick: bool = False) -> dict:
+    """Export 10 captures of one channel with a time axis column.
+
+    Args:
+        quick (bool, optional): Export 10x fewer rows.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    n_samples = 10_000 if quick else 100_000
+    n_captures = 10
+    rng = np.random.default_rng(0)
+    captures = [rng.standard_normal(n_samples) for _ in range(n_captures)]
+    time_axis = list(np.arange(n_samples, dtype=np.float64))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'bench.csv')
+        timing = measure(
+            lambda: psdk.export_to_csv(filename, {0: captures}, time_axis), repeat=3)
+    case = f'{n_captures} captures x {n_samples} samples'
+    return {case: {**timing, 'rows_per_s': n_samples / timing['best_s']}}
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<30} {metrics["rows_per_s"]:10.0f} rows/s')
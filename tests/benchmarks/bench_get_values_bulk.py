@@ -0,0 +1,67 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Cost of `get_values_bulk`, including its per-capture over-range decoding.
+
+Captures are kept short so the simulated transfer is cheap and the Python
+side of the call - one overflow word decoded per capture - dominates. Each
+size is timed once with no over-range and once with every capture flagged.
+"""
+import warnings
+
+import numpy as np
+
+import pypicosdk as psdk
+
+from _common import measure, open_simulated
+
+SAMPLES = 16
+
+
+def _bench_case(captures: int, over_range: bool, repeat: int) -> dict:
+    scope, driver = open_simulated(sample_rate=1e9)
+    if over_range:
+        driver.set_signal(psdk.CHANNEL.A, np.full(SAMPLES, 32767, dtype=np.int16))
+    timebase = scope.interval_to_timebase(8e-9)
+    scope.memory_segments(captures)
+    scope.set_no_of_captures(captures)
+    # Hold the buffers: the driver writes through the registered pointers.
+    buffers = scope.set_data_buffer_for_enabled_channels(SAMPLES, captures=captures)
+    scope.run_block_capture(timebase, SAMPLES)
+    scope.is_ready()
+
+    driver.driver_s = 0.0
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', psdk.OverrangeWarning)
+        timing = measure(
+            lambda: scope.get_values_bulk(SAMPLES, 0, captures - 1), repeat=repeat)
+    assert buffers[psdk.CHANNEL.A].shape == (captures, SAMPLES)
+    wrapper_s = timing['median_s'] - driver.driver_s / repeat
+    return {
+        **timing,
+        'us_per_capture': timing['median_s'] / captures * 1e6,
+        'wrapper_us_per_capture': max(wrapper_s, 0.0) / captures * 1e6,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Time `get_values_bulk` for 1k and 10k captures, clean and over-range.
+
+    Args:
+        quick (bool, optional): Repeat each case fewer times.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    results = {}
+    for captures in (1_000, 10_000):
+        for over_range in (False, True):
+            case = f'{captures} captures{" over-range" if over_range else ""}'
+            results[case] = _bench_case(captures, over_range, 3 if quick else 5)
+    return results
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<26} {metrics["best_s"] * 1e3:8.2f} ms '
+              f'({metrics["wrapper_us_per_capture"]:.2f} us/capture in the wrapper)')
@@ -0,0 +1,76 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Cost of registering rapid block buffers with `set_data_buffer_rapid_capture`.
+
+Rapid block mode registers one driver buffer per capture, so at 10k-100k
+captures the per-capture Python cost of registration dominates arming the
+scope. The bulk path (one validated block, pointers by stride arithmetic) is
+compared with the previous approach of one `set_data_buffer` call per
+capture, which validates and converts every row. Time spent inside the
+simulated `SetDataBuffer` is subtracted to give the wrapper cost alone.
+"""
+import pypicosdk as psdk
+
+from _common import measure, open_simulated
+
+SAMPLES = 64
+CHANNELS = tuple(psdk.CHANNEL.A + i for i in range(8))
+
+
+def _per_capture(scope, captures: int) -> None:
+    """Previous implementation: one full set_data_buffer round trip per capture."""
+    buffer = scope.set_data_buffer_rapid_capture(psdk.CHANNEL.A, SAMPLES, 1)
+    buffer = buffer.repeat(captures, axis=0)
+    for i in range(captures):
+        scope.set_data_buffer(psdk.CHANNEL.A, SAMPLES, i, action=psdk.ACTION.ADD,
+                              buffer=buffer[i])
+
+
+def _timed(scope, driver, function, captures: int, repeat: int) -> dict:
+    driver.driver_s = 0.0
+    timing = measure(function, repeat=repeat)
+    wrapper_s = timing['median_s'] - driver.driver_s / repeat
+    return {
+        **timing,
+        'us_per_capture': timing['median_s'] / captures * 1e6,
+        'wrapper_us_per_capture': max(wrapper_s, 0.0) / captures * 1e6,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Time one rapid registration for 1k, 10k and 100k captures, and for
+    8 channels x 50k captures through `set_data_buffer_for_enabled_channels`.
+
+    Args:
+        quick (bool, optional): Skip the largest cases and repeat less.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    repeat = 3 if quick else 5
+    scope, driver = open_simulated()
+    results = {}
+    for captures in (1_000, 10_000) if quick else (1_000, 10_000, 100_000):
+        results[f'{captures} captures bulk'] = _timed(
+            scope, driver,
+            lambda captures=captures: scope.set_data_buffer_rapid_capture(
+                psdk.CHANNEL.A, SAMPLES, captures),
+            captures, repeat)
+        results[f'{captures} captures per-capture (before)'] = _timed(
+            scope, driver, lambda captures=captures: _per_capture(scope, captures),
+            captures, repeat)
+
+    captures = 5_000 if quick else 50_000
+    scope, driver = open_simulated(CHANNELS, n_channels=8)
+    results[f'8 channels x {captures} captures'] = _timed(
+        scope, driver,
+        lambda: scope.set_data_buffer_for_enabled_channels(SAMPLES, captures=captures),
+        8 * captures, 1 if quick else 3)
+    return results
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<36} {metrics["median_s"] * 1e3:9.1f} ms '
+              f'({metrics["wrapper_us_per_capture"]:.2f} us/capture in the wrapper)')
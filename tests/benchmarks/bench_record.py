@@ -0,0 +1,51 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Sustained throughput of `StreamingSession.record`.
+
+Streams INT8 data from a SimulatedDriver that always has a full buffer
+waiting and records it to a temporary directory, reporting the disk write
+rate the recorder sustains and any chunks it had to drop.
+"""
+import tempfile
+
+import pypicosdk as psdk
+
+from _common import open_simulated
+
+
+def _bench_case(samples_per_buffer: int, duration: float, **session_kwargs) -> dict:
+    scope, _ = open_simulated(sample_rate=1e12)
+    session = psdk.StreamingSession(
+        scope, sample_interval=1, time_units='ns', datatype=psdk.DATA_TYPE.INT8_T,
+        samples_per_buffer=samples_per_buffer, poll_interval=0, **session_kwargs)
+    with tempfile.TemporaryDirectory() as directory:
+        stats = session.record(f'{directory}/capture.bin', duration=duration).stats()
+    return {
+        'write_mb_per_s': stats['write_mb_per_s'],
+        'dropped_chunks': stats['dropped_chunks'],
+        'chunks': stats['chunks_received'],
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Record for a fixed time with copied, pooled and zero-copy chunks.
+
+    Args:
+        quick (bool, optional): Record for a shorter time.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    duration = 0.5 if quick else 2.0
+    results = {}
+    for suffix, kwargs in (('', {}),
+                           (' pooled', {'pool_size': 8}),
+                           (' zero-copy', {'zero_copy': True})):
+        results[f'1ch x 1000000 int8{suffix}'] = _bench_case(1_000_000, duration, **kwargs)
+    return results
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<30}', '  '.join(f'{k}={v:.1f}' for k, v in metrics.items()))
@@ -0,0 +1,74 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Per-chunk overhead of `StreamingSession.__next__`.
+
+Streams from a SimulatedDriver that always has a full buffer waiting, with
+polling unthrottled, so each `next()` is one driver poll plus the session's
+own bookkeeping and copy. Time spent inside the simulated
+`GetStreamingLatestValues` is reported separately so the wrapper cost can be
+read off directly.
+"""
+import time
+
+import pypicosdk as psdk
+
+from _common import open_simulated
+
+CHANNELS = (psdk.CHANNEL.A, psdk.CHANNEL.B, psdk.CHANNEL.C, psdk.CHANNEL.D)
+
+
+def _bench_case(n_channels: int, samples_per_buffer: int, n_chunks: int,
+                **session_kwargs) -> dict:
+    # An effectively unbounded device rate: every poll finds a full buffer.
+    scope, driver = open_simulated(CHANNELS[:n_channels], sample_rate=1e12)
+    session = psdk.StreamingSession(
+        scope, sample_interval=1, time_units='ns',
+        samples_per_buffer=samples_per_buffer, poll_interval=0, **session_kwargs)
+    with session:
+        for _ in range(10):
+            next(session).release()
+        driver.driver_s = 0.0
+        samples = 0
+        start = time.perf_counter()
+        for _ in range(n_chunks):
+            chunk = next(session)
+            samples += chunk.n_samples
+            chunk.release()
+        elapsed = time.perf_counter() - start
+    return {
+        'us_per_chunk': elapsed / n_chunks * 1e6,
+        'driver_us_per_chunk': driver.driver_s / n_chunks * 1e6,
+        'wrapper_us_per_chunk': (elapsed - driver.driver_s) / n_chunks * 1e6,
+        'msamples_per_s': samples / elapsed / 1e6,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Time `next(session)` for 1 and 4 channels at two buffer sizes.
+
+    Each case runs with fresh copies, pooled copies and zero-copy leases.
+
+    Args:
+        quick (bool, optional): Time fewer chunks per case.
+
+    Returns:
+        dict: ``{case: {metric: value}}``.
+    """
+    results = {}
+    for n_channels in (1, 4):
+        for samples_per_buffer, n_chunks in ((1_000, 2_000), (100_000, 100)):
+            if quick:
+                n_chunks //= 10
+            for suffix, kwargs in (('', {}),
+                                   (' pooled', {'pool_size': 2}),
+                                   (' zero-copy', {'zero_copy': True})):
+                case = f'{n_channels}ch x {samples_per_buffer} samples{suffix}'
+                results[case] = _bench_case(
+                    n_channels, samples_per_buffer, n_chunks, **kwargs)
+    return results
+
+
+if __name__ == '__main__':
+    for name, metrics in run().items():
+        print(f'{name:<34}', '  '.join(f'{k}={v:.1f}' for k, v in metrics.items()))
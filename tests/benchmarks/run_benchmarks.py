@@ -0,0 +1,78 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+Run the acquisition hot-path benchmarks and report the results as JSON.
+
+Every benchmark runs against the simulated driver (or native stubs), so no
+PicoScope or PicoSDK install is needed and results from different machines
+and commits can be compared directly.
+
+Usage::
+
+    python tests/benchmarks/run_benchmarks.py                 # all, JSON to stdout
+    python tests/benchmarks/run_benchmarks.py --quick         # smaller sizes
+    python tests/benchmarks/run_benchmarks.py --only streaming rapid_buffers
+    python tests/benchmarks/run_benchmarks.py -o results.json
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+BENCHMARKS = (
+    'call_overhead',
+    'streaming',
+    'rapid_buffers',
+    'get_values_bulk',
+    'conversions',
+    'export_csv',
+    'record',
+)
+
+
+def main(argv=None) -> dict:
+    """Run the selected benchmarks and emit ``{'meta': ..., 'results': ...}``."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--quick', action='store_true',
+                        help='use smaller sizes and fewer repeats')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, metavar='NAME',
+                        help=f'benchmarks to run, from: {", ".join(BENCHMARKS)}')
+    parser.add_argument('-o', '--output', help='write the JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f'running {name}...', file=sys.stderr)
+        start = time.perf_counter()
+        results[name] = importlib.import_module(f'bench_{name}').run(quick=args.quick)
+        print(f'  done in {time.perf_counter() - start:.1f} s', file=sys.stderr)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'quick': args.quick,
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+    return report
+
+
+if __name__ == '__main__':
+    main()
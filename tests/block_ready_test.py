@@ -0,0 +1,90 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the callback-driven block readiness wait
+"""
+import ctypes
+
+import pytest
+
+import pypicosdk as psdk
+
+
+class _CountingDriver(psdk.SimulatedDriver):
+    """SimulatedDriver counting IsReady polls"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_ready_calls = 0
+
+    def IsReady(self, *args):  # pylint: disable=invalid-name
+        self.is_ready_calls += 1
+        return super().IsReady(*args)
+
+
+def _open(sample_rate):
+    sim = _CountingDriver(sample_rate=sample_rate)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    # Keep the buffers alive on the scope: the driver writes through them
+    scope.test_buffers = scope.set_data_buffer_for_enabled_channels(1000)
+    return scope, sim
+
+
+def test_wait_uses_ready_callback():
+    """A 100 ms capture is waited for without polling IsReady in a loop"""
+    scope, sim = _open(sample_rate=10e3)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 1000)
+    assert scope.get_values(1000, timeout=5) == 1000
+    assert sim.is_ready_calls <= 2
+
+
+def test_wait_times_out():
+    """is_ready raises once the timeout expires"""
+    scope, _ = _open(sample_rate=1e3)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 1000)
+    with pytest.raises(psdk.PicoSDKException):
+        scope.is_ready(timeout=0.05)
+
+
+@pytest.mark.parametrize('adaptive_sleep', [True, False])
+def test_wait_without_callback(adaptive_sleep):
+    """Captures started without a ready callback are still waited for"""
+    scope, sim = _open(sample_rate=20e3)
+    scope._call_attr_function(  # pylint: disable=protected-access
+        'RunBlock', scope.handle, 500, 500, scope.interval_to_timebase(8e-9),
+        ctypes.byref(ctypes.c_int32()), 0, None, None)
+    scope.is_ready(timeout=5, adaptive_sleep=adaptive_sleep)
+    if adaptive_sleep:
+        assert sim.is_ready_calls < 100
+    else:
+        assert sim.is_ready_calls > 100
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_skipped_wait_does_not_leak_into_next_capture(bulk):
+    """A capture read without waiting leaves no stale ready event behind"""
+    scope, _ = _open(sample_rate=20e3)
+    timebase = scope.interval_to_timebase(8e-9)
+    scope.run_block_capture(timebase, 1000)
+    # The caller learns of completion some other way; the callback has fired
+    assert scope._block_ready_event.wait(5)  # pylint: disable=protected-access
+    if bulk:
+        scope.get_values_bulk(1000, 0, 0, wait_for_ready=False)
+    else:
+        scope.get_values(1000, wait_for_ready=False)
+    # The next capture is started without a ready callback
+    scope._call_attr_function(  # pylint: disable=protected-access
+        'RunBlock', scope.handle, 500, 500, timebase,
+        ctypes.byref(ctypes.c_int32()), 0, None, None)
+    scope.is_ready(timeout=5)
+    assert scope._poll_ready()  # pylint: disable=protected-access
+
+
+def test_stop_disarms_ready_callback():
+    """stop() clears the armed callback of the abandoned capture"""
+    scope, _ = _open(sample_rate=20e3)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 1000)
+    scope.stop()
+    assert not scope._block_ready_armed  # pylint: disable=protected-access
@@ -0,0 +1,113 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the indexed capture file format and reader
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+
+def _scope():
+    scope = psdk.ps6000a(dll=psdk.SimulatedDriver(sample_rate=1e9))
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    scope.set_channel(psdk.CHANNEL.B, psdk.RANGE.V2)
+    return scope
+
+
+def test_channels_are_memmapped(tmp_path):
+    """Each channel reads back as a read-only memmap of what was written"""
+    scope = _scope()
+    buffers = {psdk.CHANNEL.A: np.arange(1000, dtype=np.int16),
+               psdk.CHANNEL.B: -np.arange(1000, dtype=np.int16)}
+    psdk.save_capture(tmp_path / 'block.bin', scope, buffers, 1e-9)
+    capture = psdk.CaptureFile(tmp_path / 'block.bin')
+    assert capture.channels == ['A', 'B']
+    assert isinstance(capture['A'], np.memmap) and not capture['A'].flags.writeable
+    assert np.array_equal(capture[psdk.CHANNEL.B], buffers[psdk.CHANNEL.B])
+    assert capture.header['adc_limits'] == [scope.min_adc_value, scope.max_adc_value]
+    volts = capture.to_volts('A', [scope.max_adc_value])
+    assert volts[0] == pytest.approx(1.0)
+
+
+def test_int8_capture_round_trips(tmp_path):
+    """INT8 block data keeps 8-bit ADC limits and converts to volts"""
+    scope = _scope()
+    buffers, _ = scope.run_simple_block_capture(
+        timebase=2, samples=1000, datatype=psdk.DATA_TYPE.INT8_T, output_unit='adc')
+    assert scope.max_adc_value == 127
+    psdk.save_capture(tmp_path / 'int8.bin', scope, {psdk.CHANNEL.A: buffers[psdk.CHANNEL.A]},
+                      1e-9)
+    capture = psdk.CaptureFile(tmp_path / 'int8.bin')
+    assert capture.header['adc_limits'] == [scope.min_adc_value, scope.max_adc_value]
+    assert np.array_equal(capture['A'], buffers[psdk.CHANNEL.A])
+    assert capture.to_volts('A', [127])[0] == pytest.approx(1.0)
+
+
+def test_rapid_captures_are_chunks(tmp_path):
+    """Rows of a rapid block capture are index chunks"""
+    scope = _scope()
+    rows = np.arange(5 * 100, dtype=np.int16).reshape(5, 100)
+    psdk.save_capture(tmp_path / 'rapid.bin', scope, {psdk.CHANNEL.A: rows}, 1e-9)
+    capture = psdk.CaptureFile(tmp_path / 'rapid_metadata.json')
+    assert capture.index.size == 5
+    assert np.array_equal(capture.chunk(3)['A'], rows[3])
+
+
+def test_rapid_captures_keep_their_own_timelines(tmp_path):
+    """Each rapid capture is a segment timed from its own first sample"""
+    scope = _scope()
+    rows = np.arange(3 * 100, dtype=np.int16).reshape(3, 100)
+    psdk.save_capture(tmp_path / 'rapid.bin', scope, {psdk.CHANNEL.A: rows}, 1e-3,
+                      timestamps_ns=[10, 20, 30])
+    capture = psdk.CaptureFile(tmp_path / 'rapid.bin')
+    assert capture.n_segments == 3
+    assert list(capture.index['stream_sample']) == [0, 0, 0]
+    assert list(capture.index['monotonic_ns']) == [10, 20, 30]
+    assert np.array_equal(capture.segment(1)['A'], rows[1])
+    assert np.array_equal(capture.window(0.01, 0.02, segment=2)['A'], rows[2, 10:20])
+    assert capture.time_axis(segment=1) == pytest.approx(np.arange(100) * 1e-3)
+    assert capture.duration_s == pytest.approx(0.1)
+    with pytest.raises(psdk.PicoSDKException):
+        capture.window(0.01, 0.02)
+
+
+def test_time_lookup_skips_gaps(tmp_path):
+    """Stream times map to file samples across a dropped chunk"""
+    with psdk.CaptureWriter(tmp_path / 'stream.bin', {psdk.CHANNEL.A: {}}, np.int16,
+                            sample_interval_s=1e-3) as writer:
+        writer.append({psdk.CHANNEL.A: np.arange(0, 100, dtype=np.int16)}, 0)
+        # Samples 100-199 of the stream were dropped
+        writer.append({psdk.CHANNEL.A: np.arange(200, 300, dtype=np.int16)}, 200)
+    capture = psdk.CaptureFile(tmp_path / 'stream.bin')
+    assert len(capture) == 200
+    assert capture.duration_s == pytest.approx(0.3)
+    assert np.array_equal(capture.window(0.05, 0.06)['A'], np.arange(50, 60))
+    assert np.array_equal(capture.window(0.15, 0.21)['A'], np.arange(200, 210))
+    assert capture.time_axis(99, 101) == pytest.approx([0.099, 0.2])
+
+
+def test_recording_reads_back(tmp_path):
+    """A StreamingSession recording opens with the reader"""
+    scope = _scope()
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=20_000,
+        post_trigger_samples=100_000, auto_stop=True)
+    recording = session.record(tmp_path / 'capture.bin', block=True)
+    capture = psdk.CaptureFile(tmp_path / 'capture.bin')
+    assert len(capture) == 100_000
+    assert capture.index.size == recording.chunks_received
+    assert capture.sample_interval_s == pytest.approx(50e-9)
+    assert capture.sample_index(50e-9 * 1234) == 1234
+
+
+def test_unequal_channel_lengths_raise(tmp_path):
+    """A chunk whose channels differ in length is refused"""
+    with psdk.CaptureWriter(tmp_path / 'bad.bin', {psdk.CHANNEL.A: {}, psdk.CHANNEL.B: {}},
+                            np.int16, sample_interval_s=1e-3) as writer:
+        with pytest.raises(psdk.PicoSDKException):
+            writer.append({psdk.CHANNEL.A: np.zeros(100, np.int16),
+                           psdk.CHANNEL.B: np.zeros(99, np.int16)})
+        assert writer.n_chunks == 0
@@ -0,0 +1,33 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the position and timing metadata of StreamingChunk
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+
+@pytest.mark.parametrize('scope_class', [psdk.ps6000a, psdk.ps5000a])
+def test_chunks_carry_stream_position(scope_class):
+    """Chunks are numbered, positioned and timed contiguously through the stream"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        ratio_mode=psdk.RATIO_MODE.AGGREGATE, ratio=4, post_trigger_samples=80_000,
+        auto_stop=True)
+    expected_index, last_time, axes = 0, 0, []
+    for sequence, chunk in enumerate(session):
+        assert chunk.sequence == sequence
+        assert chunk.start_index[psdk.CHANNEL.A] == expected_index
+        assert chunk.timestamp_ns >= last_time
+        assert chunk.status in (0, 407)
+        expected_index += chunk.n_samples
+        last_time = chunk.timestamp_ns
+        axes.append(chunk.time_axis(psdk.CHANNEL.A))
+    interval = session.actual_sample_interval / session.time_units * 4
+    assert np.allclose(np.concatenate(axes), np.arange(expected_index) * interval)
@@ -0,0 +1,66 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for StreamingCoordinator (several sessions on one thread)
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 4_000
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+
+
+def _session(scope_class, samples=20_000):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, SIGNAL)
+    return psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT16_T, post_trigger_samples=samples, auto_stop=True)
+
+
+@pytest.mark.parametrize('schedule', ['ready', 'round_robin'])
+def test_per_device_streams_are_contiguous(schedule):
+    """Each device's chunks are tagged with consecutive stream indices"""
+    coordinator = psdk.StreamingCoordinator(
+        {'a': _session(psdk.ps6000a), 'b': _session(psdk.psospa, 30_000),
+         'c': _session(psdk.ps5000a)}, schedule=schedule)
+    streams = {name: [] for name in coordinator.sessions}
+    last_time = 0
+    for item in coordinator:
+        with item:
+            data = item.data[psdk.CHANNEL.A]
+            assert item.start_index[psdk.CHANNEL.A] == sum(len(d) for d in streams[item.device])
+            assert item.sequence == len(streams[item.device])
+            assert item.timestamp_ns >= last_time
+            last_time = item.timestamp_ns
+            streams[item.device].append(data.copy())
+    for name, samples in (('a', 20_000), ('b', 30_000), ('c', 20_000)):
+        data = np.concatenate(streams[name])
+        assert len(data) >= samples
+        assert np.array_equal(data, SIGNAL[np.arange(len(data)) % PERIOD])
+    stats = coordinator.stats()
+    assert stats['msps'] > 0 and set(stats['devices']) == {'a', 'b', 'c'}
+
+
+def test_stop_ends_every_session():
+    """request_stop stops every session, not just the one that asked"""
+    sessions = [_session(psdk.ps6000a, 10_000_000), _session(psdk.psospa, 10_000_000)]
+    coordinator = psdk.StreamingCoordinator(sessions)
+    with coordinator:
+        for item in coordinator:
+            item.release()
+            if item.sequence == 3:
+                coordinator.request_stop()
+    assert not any(session._started for session in sessions)
+
+
+def test_rejects_duplicate_sessions():
+    """The same session cannot be coordinated twice"""
+    session = _session(psdk.ps6000a)
+    with pytest.raises(psdk.PicoSDKException):
+        psdk.StreamingCoordinator([session, session])
@@ -0,0 +1,74 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for streaming digital/MSO ports alongside analog channels
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 1_000
+PORTS = (psdk.DIGITAL_PORT.PORT0, psdk.DIGITAL_PORT.PORT1)
+
+
+def _scope(scope_class):
+    sim = psdk.SimulatedDriver(sample_rate=20e6, signal_period=PERIOD)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    # Channel A ramps in step with the ports' binary count
+    sim.set_signal(psdk.CHANNEL.A, np.arange(PERIOD))
+    for port in PORTS:
+        if scope_class is psdk.ps5000a:
+            scope.set_digital_port(port)
+        else:
+            scope.set_digital_port_on(port)
+    return scope
+
+
+@pytest.mark.parametrize('scope_class', [psdk.ps6000a, psdk.psospa, psdk.ps5000a])
+def test_ports_stream_aligned_with_analog(scope_class):
+    """Listed ports join the stream and stay sample-aligned with channel A"""
+    session = psdk.StreamingSession(
+        _scope(scope_class), sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        channels=[psdk.CHANNEL.A, *PORTS], post_trigger_samples=20_000, auto_stop=True)
+    assert session.channels == [psdk.CHANNEL.A, *PORTS]
+    analog, digital = [], []
+    for chunk in session:
+        assert chunk.data[PORTS[0]].shape == chunk.data[psdk.CHANNEL.A].shape
+        analog.append(chunk.data[psdk.CHANNEL.A])
+        digital.append(chunk.data[PORTS[1]])
+    analog, digital = np.concatenate(analog), np.concatenate(digital)
+    assert len(digital) >= 20_000
+    assert np.array_equal(digital, analog & 0xFF)
+
+
+def test_ports_are_recorded(tmp_path):
+    """Recordings name port streams after the port and mark them digital"""
+    session = psdk.StreamingSession(
+        _scope(psdk.ps6000a), sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        channels=[psdk.CHANNEL.A, *PORTS], post_trigger_samples=20_000, auto_stop=True,
+        datatype=psdk.DATA_TYPE.INT8_T)
+    session.record(tmp_path / 'capture.bin', block=True)
+    capture = psdk.CaptureFile(tmp_path / 'capture.bin')
+    assert capture.channels == ['A', 'PORT0', 'PORT1']
+    assert capture.header['channels']['PORT0']['digital']
+    assert np.array_equal(capture['PORT0'].view(np.uint8)[:256], np.arange(256))
+    with pytest.raises(psdk.PicoSDKException):
+        capture.to_volts('PORT0', capture['PORT0'])
+
+
+def test_ports_reject_arithmetic_downsampling():
+    """Averaging logic levels is refused rather than silently streamed"""
+    with pytest.raises(psdk.PicoSDKException):
+        psdk.StreamingSession(_scope(psdk.ps6000a), sample_interval=50, time_units='ns',
+                              channels=[psdk.CHANNEL.A, *PORTS],
+                              ratio_mode=psdk.RATIO_MODE.AVERAGE, ratio=4)
+
+
+def test_ports_are_opt_in():
+    """Enabled ports stay out of the default channels, whatever the ratio mode"""
+    session = psdk.StreamingSession(_scope(psdk.ps6000a), sample_interval=50, time_units='ns',
+                                    ratio_mode=psdk.RATIO_MODE.AVERAGE, ratio=4)
+    assert session.channels == [psdk.CHANNEL.A] and not session.digital_ports
@@ -0,0 +1,67 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the per-device DriverExecutor
+"""
+import threading
+
+import pytest
+
+import pypicosdk as psdk
+
+
+class _ThreadRecordingDriver(psdk.SimulatedDriver):
+    """SimulatedDriver recording the threads that call IsReady and PingUnit"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def IsReady(self, *args):  # pylint: disable=invalid-name
+        self.threads.add(threading.get_ident())
+        return super().IsReady(*args)
+
+    def PingUnit(self, *args):  # pylint: disable=invalid-name
+        self.threads.add(threading.get_ident())
+        return super().PingUnit(*args)
+
+
+def _open():
+    sim = _ThreadRecordingDriver(sample_rate=1e9)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    return scope, sim
+
+
+def test_driver_calls_run_on_worker():
+    """Submitted methods and direct calls from other threads all use the worker"""
+    scope, sim = _open()
+    with psdk.DriverExecutor(scope) as executor:
+        timebase = scope.interval_to_timebase(8e-9)
+        futures = [executor.submit(scope.run_simple_block_capture, timebase, 100)
+                   for _ in range(5)]
+        workers = [threading.Thread(target=scope.ping_unit) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        for future in futures:
+            buffers, _ = future.result()
+            assert buffers[psdk.CHANNEL.A].shape == (100,)
+        assert sim.threads == {executor.thread_id}
+    assert scope._executor is None  # pylint: disable=protected-access
+
+
+def test_batch_and_errors():
+    """A batch runs together and a failing command only fails its own future"""
+    scope, _ = _open()
+    with psdk.DriverExecutor(scope) as executor:
+        with executor.batch() as batch:
+            failed = batch.submit(scope.set_channel, psdk.CHANNEL.A, 'not a range')
+            ping = batch.submit(scope.ping_unit)
+        assert ping.result() is True
+        assert failed.exception() is not None
+        assert executor.commands_run == 2
+    with pytest.raises(psdk.PicoSDKException):
+        executor.submit(scope.ping_unit)
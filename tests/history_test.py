@@ -0,0 +1,72 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the StreamingSession rolling history
+"""
+import threading
+
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 30_000
+
+
+def _session(**kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    for channel in (psdk.CHANNEL.A, psdk.CHANNEL.B):
+        scope.set_channel(channel, psdk.RANGE.V1)
+        # A ramp makes any torn or out-of-order snapshot visible
+        sim.set_signal(channel, np.arange(PERIOD) - PERIOD // 2)
+    return psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=7_000,
+        post_trigger_samples=200_000, auto_stop=True, **kwargs)
+
+
+def _contiguous(samples):
+    steps = np.diff(samples.astype(np.int64))
+    return bool(np.all((steps == 1) | (steps == 1 - PERIOD)))
+
+
+def test_latest_returns_newest_samples():
+    """The history holds the newest samples, across ring wrap-around"""
+    session = _session(history=10_000)
+    data = np.concatenate([chunk.data[psdk.CHANNEL.A] for chunk in session])
+    latest = session.latest()
+    assert np.array_equal(latest[psdk.CHANNEL.A], data[-10_000:])
+    assert np.array_equal(session.latest(123)[psdk.CHANNEL.B], data[-123:])
+    out = {ch: np.empty(500, dtype=np.int16) for ch in session.channels}
+    assert session.latest(500, out=out)[psdk.CHANNEL.A].base is out[psdk.CHANNEL.A]
+
+
+def test_snapshots_are_consistent_across_threads():
+    """Snapshots taken during acquisition are never torn"""
+    session = _session(history=5_000)
+    snapshots = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            snapshot = session.latest()
+            if len(snapshot[psdk.CHANNEL.A]):
+                snapshots.append(snapshot)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for _ in session:
+        pass
+    done.set()
+    thread.join()
+    assert snapshots
+    for snapshot in snapshots:
+        a, b = snapshot[psdk.CHANNEL.A], snapshot[psdk.CHANNEL.B]
+        assert _contiguous(a) and np.array_equal(a, b)
+
+
+def test_latest_without_history_raises():
+    """latest() needs history=N"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session().latest()
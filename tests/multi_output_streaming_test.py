@@ -0,0 +1,72 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for streaming RAW plus downsampled outputs in one session
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 5_000
+RATIO = 10
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+RAW = psdk.RATIO_MODE.RAW
+DECIMATE = psdk.RATIO_MODE.DECIMATE
+AGGREGATE = psdk.RATIO_MODE.AGGREGATE
+
+
+def _scope(scope_class=psdk.ps6000a):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    for channel in (psdk.CHANNEL.A, psdk.CHANNEL.B):
+        scope.set_channel(channel, psdk.RANGE.V1)
+        sim.set_signal(channel, SIGNAL)
+    return scope
+
+
+def _session(outputs, scope_class=psdk.ps6000a, **kwargs):
+    return psdk.StreamingSession(
+        _scope(scope_class), sample_interval=50, time_units='ns', samples_per_buffer=4_000,
+        post_trigger_samples=100_000, auto_stop=True, outputs=outputs, **kwargs)
+
+
+def test_raw_and_downsampled_outputs_are_aligned():
+    """Every output is drained from the same snapshot of the stream"""
+    outputs = {psdk.CHANNEL.A: [(RAW, 1), (DECIMATE, RATIO)],
+               psdk.CHANNEL.B: [(AGGREGATE, RATIO)]}
+    session = _session(outputs)
+    raw, decimated, envelope = [], [], []
+    for chunk in session:
+        raw.append(chunk.data[psdk.CHANNEL.A, RAW])
+        decimated.append(chunk.data[psdk.CHANNEL.A, DECIMATE])
+        envelope.append(chunk.data[psdk.CHANNEL.B, AGGREGATE])
+        # Each poll covers the same stretch of the stream in every output
+        assert abs(sum(len(r) for r in raw) - RATIO * sum(len(d) for d in decimated)) < RATIO
+    raw, decimated = np.concatenate(raw), np.concatenate(decimated)
+    envelope = np.concatenate(envelope, axis=-1)
+    assert len(raw) >= 100_000
+    assert np.array_equal(decimated, raw[::RATIO][:len(decimated)])
+    assert np.array_equal(envelope[1], raw[RATIO - 1::RATIO][:envelope.shape[1]])
+    assert session.total_samples[psdk.CHANNEL.A, RAW] == len(raw)
+
+
+def test_record_archives_raw_output(tmp_path):
+    """record() stores the RAW output of a multi-output session"""
+    session = _session({psdk.CHANNEL.A: [(RAW, 1), (DECIMATE, RATIO)]}, pool_size=4)
+    recording = session.record(tmp_path / 'capture.bin', block=True)
+    capture = psdk.CaptureFile(tmp_path / 'capture.bin')
+    assert capture.header['ratio_mode'] == 'RAW'
+    assert len(capture) == recording.samples_written >= 100_000
+
+
+@pytest.mark.parametrize('scope_class, outputs', [
+    (psdk.ps6000a, {psdk.CHANNEL.A: [(DECIMATE, 10), (AGGREGATE, 20)]}),
+    (psdk.ps6000a, {psdk.CHANNEL.A: [(RAW, 1), (RAW, 1)]}),
+    (psdk.ps5000a, {psdk.CHANNEL.A: [(RAW, 1), (DECIMATE, 10)]}),
+])
+def test_inexpressible_outputs_are_rejected(scope_class, outputs):
+    """Mixed ratios, duplicates and multi-mode ps5000a streams raise"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session(outputs, scope_class)
@@ -0,0 +1,42 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for adaptive streaming poll pacing
+"""
+import pytest
+
+import pypicosdk as psdk
+
+
+def test_controller_decisions():
+    """Fill drives the interval towards the target; 407 halves it"""
+    controller = psdk.PollController(0.5, interval=0.01, min_interval=0.001, max_interval=0.1)
+    assert controller.update(0.25, 0) == pytest.approx(0.02)
+    assert controller.update(0.0, 0) == pytest.approx(0.025)
+    assert controller.update(0.9, 407) == pytest.approx(0.0125)
+    for _ in range(50):
+        controller.update(1.0, 0)
+    assert controller.interval == controller.min_interval
+    stats = controller.stats()
+    assert stats['starvation_backoffs'] == 1
+    assert stats['increases'] >= 2 and stats['decreases'] >= 2
+
+
+@pytest.mark.parametrize('poll_interval', [0.0005, 0.03])
+def test_session_converges_on_target_fill(poll_interval):
+    """Polls settle near the target fraction of a buffer from either side"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=200_000,
+        poll_interval=poll_interval, target_fill=0.3, post_trigger_samples=8_000_000,
+        auto_stop=True)
+    for chunk in session:
+        chunk.release()
+    controller = session.poll_controller
+    assert controller.polls > 10
+    # 30 % of a 10 ms buffer
+    assert 0.0015 < controller.interval < 0.006
+    assert 0.15 < controller.fill < 0.6
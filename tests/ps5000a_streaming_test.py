@@ -0,0 +1,65 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for ps5000a streaming polls with several callbacks per poll
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 4_000
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+
+
+def _scope(**kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6, **kwargs)
+    scope = psdk.ps5000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, SIGNAL)
+    return scope
+
+
+def test_poll_merges_every_callback():
+    """Several callbacks in one poll come back as one contiguous chunk"""
+    session = psdk.StreamingSession(
+        _scope(callback_samples=250), sample_interval=50, time_units='ns',
+        samples_per_buffer=3_000, datatype=psdk.DATA_TYPE.INT16_T,
+        post_trigger_samples=30_000, auto_stop=True, poll_interval=0.001)
+    chunks = [chunk.data[psdk.CHANNEL.A] for chunk in session]
+    data = np.concatenate(chunks)
+    assert len(data) >= 30_000
+    assert np.array_equal(data, SIGNAL[np.arange(len(data)) % PERIOD])
+    assert max(len(chunk) for chunk in chunks) > 250
+
+
+def test_trigger_is_rebased_onto_merged_block():
+    """A trigger in a later callback is placed in the merged block"""
+    scope = _scope(callback_samples=100)
+    scope.set_simple_trigger(psdk.CHANNEL.A)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT16_T, pre_trigger_samples=5_000)
+    window = next(session.trigger_windows(1_000, 1_000))
+    assert window.trigger_index == 5_000
+    assert np.array_equal(window.data[psdk.CHANNEL.A], SIGNAL[np.arange(4_000, 6_000) % PERIOD])
+
+
+def test_drain_splits_at_discontinuities():
+    """A block restarting the overview buffer is returned separately"""
+    scope = _scope()
+    scope._overview_size = 300
+    scope._next_start_index = 0
+    callback = scope._streaming_callback
+    callback(0, 100, 0, 0, 0, 0, 0, None)
+    callback(0, 200, 100, 1, 50, 1, 0, None)
+    callback(0, 80, 0, 0, 0, 0, 0, None)
+    first, second = scope._drain_streaming_callbacks(0)
+    assert (first['start index'], first['no of samples']) == (0, 300)
+    assert (first['triggered?'], first['triggered at'], first['overflowed?']) == (1, 150, 1)
+    assert (second['start index'], second['no of samples']) == (0, 80)
+
+    callback(0, 50, 120, 0, 0, 0, 0, None)
+    with pytest.warns(UserWarning, match='samples were lost'):
+        scope._drain_streaming_callbacks(0)
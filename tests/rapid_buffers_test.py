@@ -0,0 +1,110 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for bulk rapid block buffer registration
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+SCOPES = [psdk.ps6000a, psdk.psospa, psdk.ps5000a]
+
+
+def _open(scope_class):
+    sim = psdk.SimulatedDriver(sample_rate=1e9)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    return scope, sim
+
+
+def _capture(scope, samples, captures):
+    scope.memory_segments(captures)
+    scope.set_no_of_captures(captures)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), samples)
+    scope.get_values_bulk(samples, 0, captures - 1)
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_every_segment_is_filled(scope_class):
+    """Each row of the block receives its own capture, with the default CLEAR_ALL | ADD"""
+    scope, sim = _open(scope_class)
+    buffer = scope.set_data_buffer_rapid_capture(psdk.CHANNEL.A, 100, 50)
+    _capture(scope, 100, 50)
+    signal = np.resize(sim._signal_as(psdk.CHANNEL.A, np.int16),  # pylint: disable=protected-access
+                       50 * 100)
+    assert np.array_equal(buffer, signal.reshape(50, 100))
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_aggregate_block(scope_class):
+    """AGGREGATE registers the min and max planes of each capture"""
+    scope, _ = _open(scope_class)
+    buffer = scope.set_data_buffer_rapid_capture(
+        psdk.CHANNEL.A, 10, 4, ratio_mode=psdk.RATIO_MODE.AGGREGATE)
+    assert buffer.shape == (4, 2, 10)
+    scope.memory_segments(4)
+    scope.set_no_of_captures(4)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 100)
+    scope.get_values_bulk(100, 0, 3, ratio=10, ratio_mode=psdk.RATIO_MODE.AGGREGATE)
+    assert np.all(buffer[:, 1] > buffer[:, 0])
+
+
+def test_preallocated_block_is_validated():
+    """A caller block with the wrong shape or dtype is rejected"""
+    scope, _ = _open(psdk.ps6000a)
+    with pytest.raises(psdk.PicoSDKException):
+        scope.set_data_buffer_rapid_capture(
+            psdk.CHANNEL.A, 100, 5, buffer=np.zeros((4, 100), dtype=np.int16))
+    with pytest.raises(psdk.PicoSDKException):
+        scope.set_data_buffer_rapid_capture(
+            psdk.CHANNEL.A, 100, 5, buffer=np.zeros((5, 100), dtype=np.int8))
+    block = np.zeros((5, 100), dtype=np.int16)
+    assert scope.set_data_buffer_rapid_capture(psdk.CHANNEL.A, 100, 5, buffer=block) is block
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_bulk_overflow_matrix(scope_class):
+    """Overflow comes back as a captures x channels bool matrix with a single warning"""
+    scope, sim = _open(scope_class)
+    scope.set_channel(psdk.CHANNEL.C, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.C, [32767, -32767])
+    buffers = [scope.set_data_buffer_rapid_capture(channel, 100, 20)
+               for channel in (psdk.CHANNEL.A, psdk.CHANNEL.C)]
+    scope.memory_segments(20)
+    scope.set_no_of_captures(20)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 100)
+    with pytest.warns(psdk.OverrangeWarning) as record:
+        _, overflow = scope.get_values_bulk(100, 0, 19)
+    assert len(record) == 1
+    assert 'C' in str(record[0].message)
+    assert overflow.dtype == bool and overflow.shape == (20, 8)
+    assert overflow[:, psdk.CHANNEL.C].all()
+    assert not np.delete(overflow, psdk.CHANNEL.C, axis=1).any()
+    assert scope.over_range == 1 << psdk.CHANNEL.C
+    assert len(buffers) == 2
+
+
+def test_wrapped_range_after_memory_segments_by_samples():
+    """A wrapping bulk read is sized from the segments memory_segments_by_samples set up"""
+    sim = psdk.SimulatedDriver(sample_rate=1e9, max_memory=2_000)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, [32767, -32767])
+    assert scope.memory_segments_by_samples(100) == 20
+    buffer = scope.set_data_buffer_rapid_capture(psdk.CHANNEL.A, 100, 20)
+    scope.set_no_of_captures(20)
+    scope.run_block_capture(scope.interval_to_timebase(8e-9), 100)
+    with pytest.warns(psdk.OverrangeWarning):
+        _, overflow = scope.get_values_bulk(100, 18, 1)
+    assert overflow.shape == (4, 8) and overflow[:, psdk.CHANNEL.A].all()
+    assert np.all(buffer[[18, 19, 0, 1]] != 0)
+
+
+def test_wrapped_range_needs_segment_count():
+    """Without a configured segment count a wrapping read is refused"""
+    scope, _ = _open(psdk.ps6000a)
+    with pytest.raises(psdk.PicoSDKException):
+        scope.get_values_bulk(100, 3, 1, wait_for_ready=False)
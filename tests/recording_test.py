@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for StreamingSession.record
+"""
+import json
+import threading
+
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+CHANNELS = (psdk.CHANNEL.A, psdk.CHANNEL.B)
+
+
+def _session(scope_class=psdk.ps6000a, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    with pytest.warns(UserWarning):
+        scope.set_channel(psdk.CHANNEL.B, psdk.RANGE.V2, probe_scale=10)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=20_000,
+        post_trigger_samples=100_000, auto_stop=True, **kwargs)
+    return session, sim
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'zero_copy': True}, {'pool_size': 4}])
+def test_record_writes_every_channel(tmp_path, kwargs):
+    """Each channel file holds the full stream; the sidecar describes it"""
+    session, sim = _session(**kwargs)
+    recording = session.record(tmp_path / 'capture.bin', block=True)
+    assert recording.dropped_samples == 0
+    for ch in CHANNELS:
+        name = psdk.CHANNEL_NAMES[ch]
+        data = np.fromfile(tmp_path / f'capture_{name}.bin', dtype=np.int16)
+        expected = sim._signal_as(ch, np.int16)  # pylint: disable=protected-access
+        assert np.array_equal(data, np.resize(expected, 100_000))
+    with open(tmp_path / 'capture_metadata.json', encoding='utf-8') as file:
+        metadata = json.load(file)
+    assert metadata['n_samples'] == 100_000
+    assert metadata['dtype'] == '<i2'
+    assert metadata['sample_interval_s'] == pytest.approx(50e-9)
+    assert metadata['n_chunks'] == recording.chunks_received
+    assert metadata['channels']['B'] == {
+        'file': 'capture_B.bin', 'range': 'V2', 'range_mv': 2000, 'probe_scale': 10}
+    assert not session._started  # pylint: disable=protected-access
+
+
+def test_full_queue_drops_and_records_gaps(tmp_path):
+    """Without block=True a full queue drops chunks and accounts for them"""
+    session, _ = _session()
+    recording = psdk.Recording(session, tmp_path / 'capture.bin', queue_size=1)
+    # Writer not started yet: the queue takes one chunk, the rest are dropped
+    chunks = 0
+    for chunk in session:
+        recording.write(chunk)
+        chunks += 1
+    recording.start()
+    metadata = recording.close()
+    assert recording.dropped_chunks == chunks - 1 > 0
+    assert recording.samples_written == np.fromfile(tmp_path / 'capture_A.bin', np.int16).size
+    assert recording.samples_written + recording.dropped_samples == recording.samples_received
+    assert metadata['gaps'] and metadata['dropped_samples'] == recording.dropped_samples
+    assert chunks == recording.chunks_received
+
+
+def test_writer_error_reaches_a_blocked_producer(tmp_path):
+    """Any writer failure is raised to the producer, which never deadlocks"""
+    session, _ = _session()
+    recording = psdk.Recording(session, tmp_path / 'capture.bin', queue_size=1, block=True)
+    recording.start()
+
+    def fail(*args, **kwargs):
+        raise ValueError('bad chunk')
+    recording._writer.append = fail  # pylint: disable=protected-access
+    errors = []
+
+    def produce():
+        try:
+            for chunk in session:
+                recording.write(chunk)
+        except psdk.PicoSDKException as exc:
+            errors.append(exc)
+        finally:
+            session.stop()
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert isinstance(errors[0].__cause__, ValueError)
+    with pytest.raises(psdk.PicoSDKException):
+        recording.close()
@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for streaming to worker processes through shared memory
+"""
+import multiprocessing
+
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 4_000
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+
+
+def _session(scope_class, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, SIGNAL)
+    return psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT16_T, auto_stop=True, **kwargs)
+
+
+def _worker(spec, results):
+    """Sum each chunk in place, as an analysis process would"""
+    with psdk.SharedStreamReader(spec) as reader:
+        sums = [(chunk.start_index[psdk.CHANNEL.A], int(chunk.data[psdk.CHANNEL.A].sum()))
+                for chunk in reader.chunks(timeout=10)]
+        results.put((sums, reader.missed))
+
+
+@pytest.mark.parametrize('scope_class', [psdk.ps6000a, psdk.ps5000a])
+def test_reader_sees_every_chunk(scope_class):
+    """A reader polling alongside the session sees every chunk in place"""
+    session = _session(scope_class, post_trigger_samples=30_000, shared_memory=200_000)
+    reader = psdk.SharedStreamReader(session.shared.spec)
+    expected = []
+    for chunk in session:
+        data = chunk.data[psdk.CHANNEL.A]
+        expected.append((chunk.sequence, chunk.start_index[psdk.CHANNEL.A], data.copy()))
+        # Readers get each chunk as soon as it is delivered
+        (shared,) = reader.poll()
+        assert (shared.sequence, shared.start_index[psdk.CHANNEL.A]) == expected[-1][:2]
+        assert np.array_equal(shared.data[psdk.CHANNEL.A], data)
+        assert shared.valid()
+    assert reader.finished and reader.missed == 0
+    stream = np.concatenate([data for _, _, data in expected])
+    assert np.array_equal(stream, SIGNAL[np.arange(len(stream)) % PERIOD])
+    reader.close()
+    session.shared.close()
+
+
+def test_slow_reader_counts_lost_chunks():
+    """A reader left a ring behind counts the chunks it lost"""
+    session = _session(psdk.ps6000a, post_trigger_samples=60_000, shared_memory=6_000,
+                       outputs={psdk.CHANNEL.A: [(psdk.RATIO_MODE.AGGREGATE, 4),
+                                                 (psdk.RATIO_MODE.RAW, 0)]})
+    reader = psdk.SharedStreamReader(session.shared.spec)
+    next(session)
+    (first,) = reader.poll()
+    assert first.valid()
+    assert first.data[psdk.CHANNEL.A, psdk.RATIO_MODE.AGGREGATE].shape[0] == 2
+    delivered = 1 + sum(1 for _ in session)
+    # The writer never waits: the ring has since wrapped over the first chunk
+    assert not first.valid()
+    kept = list(reader.chunks())
+    assert reader.missed > 0 and 1 + len(kept) + reader.missed == delivered
+    assert all(chunk.valid() for chunk in kept)
+    reader.close()
+    session.shared.close()
+
+
+def test_worker_process_reads_without_copies():
+    """A spawned worker reads the whole stream from the shared ring"""
+    session = _session(psdk.ps6000a, post_trigger_samples=40_000, shared_memory=400_000)
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    worker = context.Process(target=_worker, args=(session.shared.spec, results))
+    worker.start()
+    expected = [(chunk.start_index[psdk.CHANNEL.A], int(chunk.data[psdk.CHANNEL.A].sum()))
+                for chunk in session]
+    sums, missed = results.get(timeout=30)
+    worker.join(timeout=30)
+    session.shared.close()
+    assert (sums, missed) == (expected, 0)
+
+
+def test_ring_must_hold_two_buffers():
+    """shared_memory smaller than two driver buffers is refused"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session(psdk.ps6000a, post_trigger_samples=10_000, shared_memory=5_000)
@@ -0,0 +1,60 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for running captures against the simulated driver
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+SCOPES = [psdk.ps6000a, psdk.psospa, psdk.ps5000a]
+
+
+def _open(scope_class, **kwargs):
+    sim = psdk.SimulatedDriver(**kwargs)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    return scope, sim
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_block_capture(scope_class):
+    """Block capture fills the buffer with the simulated signal"""
+    scope, sim = _open(scope_class, sample_rate=1e9)
+    timebase = scope.interval_to_timebase(8e-9)
+    buffers, time_axis = scope.run_simple_block_capture(timebase, 1000, output_unit='adc')
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(buffers[psdk.CHANNEL.A], np.resize(expected, 1000))
+    assert len(time_axis) == 1000
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_rapid_block_capture(scope_class):
+    """Rapid block capture returns one row per capture"""
+    scope, _ = _open(scope_class, sample_rate=1e9)
+    timebase = scope.interval_to_timebase(8e-9)
+    buffers, _ = scope.run_simple_rapid_block_capture(timebase, 200, 5)
+    assert buffers[psdk.CHANNEL.A].shape == (5, 200)
+    assert scope.get_trigger_info(0, 5)[4]['segmentIndex'] == 4
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_streaming_is_contiguous(scope_class):
+    """Chunks from an auto-stop stream join into the uninterrupted signal"""
+    scope, sim = _open(scope_class, sample_rate=20e6)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=20_000,
+        post_trigger_samples=100_000, auto_stop=True)
+    data = np.concatenate([chunk.data[psdk.CHANNEL.A] for chunk in session])
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(data, np.resize(expected, 100_000))
+    assert sim.dropped_samples == 0
+
+
+def test_unimplemented_call_raises():
+    """Calls the simulator does not provide fail at lookup"""
+    scope, _ = _open(psdk.ps6000a)
+    with pytest.raises(AttributeError):
+        scope.get_scope_state()
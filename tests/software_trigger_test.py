@@ -0,0 +1,103 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the software triggers run on streamed chunks
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 1_000
+# Triangle wave between -500 and 499: one rising pass through 0 per period
+TRIANGLE = np.abs(np.arange(PERIOD) - PERIOD // 2) * 2 - PERIOD // 2
+
+
+def _detect_in_chunks(trigger, data, sizes):
+    events, position = [], 0
+    for size in sizes:
+        events.extend(trigger.detect(data[position:position + size]).tolist())
+        position += size
+    return events
+
+
+def test_edge_events_independent_of_chunking():
+    """Events straddling chunk boundaries are found once, at the same index"""
+    data = np.tile(TRIANGLE, 20).astype(np.int16)
+    whole = psdk.EdgeTrigger(psdk.CHANNEL.A, 0, hysteresis=50).detect(data).tolist()
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(1, 700, size=200)
+    chunked = _detect_in_chunks(psdk.EdgeTrigger(psdk.CHANNEL.A, 0, hysteresis=50),
+                                data, sizes)
+    assert whole == chunked
+    assert whole == [PERIOD * i + 750 for i in range(20)]
+
+
+def test_hysteresis_suppresses_noise():
+    """Noise around the level gives one event per crossing with hysteresis"""
+    data = np.array([-100, 5, -5, 5, -5, 100, -5, 5, -100, 5], dtype=np.int16)
+    assert psdk.EdgeTrigger('A', 0).detect(data).tolist() == [1, 3, 5, 7, 9]
+    assert psdk.EdgeTrigger('A', 0, hysteresis=20).detect(data).tolist() == [1, 9]
+    falling = psdk.EdgeTrigger('A', 0, hysteresis=20, direction='falling')
+    assert falling.detect(data).tolist() == [6]
+
+
+def test_window_exit_and_enter():
+    """Window triggers fire on leaving or entering the window"""
+    data = np.array([0, 50, 200, 150, 90, 0, -200, 0], dtype=np.int16)
+    exit_trigger = psdk.WindowTrigger('A', -100, 100, hysteresis=20)
+    assert exit_trigger.detect(data).tolist() == [2, 6]
+    enter_trigger = psdk.WindowTrigger('A', -100, 100, on='enter')
+    assert enter_trigger.detect(data).tolist() == [4, 7]
+
+
+def test_envelope_block_spanning_crossing_fires():
+    """A crossing within one min/max block fires on that block"""
+    pairs = np.array([[-10, -10, 20, -10], [-5, 15, 30, 5]], dtype=np.int8)
+    assert psdk.EdgeTrigger('A', 10).detect(pairs).tolist() == [1]
+
+
+def test_software_trigger_windows_capture_every_event():
+    """trigger_windows with a software trigger yields a window per event"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    signal = np.repeat(np.tile(TRIANGLE, 4), 8) * 40
+    sim.set_signal(psdk.CHANNEL.A, signal)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT16_T, post_trigger_samples=80_000, auto_stop=True)
+    level = session.mv_to_adc(0, psdk.CHANNEL.A)
+    trigger = psdk.EdgeTrigger(psdk.CHANNEL.A, level, hysteresis=1_000)
+    windows = [w for w in session.trigger_windows(100, 200, rearm=True, trigger=trigger)
+               if w.complete]
+    assert [w.trigger_index for w in windows] == [750 * 8 + PERIOD * 8 * i for i in range(10)]
+    for window in windows:
+        expected = signal[np.arange(window.start_index, window.start_index + 300) % len(signal)]
+        assert np.array_equal(window.data[psdk.CHANNEL.A], expected)
+
+
+def test_int8_levels_match_chunk_data():
+    """mv_to_adc gives 8-bit levels before and after the buffers are registered"""
+    scope = psdk.ps6000a(dll=psdk.SimulatedDriver(sample_rate=20e6))
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT8_T, post_trigger_samples=30_000, auto_stop=True)
+    assert session.mv_to_adc(500, psdk.CHANNEL.A) == 63
+    with session:
+        next(iter(session))
+        assert scope.max_adc_value == 127
+        assert session.mv_to_adc(500, psdk.CHANNEL.A) == 63
+
+
+def test_incomplete_trigger_fails_at_creation():
+    """A subclass without _masks cannot be instantiated"""
+
+    class _Incomplete(psdk.SoftwareTrigger):  # pylint: disable=abstract-method
+        pass
+
+    with pytest.raises(TypeError):
+        _Incomplete(psdk.CHANNEL.A)
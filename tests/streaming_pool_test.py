@@ -0,0 +1,54 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the StreamingSession output-array pool
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+SCOPES = [psdk.ps6000a, psdk.psospa, psdk.ps5000a]
+
+
+def _session(scope_class, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=20_000,
+        post_trigger_samples=100_000, auto_stop=True, **kwargs)
+    return session, sim
+
+
+@pytest.mark.parametrize('scope_class', SCOPES)
+def test_released_chunks_recycle_arrays(scope_class):
+    """Released chunks hand their arrays back; the stream stays intact"""
+    session, sim = _session(scope_class, pool_size=2)
+    data, bases = [], set()
+    for chunk in session:
+        with chunk:
+            array = chunk.data[psdk.CHANNEL.A]
+            bases.add(id(array.base))
+            data.append(array.copy())
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(np.concatenate(data), np.resize(expected, 100_000))
+    assert len(bases) == 1
+    assert session.pool_misses == 0
+
+
+def test_exhausted_pool_falls_back():
+    """Chunks kept past the pool size get fresh arrays and are counted"""
+    session, _ = _session(psdk.ps6000a, pool_size=1)
+    chunks = list(session)
+    assert len(chunks) > 1
+    assert session.pool_misses == len(chunks) - 1
+    assert chunks[0].leased and not chunks[1].leased
+    assert chunks[1].data[psdk.CHANNEL.A].flags.owndata
+
+
+def test_pool_with_zero_copy_is_rejected():
+    """zero_copy does not copy, so a pool is a configuration error"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session(psdk.ps6000a, pool_size=2, zero_copy=True)
@@ -0,0 +1,78 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for the legacy StreamingScope rolling buffer
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+from pypicosdk.streaming import StreamingScope, _RollingBuffer
+
+
+def _reference(chunks, samples, max_buffer_size, rows):
+    """The concatenating implementation the rolling buffer replaced"""
+    shape = () if rows is None else (rows,)
+    buffer = np.zeros(shape + (samples,))
+    for new_data in chunks:
+        pad_len = max(samples - (buffer.shape[-1] + new_data.shape[-1]), 0)
+        buffer = np.concatenate([np.zeros(shape + (pad_len,)), buffer, new_data], axis=-1)
+        if max_buffer_size is not None:
+            buffer = buffer[..., -max_buffer_size:]
+    return buffer
+
+
+@pytest.mark.parametrize('rows', [None, 2])
+@pytest.mark.parametrize('max_buffer_size', [1_000, 2_500, None])
+def test_matches_concatenation(rows, max_buffer_size):
+    """The rolling buffer reads back exactly what concatenation produced"""
+    rng = np.random.default_rng(1)
+    shape = () if rows is None else (rows,)
+    buffer = _RollingBuffer(max_buffer_size, 1_000, rows)
+    chunks = []
+    for n in rng.integers(0, 1_500, size=40):
+        chunks.append(rng.integers(-100, 100, size=shape + (int(n),)))
+        buffer.append(chunks[-1])
+        expected = _reference(chunks, 1_000, max_buffer_size, rows)
+        assert np.array_equal(buffer.view(), expected)
+
+
+def test_streaming_scope_keeps_newest_samples():
+    """StreamingScope.buffer holds the newest max_buffer_size samples"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, np.arange(20_000) - 10_000)
+    stream = StreamingScope(scope)
+    stream.config_streaming(psdk.CHANNEL.A, 4_000, 50, 'ns')
+    stream.run_streaming()
+    received = 0
+    while received < 12_000:
+        stream.get_streaming_values()
+        received += stream.info['no of samples']
+    scope.stop()
+    assert stream.buffer.shape == (4_000,)
+    assert np.array_equal(stream.buffer, np.arange(received - 4_000, received) - 10_000)
+
+
+def test_buffer_can_be_assigned():
+    """Assigning buffer replaces its contents and streamed samples follow on"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.A, np.arange(20_000) - 10_000)
+    stream = StreamingScope(scope)
+    stream.config_streaming(psdk.CHANNEL.A, 4_000, 50, 'ns')
+    stream.max_buffer_size = None
+    stream.buffer = np.full(10, 5)
+    assert np.array_equal(stream.buffer, np.r_[np.zeros(3_990), np.full(10, 5)])
+    stream.run_streaming()
+    received = 0
+    while not received:
+        stream.get_streaming_values()
+        received = stream.info['no of samples']
+    scope.stop()
+    assert np.array_equal(stream.buffer, np.r_[np.zeros(3_990), np.full(10, 5),
+                                               np.arange(received) - 10_000])
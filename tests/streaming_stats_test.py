@@ -0,0 +1,48 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for StreamingSession telemetry
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+from pypicosdk.telemetry import Histogram
+
+
+def test_histogram_summaries():
+    """Percentiles resolve to bucket edges, clamped to the exact extremes"""
+    histogram = Histogram.durations(smallest=1.0, buckets=8)
+    for value in (1.5, 3.0, 3.5, 100.0):
+        histogram.add(value)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 4 and snapshot['mean'] == pytest.approx(27.0)
+    assert histogram.percentile(50) == 4.0
+    assert histogram.percentile(99) == 100.0
+    assert sum(snapshot['counts']) == 4
+
+
+def test_session_stats():
+    """Stats count every poll and report throughput and over-range chunks"""
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = psdk.ps6000a(dll=sim)
+    scope.open_unit()
+    for channel in (psdk.CHANNEL.A, psdk.CHANNEL.B):
+        scope.set_channel(channel, psdk.RANGE.V1)
+    sim.set_signal(psdk.CHANNEL.B, np.full(100, 32767))
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=100_000,
+        post_trigger_samples=2_000_000, auto_stop=True, pool_size=2)
+    with pytest.warns(psdk.OverrangeWarning):
+        chunks = 0
+        for chunk in session:
+            chunks += 1
+            chunk.release()
+    stats = session.stats()
+    assert stats['chunks'] == chunks
+    assert stats['polls'] == stats['driver_s']['count'] == stats['fill']['count']
+    assert stats['copy_s']['count'] == chunks
+    assert stats['overrange'] == {psdk.CHANNEL.B: chunks}
+    assert 5 < stats['msps'][psdk.CHANNEL.A] < 40
+    assert 0 < stats['fill']['max'] <= 1
+    assert stats['pool_misses'] == 0
@@ -0,0 +1,78 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for StreamingSession.trigger_windows (pre-trigger window capture)
+"""
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+PERIOD = 50_000
+SIGNAL = np.arange(PERIOD) - PERIOD // 2
+PRE_TRIGGER = 7_000
+
+
+def _session(scope_class=psdk.ps6000a, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    scope.set_simple_trigger(psdk.CHANNEL.A)
+    sim.set_signal(psdk.CHANNEL.A, SIGNAL)
+    kwargs.setdefault('pre_trigger_samples', PRE_TRIGGER)
+    return psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=3_000,
+        datatype=psdk.DATA_TYPE.INT16_T, **kwargs)
+
+
+@pytest.mark.parametrize('scope_class', [psdk.ps6000a, psdk.ps5000a])
+def test_window_is_contiguous_around_trigger(scope_class):
+    """The window holds exactly pre + post stream samples around the trigger"""
+    session = _session(scope_class)
+    windows = list(session.trigger_windows(2_000, 5_000))
+    assert len(windows) == 1
+    window = windows[0]
+    assert window.complete and window.sequence == 0
+    assert window.trigger_index == PRE_TRIGGER
+    assert window.trigger_offset == 2_000
+    data = window.data[psdk.CHANNEL.A]
+    assert data.shape == (7_000,)
+    expected = SIGNAL[np.arange(window.start_index, window.start_index + 7_000) % PERIOD]
+    assert np.array_equal(data, expected)
+
+
+def test_short_history_truncates_pre_trigger():
+    """A trigger before ``pre_samples`` have streamed starts the window at 0"""
+    window = next(_session(pre_trigger_samples=1_000).trigger_windows(4_000, 100))
+    assert window.start_index == 0
+    assert window.trigger_offset == 1_000
+    assert np.array_equal(window.data[psdk.CHANNEL.A], SIGNAL[:1_100])
+
+
+def test_aggregate_window_uses_output_samples():
+    """Downsampled windows resolve the trigger in output samples"""
+    session = _session(ratio_mode=psdk.RATIO_MODE.AGGREGATE, ratio=8)
+    window = next(session.trigger_windows(500, 500))
+    assert window.trigger_index == PRE_TRIGGER // 8
+    assert window.data[psdk.CHANNEL.A].shape == (2, 1_000)
+
+
+def test_stream_end_yields_incomplete_window():
+    """An auto-stopped stream ends the pending window early"""
+    session = _session(post_trigger_samples=3_000, auto_stop=True)
+    window = next(session.trigger_windows(1_000, 100_000))
+    assert not window.complete
+    assert window.n_samples == 1_000 + 3_000
+
+
+def test_invalid_lengths_raise():
+    """A window without post-trigger samples is refused"""
+    with pytest.raises(psdk.PicoSDKException):
+        next(_session().trigger_windows(10, 0))
+
+
+def test_rearm_needs_software_trigger():
+    """The hardware trigger fires once per run, so rearm alone is refused"""
+    with pytest.raises(psdk.PicoSDKException):
+        next(_session().trigger_windows(100, 100, rearm=True))
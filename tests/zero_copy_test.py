@@ -0,0 +1,69 @@
+"""
+Copyright (C) 2025-2026 Pico Technology Ltd. See LICENSE file for terms.
+
+pytest file for zero-copy (leased) StreamingSession chunks
+"""
+import threading
+
+import numpy as np
+import pytest
+
+import pypicosdk as psdk
+
+
+def _session(scope_class=psdk.ps6000a, **kwargs):
+    sim = psdk.SimulatedDriver(sample_rate=20e6)
+    scope = scope_class(dll=sim)
+    scope.open_unit()
+    scope.set_channel(psdk.CHANNEL.A, psdk.RANGE.V1)
+    session = psdk.StreamingSession(
+        scope, sample_interval=50, time_units='ns', samples_per_buffer=20_000,
+        post_trigger_samples=100_000, auto_stop=True, zero_copy=True, **kwargs)
+    return session, sim
+
+
+def test_views_are_read_only_and_contiguous():
+    """Released views join into the uninterrupted signal without copies"""
+    session, sim = _session()
+    data = []
+    for chunk in session:
+        with chunk:
+            view = chunk.data[psdk.CHANNEL.A]
+            assert not view.flags.writeable
+            assert not view.flags.owndata
+            data.append(view.copy())
+        assert not chunk.leased and chunk.data == {}
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(np.concatenate(data), np.resize(expected, 100_000))
+    assert session.lease_stalls == 0
+
+
+def test_unreleased_chunk_stalls_rotation():
+    """Holding a lease defers re-registration until it is released"""
+    session, sim = _session()
+    held = next(session)
+    snapshot = held.data[psdk.CHANNEL.A].copy()
+    intact = []
+
+    def release():
+        intact.append(np.array_equal(held.data[psdk.CHANNEL.A], snapshot))
+        held.release()
+
+    timer = threading.Timer(0.2, release)
+    timer.start()
+    data = [snapshot]
+    for chunk in session:
+        with chunk:
+            data.append(chunk.data[psdk.CHANNEL.A].copy())
+    timer.join()
+    assert intact == [True]
+    assert session.deferred_rotations == 1
+    assert session.lease_stalls > 0
+    expected = sim._signal_as(psdk.CHANNEL.A, np.int16)  # pylint: disable=protected-access
+    assert np.array_equal(np.concatenate(data), np.resize(expected, 100_000))
+
+
+def test_ps5000a_rejects_zero_copy():
+    """The ps5000a overview buffer cannot be leased"""
+    with pytest.raises(psdk.PicoSDKException):
+        _session(psdk.ps5000a)